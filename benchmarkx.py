@@ -0,0 +1,3417 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+# In[1]:
+
+
+#*******************************************************************************************
+ #
+ #  File Name:  benchmarkx.py
+ #
+ #  File Description:
+ #      This Python script, benchmarkx.py, contains Python functions for timing
+ #      the weather and vacation functions against local stub servers.
+ #      Here is the list:
+ #
+ #  return_benchmark_city_names_list
+ #  return_benchmark_weather_dataframe
+ #
+ #  return_weather_concurrency_benchmark_dataframe
+ #  return_weather_cache_benchmark_dataframe
+ #  return_weather_batch_benchmark_dataframe
+ #  return_weather_rate_limit_benchmark_dataframe
+ #  return_weather_dataframe_build_benchmark_dataframe
+ #  return_json_decoding_benchmark_dataframe
+ #  return_weather_storage_benchmark_dataframe
+ #  return_weather_snapshot_benchmark_dataframe
+ #
+ #  return_vacation_filter_benchmark_dataframe
+ #  return_vacation_range_index_benchmark_dataframe
+ #  return_vacation_query_benchmark_dataframe
+ #  return_vacation_criteria_benchmark_dataframe
+ #  return_vacation_criteria_matrix_benchmark_dataframe
+ #  return_ranked_vacation_benchmark_dataframe
+ #  return_places_concurrency_benchmark_dataframe
+ #  return_place_categories_benchmark_dataframe
+ #  return_place_lookup_benchmark_dataframe
+ #  return_place_cluster_benchmark_dataframe
+ #  return_local_places_benchmark_dataframe
+ #
+ #  return_nearest_city_benchmark_dataframe
+ #  return_city_sampling_benchmark_dataframe
+ #
+ #  run_benchmark_checks
+ #  assert_stub_weather_dataframe
+ #  check_weather_fetch
+ #  check_place_lookup
+ #  check_nearest_city
+ #  check_weather_group_fetch
+ #  check_vacation_filter
+ #  check_vacation_range_index
+ #  check_vacation_query
+ #  check_ranked_vacations
+ #  check_place_categories
+ #
+ #
+ #  Date            Description                             Programmer
+ #  ----------      ------------------------------------    ------------------
+ #  10/18/2026      Initial Development                     Nicholas J. George
+ #
+ #******************************************************************************************/
+
+import cachex
+import requestsx
+import spatialx
+import storagex
+import stubserverx
+import vacationsx
+import weather_constants
+import weatherx
+
+import os
+import tempfile
+import time
+import tracemalloc
+
+import numpy as np
+import pyarrow as pa
+import pandas as pd
+import requests
+
+from citipy import citipy
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+pd.options.mode.chained_assignment = None
+
+
+# In[2]:
+
+
+CONSTANT_LOCAL_FILE_NAME = 'benchmarkx.py'
+
+
+# In[3]:
+
+
+CONSTANT_FIXTURES_FOLDER_PATH = './resources/fixtures'
+
+
+# In[4]:
+
+
+#*******************************************************************************************
+ #
+ #  Function Name:  return_benchmark_city_names_list
+ #
+ #  Function Description:
+ #      This function returns a list of synthetic city names for benchmarking.
+ #
+ #
+ #  Return Type: list
+ #
+ #
+ #  Function Parameters:
+ #
+ #  Type    Name            Description
+ #  -----   -------------   ----------------------------------------------
+ #  integer city_count_integer
+ #                          The parameter is the number of city names.
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def return_benchmark_city_names_list(city_count_integer):
+
+    return [f'benchmark city {index}' for index in range(city_count_integer)]
+
+
+# In[5]:
+
+
+#*******************************************************************************************
+ #
+ #  Function Name:  return_benchmark_weather_dataframe
+ #
+ #  Function Description:
+ #      This function returns a random city weather dataframe with the columns, 
+ #      types, and value ranges of weatherx.return_weather_dataframe.
+ #
+ #
+ #  Return Type: dataframe
+ #
+ #
+ #  Function Parameters:
+ #
+ #  Type    Name            Description
+ #  -----   -------------   ----------------------------------------------
+ #  integer record_count_integer
+ #                          The parameter is the number of cities.
+ #  integer seed_integer    The parameter is the random number generator seed.
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def return_benchmark_weather_dataframe \
+        (record_count_integer,
+         seed_integer = 42):
+
+    random_generator = np.random.default_rng(seed_integer)
+
+    country_string_array \
+        = np.array([chr(65 + index // 26) + chr(65 + index % 26) for index in range(250)])
+
+
+    city_weather_dataframe \
+        = pd.DataFrame \
+            ({'city': return_benchmark_city_names_list(record_count_integer),
+              'latitude': np.round(random_generator.uniform(-90, 90, record_count_integer), 4),
+              'longitude': np.round(random_generator.uniform(-180, 180, record_count_integer), 4),
+              'temperature': np.round(random_generator.uniform(-10, 110, record_count_integer), 2),
+              'humidity': random_generator.integers(0, 101, record_count_integer, dtype = np.uint8),
+              'cloudiness': random_generator.integers(0, 101, record_count_integer, dtype = np.uint8),
+              'wind_speed': np.round(random_generator.uniform(0, 30, record_count_integer), 2),
+              'country': pd.Categorical(random_generator.choice(country_string_array, record_count_integer)),
+              'date_time': (1769536092 + random_generator.integers(0, 3600, record_count_integer)) \
+                               .astype('datetime64[s]')})
+
+    city_weather_dataframe.index.name \
+        = weather_constants.CONSTANT_WEATHER_DATA_FILE_INDEX_NAME
+
+
+    return city_weather_dataframe
+
+
+# In[6]:
+
+
+#*******************************************************************************************
+ #
+ #  Function Name:  return_weather_concurrency_benchmark_dataframe
+ #
+ #  Function Description:
+ #      This function times weatherx.return_weather_dataframe against the stub
+ #      server at each worker count, with the cache disabled so every run fetches, 
+ #      and returns the results, including the connections opened and reused, as 
+ #      a dataframe.
+ #
+ #
+ #  Return Type: dataframe
+ #
+ #
+ #  Function Parameters:
+ #
+ #  Type    Name            Description
+ #  -----   -------------   ----------------------------------------------
+ #  integer city_count_integer
+ #                          The parameter is the number of cities to fetch.
+ #  integer list
+ #          worker_count_integer_list
+ #                          The parameter is the list of worker counts to time.
+ #  float   latency_seconds_float
+ #                          The parameter is the simulated latency per request.
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def return_weather_concurrency_benchmark_dataframe \
+        (city_count_integer = weather_constants.CONSTANT_CITY_NAME_COUNT,
+         worker_count_integer_list = [1, 8, 32, 64],
+         latency_seconds_float = 0.02):
+
+    city_names_string_list = return_benchmark_city_names_list(city_count_integer)
+
+    benchmark_dictionary_list = []
+
+
+    stub_server = stubserverx.start_stub_server(latency_seconds_float)
+
+    website_string = weather_constants.CONSTANT_OPEN_WEATHERMAP_WEBSITE
+
+    weather_constants.CONSTANT_OPEN_WEATHERMAP_WEBSITE = stub_server.base_url_string
+
+
+    try:
+
+        for worker_count_integer in worker_count_integer_list:
+
+            requestsx.close_http_session()
+
+            requestsx.reset_connection_statistics()
+
+
+            start_time_float = time.perf_counter()
+
+            city_weather_dataframe \
+                = weatherx.return_weather_dataframe \
+                    (city_names_string_list, 
+                     worker_count_integer, 
+                     cache_ttl_seconds_integer = 0,
+                     checkpoint_file_path_string = None,
+                     output_file_path_string = None)
+
+            elapsed_seconds_float = time.perf_counter() - start_time_float
+
+            connection_statistics_dictionary \
+                = requestsx.return_connection_statistics_dictionary()
+
+
+            benchmark_dictionary_list.append \
+                ({'worker_count': worker_count_integer,
+                  'city_count': len(city_weather_dataframe),
+                  'seconds': elapsed_seconds_float,
+                  'cities_per_second': len(city_weather_dataframe) / elapsed_seconds_float,
+                  'connections_opened': connection_statistics_dictionary['connections_opened'],
+                  'connections_reused': connection_statistics_dictionary['connections_reused']})
+
+    finally:
+
+        weather_constants.CONSTANT_OPEN_WEATHERMAP_WEBSITE = website_string
+
+        stubserverx.stop_stub_server(stub_server)
+
+
+    return pd.DataFrame(benchmark_dictionary_list)
+
+
+# In[7]:
+
+
+#*******************************************************************************************
+ #
+ #  Function Name:  return_weather_cache_benchmark_dataframe
+ #
+ #  Function Description:
+ #      This function times a cold run and a warm run of 
+ #      weatherx.return_weather_dataframe against the stub server using a 
+ #      temporary cache file and returns the results as a dataframe.
+ #
+ #
+ #  Return Type: dataframe
+ #
+ #
+ #  Function Parameters:
+ #
+ #  Type    Name            Description
+ #  -----   -------------   ----------------------------------------------
+ #  integer city_count_integer
+ #                          The parameter is the number of cities to fetch.
+ #  integer worker_count_integer
+ #                          The parameter is the number of concurrent requests.
+ #  float   latency_seconds_float
+ #                          The parameter is the simulated latency per request.
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def return_weather_cache_benchmark_dataframe \
+        (city_count_integer = weather_constants.CONSTANT_CITY_NAME_COUNT,
+         worker_count_integer = 32,
+         latency_seconds_float = 0.02):
+
+    city_names_string_list = return_benchmark_city_names_list(city_count_integer)
+
+    benchmark_dictionary_list = []
+
+
+    stub_server = stubserverx.start_stub_server(latency_seconds_float)
+
+    website_string = weather_constants.CONSTANT_OPEN_WEATHERMAP_WEBSITE
+
+    weather_constants.CONSTANT_OPEN_WEATHERMAP_WEBSITE = stub_server.base_url_string
+
+    cache_file_path_string = cachex.CACHE_FILE_PATH
+
+    temporary_directory = tempfile.TemporaryDirectory()
+
+    cachex.set_cache_file_path \
+        (os.path.join(temporary_directory.name, 'benchmark_cache.sqlite'))
+
+
+    try:
+
+        for run_string in ['cold', 'warm']:
+
+            requestsx.reset_connection_statistics()
+
+
+            start_time_float = time.perf_counter()
+
+            city_weather_dataframe \
+                = weatherx.return_weather_dataframe \
+                    (city_names_string_list, 
+                     worker_count_integer, 
+                     checkpoint_file_path_string = None,
+                     output_file_path_string = None)
+
+            elapsed_seconds_float = time.perf_counter() - start_time_float
+
+
+            benchmark_dictionary_list.append \
+                ({'run': run_string,
+                  'city_count': len(city_weather_dataframe),
+                  'seconds': elapsed_seconds_float,
+                  'requests': requestsx.return_connection_statistics_dictionary()['requests']})
+
+    finally:
+
+        cachex.set_cache_file_path(cache_file_path_string)
+
+        temporary_directory.cleanup()
+
+        weather_constants.CONSTANT_OPEN_WEATHERMAP_WEBSITE = website_string
+
+        stubserverx.stop_stub_server(stub_server)
+
+
+    return pd.DataFrame(benchmark_dictionary_list)
+
+
+# In[8]:
+
+
+#*******************************************************************************************
+ #
+ #  Function Name:  return_weather_batch_benchmark_dataframe
+ #
+ #  Function Description:
+ #      This function times weatherx.return_weather_dataframe against the stub 
+ #      server by city name and by grouped city ids and returns the round trips 
+ #      and times as a dataframe.
+ #
+ #
+ #  Return Type: dataframe
+ #
+ #
+ #  Function Parameters:
+ #
+ #  Type    Name            Description
+ #  -----   -------------   ----------------------------------------------
+ #  integer city_count_integer
+ #                          The parameter is the number of cities to fetch.
+ #  integer worker_count_integer
+ #                          The parameter is the number of concurrent requests.
+ #  float   latency_seconds_float
+ #                          The parameter is the simulated latency per request.
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def return_weather_batch_benchmark_dataframe \
+        (city_count_integer = weather_constants.CONSTANT_CITY_NAME_COUNT,
+         worker_count_integer = 8,
+         latency_seconds_float = 0.02):
+
+    city_names_string_list = return_benchmark_city_names_list(city_count_integer)
+
+    city_ids_dictionary \
+        = {city_name: index + 1 for index, city_name in enumerate(city_names_string_list)}
+
+    benchmark_dictionary_list = []
+
+
+    stub_server = stubserverx.start_stub_server(latency_seconds_float)
+
+    website_string = weather_constants.CONSTANT_OPEN_WEATHERMAP_WEBSITE
+
+    weather_constants.CONSTANT_OPEN_WEATHERMAP_WEBSITE = stub_server.base_url_string
+
+
+    try:
+
+        for retrieval_mode_string, current_city_ids_dictionary \
+                in [('name', None), ('id', city_ids_dictionary)]:
+
+            requestsx.reset_connection_statistics()
+
+
+            start_time_float = time.perf_counter()
+
+            city_weather_dataframe \
+                = weatherx.return_weather_dataframe \
+                    (city_names_string_list, 
+                     worker_count_integer, 
+                     0, 
+                     current_city_ids_dictionary,
+                     None,
+                     None)
+
+            elapsed_seconds_float = time.perf_counter() - start_time_float
+
+
+            benchmark_dictionary_list.append \
+                ({'retrieval_mode': retrieval_mode_string,
+                  'city_count': len(city_weather_dataframe),
+                  'round_trips': requestsx.return_connection_statistics_dictionary()['requests'],
+                  'seconds': elapsed_seconds_float})
+
+    finally:
+
+        weather_constants.CONSTANT_OPEN_WEATHERMAP_WEBSITE = website_string
+
+        stubserverx.stop_stub_server(stub_server)
+
+
+    return pd.DataFrame(benchmark_dictionary_list)
+
+
+# In[9]:
+
+
+#*******************************************************************************************
+ #
+ #  Function Name:  return_weather_rate_limit_benchmark_dataframe
+ #
+ #  Function Description:
+ #      This function times weatherx.return_weather_dataframe against a stub 
+ #      server with a request quota, without and with a client rate limit at the 
+ #      quota, and returns the throttled responses, round trips, and throughput 
+ #      as a dataframe.
+ #
+ #
+ #  Return Type: dataframe
+ #
+ #
+ #  Function Parameters:
+ #
+ #  Type    Name            Description
+ #  -----   -------------   ----------------------------------------------
+ #  integer city_count_integer
+ #                          The parameter is the number of cities to fetch.
+ #  integer worker_count_integer
+ #                          The parameter is the number of concurrent requests.
+ #  float   requests_per_second_float
+ #                          The parameter is the stub server quota.
+ #  float   latency_seconds_float
+ #                          The parameter is the simulated latency per request.
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def return_weather_rate_limit_benchmark_dataframe \
+        (city_count_integer = 600,
+         worker_count_integer = 32,
+         requests_per_second_float = 100.0,
+         latency_seconds_float = 0.02):
+
+    city_names_string_list = return_benchmark_city_names_list(city_count_integer)
+
+    benchmark_dictionary_list = []
+
+
+    website_string = weather_constants.CONSTANT_OPEN_WEATHERMAP_WEBSITE
+
+
+    try:
+
+        for rate_limit_string, client_requests_per_second_float \
+                in [('none', None), ('adaptive', requests_per_second_float)]:
+
+            stub_server \
+                = stubserverx.start_stub_server \
+                    (latency_seconds_float, 0, requests_per_second_float)
+
+            weather_constants.CONSTANT_OPEN_WEATHERMAP_WEBSITE = stub_server.base_url_string
+
+            requestsx.set_rate_limit \
+                (stubserverx.CONSTANT_STUB_HOST_NAME, client_requests_per_second_float)
+
+            requestsx.reset_connection_statistics()
+
+
+            start_time_float = time.perf_counter()
+
+            city_weather_dataframe \
+                = weatherx.return_weather_dataframe \
+                    (city_names_string_list, worker_count_integer, 0, None, None, None)
+
+            elapsed_seconds_float = time.perf_counter() - start_time_float
+
+
+            stubserverx.stop_stub_server(stub_server)
+
+
+            benchmark_dictionary_list.append \
+                ({'rate_limit': rate_limit_string,
+                  'city_count': len(city_weather_dataframe),
+                  'throttled_responses': stub_server.throttled_count_integer,
+                  'round_trips': requestsx.return_connection_statistics_dictionary()['requests'],
+                  'seconds': elapsed_seconds_float,
+                  'cities_per_second': len(city_weather_dataframe) / elapsed_seconds_float})
+
+    finally:
+
+        weather_constants.CONSTANT_OPEN_WEATHERMAP_WEBSITE = website_string
+
+        requestsx.set_rate_limit(stubserverx.CONSTANT_STUB_HOST_NAME, None)
+
+
+    return pd.DataFrame(benchmark_dictionary_list)
+
+
+# In[10]:
+
+
+#*******************************************************************************************
+ #
+ #  Function Name:  return_weather_dataframe_build_benchmark_dataframe
+ #
+ #  Function Description:
+ #      This function builds weather dataframes from synthetic field lists with 
+ #      a list of dictionaries, the previous method, and with the weatherx column 
+ #      buffers, and returns the build times, peak traced memory, and dataframe 
+ #      memory for each record count as a dataframe.
+ #
+ #
+ #  Return Type: dataframe
+ #
+ #
+ #  Function Parameters:
+ #
+ #  Type    Name            Description
+ #  -----   -------------   ----------------------------------------------
+ #  integer list
+ #          record_count_integer_list
+ #                          The parameter is the list of record counts to build.
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def return_weather_dataframe_build_benchmark_dataframe \
+        (record_count_integer_list = [3000, 300000]):
+
+    benchmark_dictionary_list = []
+
+
+    for record_count_integer in record_count_integer_list:
+
+        city_names_string_list = return_benchmark_city_names_list(record_count_integer)
+
+        city_weather_field_list_list \
+            = [weatherx.return_weather_field_list \
+                   (stubserverx.return_stub_weather_dictionary(city_name))
+               for city_name in city_names_string_list]
+
+
+        for build_mode_string in ['dictionary list', 'column buffers']:
+
+            tracemalloc.start()
+
+            start_time_float = time.perf_counter()
+
+
+            if build_mode_string == 'dictionary list':
+
+                city_weather_dictionary_list = []
+
+                for city_name, city_weather_field_list \
+                        in zip(city_names_string_list, city_weather_field_list_list):
+
+                    city_weather_dictionary_list.append \
+                        ({'city': city_name, 
+                          'latitude': city_weather_field_list[0], 
+                          'longitude': city_weather_field_list[1], 
+                          'temperature': city_weather_field_list[2],
+                          'humidity': city_weather_field_list[3],
+                          'cloudiness': city_weather_field_list[4],
+                          'wind_speed': city_weather_field_list[5],
+                          'country': city_weather_field_list[6],
+                          'date_time': datetime.fromtimestamp(city_weather_field_list[7])})
+
+                city_weather_dataframe = pd.DataFrame(city_weather_dictionary_list)
+
+                del city_weather_dictionary_list
+
+            else:
+
+                buffer_dictionary \
+                    = weatherx.return_weather_column_buffer_dictionary(record_count_integer)
+
+                for city_name, city_weather_field_list \
+                        in zip(city_names_string_list, city_weather_field_list_list):
+
+                    weatherx.append_weather_column_buffers \
+                        (buffer_dictionary, city_name, city_weather_field_list)
+
+                city_weather_dataframe \
+                    = weatherx.return_weather_column_dataframe(buffer_dictionary)
+
+                del buffer_dictionary
+
+
+            elapsed_seconds_float = time.perf_counter() - start_time_float
+
+            peak_bytes_integer = tracemalloc.get_traced_memory()[1]
+
+            tracemalloc.stop()
+
+
+            benchmark_dictionary_list.append \
+                ({'record_count': record_count_integer,
+                  'build_mode': build_mode_string,
+                  'seconds': elapsed_seconds_float,
+                  'peak_megabytes': peak_bytes_integer / 1048576,
+                  'dataframe_megabytes': 
+                      city_weather_dataframe.memory_usage(deep = True).sum() / 1048576})
+
+
+    return pd.DataFrame(benchmark_dictionary_list)
+
+
+# In[11]:
+
+
+#*******************************************************************************************
+ #
+ #  Function Name:  return_json_decoding_benchmark_dataframe
+ #
+ #  Function Description:
+ #      This function decodes the recorded API response fixtures and extracts 
+ #      their fields with response.json, the previous method, and with 
+ #      requestsx.return_json_dictionary for each installed parser, and returns 
+ #      the microseconds per response as a dataframe.
+ #
+ #
+ #  Return Type: dataframe
+ #
+ #
+ #  Function Parameters:
+ #
+ #  Type    Name            Description
+ #  -----   -------------   ----------------------------------------------
+ #  integer iteration_count_integer
+ #                          The parameter is the number of times to decode each fixture.
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def return_json_decoding_benchmark_dataframe(iteration_count_integer = 2000):
+
+    fixture_tuple_list \
+        = [('openweathermap_weather.json', 
+            weatherx.return_weather_field_list),
+           ('openweathermap_group.json',
+            lambda response_dictionary: 
+                [weatherx.return_weather_field_list(city_weather_dictionary)
+                 for city_weather_dictionary in response_dictionary['list']]),
+           ('geoapify_places.json', 
+            vacationsx.return_place_field_list_list)]
+
+    decoder_string_list \
+        = ['response.json', 'json'] + ([] if requestsx.orjson is None else ['orjson'])
+
+    benchmark_dictionary_list = []
+
+
+    json_decoder_string = requestsx.JSON_DECODER_STRING
+
+
+    try:
+
+        for fixture_file_name_string, extraction_function in fixture_tuple_list:
+
+            with open(os.path.join(CONSTANT_FIXTURES_FOLDER_PATH, fixture_file_name_string), 
+                      'rb') as fixture_file:
+
+                content_bytes = fixture_file.read()
+
+
+            http_response = requests.Response()
+
+            http_response._content = content_bytes
+
+
+            for decoder_string in decoder_string_list:
+
+                if decoder_string != 'response.json':
+
+                    requestsx.set_json_decoder(decoder_string)
+
+
+                start_time_float = time.perf_counter()
+
+                for _ in range(iteration_count_integer):
+
+                    if decoder_string == 'response.json':
+
+                        extraction_function(http_response.json())
+
+                    else:
+
+                        extraction_function(requestsx.return_json_dictionary(content_bytes))
+
+                elapsed_seconds_float = time.perf_counter() - start_time_float
+
+
+                benchmark_dictionary_list.append \
+                    ({'fixture': fixture_file_name_string,
+                      'bytes': len(content_bytes),
+                      'decoder': decoder_string,
+                      'microseconds_per_response': 
+                          1000000 * elapsed_seconds_float / iteration_count_integer})
+
+    finally:
+
+        requestsx.set_json_decoder(json_decoder_string)
+
+
+    return pd.DataFrame(benchmark_dictionary_list)
+
+
+# In[12]:
+
+
+#*******************************************************************************************
+ #
+ #  Function Name:  return_weather_storage_benchmark_dataframe
+ #
+ #  Function Description:
+ #      This function writes random city weather tables as CSV, Parquet, and Arrow 
+ #      IPC files and returns the file sizes and the times to load every column 
+ #      and to load a projection with the vacation ranges applied as a dataframe; 
+ #      the pd.read_csv rows are the previous method.
+ #
+ #
+ #  Return Type: dataframe
+ #
+ #
+ #  Function Parameters:
+ #
+ #  Type    Name            Description
+ #  -----   -------------   ----------------------------------------------
+ #  integer list
+ #          record_count_integer_list
+ #                          The parameter is the list of record counts to store.
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def return_weather_storage_benchmark_dataframe \
+        (record_count_integer_list = [3000, 1000000]):
+
+    column_string_list = ['city', 'latitude', 'longitude', 'temperature', 'humidity', 'country']
+
+    range_dictionary \
+        = {'temperature': [70, 95], 
+           'humidity': [35, 65], 
+           'cloudiness': [0, 10], 
+           'wind_speed': [0, 10]}
+
+    benchmark_dictionary_list = []
+
+
+    with tempfile.TemporaryDirectory() as temporary_folder_path_string:
+
+        for record_count_integer in record_count_integer_list:
+
+            city_weather_dataframe = return_benchmark_weather_dataframe(record_count_integer)
+
+
+            for reader_string, file_extension_string \
+                    in [('pd.read_csv', '.csv'), 
+                        ('storagex', '.csv'), 
+                        ('storagex', '.parquet'), 
+                        ('storagex', '.arrow')]:
+
+                file_path_string \
+                    = os.path.join(temporary_folder_path_string, 'cities_weather' + file_extension_string)
+
+                storagex.write_weather_file(city_weather_dataframe, file_path_string)
+
+
+                start_time_float = time.perf_counter()
+
+                if reader_string == 'pd.read_csv':
+
+                    full_dataframe \
+                        = pd.read_csv \
+                            (file_path_string,
+                             index_col = weather_constants.CONSTANT_WEATHER_DATA_FILE_INDEX_NAME)
+
+                else:
+
+                    full_dataframe = storagex.return_weather_dataframe_from_file(file_path_string)
+
+                full_seconds_float = time.perf_counter() - start_time_float
+
+
+                start_time_float = time.perf_counter()
+
+                if reader_string == 'pd.read_csv':
+
+                    filtered_dataframe \
+                        = pd.read_csv \
+                            (file_path_string,
+                             index_col = weather_constants.CONSTANT_WEATHER_DATA_FILE_INDEX_NAME)
+
+                    for column_name_string, range_list in range_dictionary.items():
+
+                        filtered_dataframe \
+                            = filtered_dataframe \
+                                .loc[(filtered_dataframe[column_name_string] >= range_list[0])
+                                     & (filtered_dataframe[column_name_string] <= range_list[1]), 
+                                     :]
+
+                    filtered_dataframe = filtered_dataframe[column_string_list]
+
+                else:
+
+                    filtered_dataframe \
+                        = storagex.return_weather_dataframe_from_file \
+                            (file_path_string, column_string_list, range_dictionary)
+
+                filtered_seconds_float = time.perf_counter() - start_time_float
+
+
+                benchmark_dictionary_list.append \
+                    ({'record_count': record_count_integer,
+                      'reader': reader_string,
+                      'file_format': file_extension_string[1:],
+                      'file_megabytes': os.path.getsize(file_path_string) / 1048576,
+                      'full_load_seconds': full_seconds_float,
+                      'filtered_load_seconds': filtered_seconds_float,
+                      'filtered_rows': len(filtered_dataframe),
+                      'full_load_megabytes': 
+                          full_dataframe.memory_usage(deep = True).sum() / 1048576})
+
+
+    return pd.DataFrame(benchmark_dictionary_list)
+
+
+# In[13]:
+
+
+#*******************************************************************************************
+ #
+ #  Function Name:  return_weather_snapshot_benchmark_dataframe
+ #
+ #  Function Description:
+ #      This function publishes random city weather tables as memory-mapped Arrow 
+ #      snapshots and returns the times to open each snapshot as a table and as a 
+ #      dataframe, the Arrow memory allocated while loading, and the Parquet load 
+ #      time for comparison as a dataframe.
+ #
+ #
+ #  Return Type: dataframe
+ #
+ #
+ #  Function Parameters:
+ #
+ #  Type    Name            Description
+ #  -----   -------------   ----------------------------------------------
+ #  integer list
+ #          record_count_integer_list
+ #                          The parameter is the list of record counts to publish.
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def return_weather_snapshot_benchmark_dataframe \
+        (record_count_integer_list = [3000, 100000, 1000000, 3000000]):
+
+    benchmark_dictionary_list = []
+
+
+    with tempfile.TemporaryDirectory() as temporary_folder_path_string:
+
+        snapshot_file_path_string \
+            = os.path.join(temporary_folder_path_string, 'cities_weather.arrow')
+
+        parquet_file_path_string \
+            = os.path.join(temporary_folder_path_string, 'cities_weather.parquet')
+
+
+        for record_count_integer in record_count_integer_list:
+
+            city_weather_dataframe = return_benchmark_weather_dataframe(record_count_integer)
+
+            storagex.publish_weather_snapshot(city_weather_dataframe, snapshot_file_path_string)
+
+            storagex.write_weather_file(city_weather_dataframe, parquet_file_path_string)
+
+            del city_weather_dataframe
+
+
+            allocated_bytes_integer = pa.total_allocated_bytes()
+
+            start_time_float = time.perf_counter()
+
+            weather_table \
+                = storagex.return_weather_snapshot_table(snapshot_file_path_string)
+
+            table_seconds_float = time.perf_counter() - start_time_float
+
+            table_allocated_bytes_integer = pa.total_allocated_bytes() - allocated_bytes_integer
+
+            del weather_table
+
+
+            start_time_float = time.perf_counter()
+
+            snapshot_dataframe \
+                = storagex.return_weather_dataframe_from_snapshot(snapshot_file_path_string)
+
+            dataframe_seconds_float = time.perf_counter() - start_time_float
+
+            del snapshot_dataframe
+
+
+            start_time_float = time.perf_counter()
+
+            parquet_dataframe \
+                = storagex.return_weather_dataframe_from_file(parquet_file_path_string)
+
+            parquet_seconds_float = time.perf_counter() - start_time_float
+
+            del parquet_dataframe
+
+
+            benchmark_dictionary_list.append \
+                ({'record_count': record_count_integer,
+                  'snapshot_megabytes': os.path.getsize(snapshot_file_path_string) / 1048576,
+                  'table_open_seconds': table_seconds_float,
+                  'table_allocated_megabytes': table_allocated_bytes_integer / 1048576,
+                  'dataframe_open_seconds': dataframe_seconds_float,
+                  'parquet_load_seconds': parquet_seconds_float})
+
+
+    return pd.DataFrame(benchmark_dictionary_list)
+
+
+# In[14]:
+
+
+#*******************************************************************************************
+ #
+ #  Function Name:  return_vacation_filter_benchmark_dataframe
+ #
+ #  Function Description:
+ #      This function filters a random city weather dataframe by the vacation 
+ #      weather ranges with four chained .loc passes, the previous method, with 
+ #      one DataFrame.query expression, and with vacationsx.return_vacations_dataframe, 
+ #      and returns the best time of each method as a dataframe.
+ #
+ #
+ #  Return Type: dataframe
+ #
+ #
+ #  Function Parameters:
+ #
+ #  Type    Name            Description
+ #  -----   -------------   ----------------------------------------------
+ #  integer record_count_integer
+ #                          The parameter is the number of cities.
+ #  integer repeat_count_integer
+ #                          The parameter is the number of times to time each method.
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def return_vacation_filter_benchmark_dataframe \
+        (record_count_integer = 1000000,
+         repeat_count_integer = 5):
+
+    city_weather_dataframe = return_benchmark_weather_dataframe(record_count_integer)
+
+    conditions_dictionary = weather_constants.weather_conditions_dictionary
+
+    query_string \
+        = ' & '.join \
+            (f'{range_list[0]} <= {condition_key_string.removesuffix("_range")} <= {range_list[1]}'
+             for condition_key_string, range_list in conditions_dictionary.items())
+
+    benchmark_dictionary_list = []
+
+
+    for filter_method_string in ['chained .loc', 'DataFrame.query', 'fused mask']:
+
+        elapsed_seconds_float_list = []
+
+        for _ in range(repeat_count_integer):
+
+            start_time_float = time.perf_counter()
+
+            if filter_method_string == 'chained .loc':
+
+                vacations_dataframe = city_weather_dataframe
+
+                for condition_key_string, range_list in conditions_dictionary.items():
+
+                    column_name_string = condition_key_string.removesuffix('_range')
+
+                    vacations_dataframe \
+                        = vacations_dataframe \
+                            .loc[(vacations_dataframe[column_name_string] >= range_list[0])
+                                 & (vacations_dataframe[column_name_string] <= range_list[1]), 
+                                 :]
+
+            elif filter_method_string == 'DataFrame.query':
+
+                vacations_dataframe = city_weather_dataframe.query(query_string)
+
+            else:
+
+                vacations_dataframe \
+                    = vacationsx.return_vacations_dataframe(city_weather_dataframe)
+
+            elapsed_seconds_float_list.append(time.perf_counter() - start_time_float)
+
+
+        benchmark_dictionary_list.append \
+            ({'record_count': record_count_integer,
+              'filter_method': filter_method_string,
+              'matching_rows': len(vacations_dataframe),
+              'seconds': min(elapsed_seconds_float_list)})
+
+
+    return pd.DataFrame(benchmark_dictionary_list)
+
+
+# In[15]:
+
+
+#*******************************************************************************************
+ #
+ #  Function Name:  return_vacation_range_index_benchmark_dataframe
+ #
+ #  Function Description:
+ #      This function builds a vacation range index over random city weather 
+ #      dataframes, answers random slider-style range queries with the index and 
+ #      with the fused mask, and returns the build time, the median query times, 
+ #      and whether the answers agree as a dataframe.
+ #
+ #
+ #  Return Type: dataframe
+ #
+ #
+ #  Function Parameters:
+ #
+ #  Type    Name            Description
+ #  -----   -------------   ----------------------------------------------
+ #  integer list
+ #          record_count_integer_list
+ #                          The parameter is the list of record counts to index.
+ #  integer query_count_integer
+ #                          The parameter is the number of random queries.
+ #  integer seed_integer    The parameter is the random number generator seed.
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def return_vacation_range_index_benchmark_dataframe \
+        (record_count_integer_list = [1000000, 3000000],
+         query_count_integer = 200,
+         seed_integer = 42):
+
+    random_generator = np.random.default_rng(seed_integer)
+
+    conditions_dictionary_list = []
+
+    for _ in range(query_count_integer):
+
+        minimum_float_array = random_generator.uniform([40, 0, 0, 0], [90, 80, 50, 10])
+
+        width_float_array = random_generator.uniform([5, 10, 0, 2], [30, 40, 50, 15])
+
+        conditions_dictionary_list.append \
+            ({condition_key_string: [minimum_float, minimum_float + width_float]
+              for condition_key_string, minimum_float, width_float
+              in zip(['temperature_range', 'humidity_range', 
+                      'cloudiness_range', 'wind_speed_range'],
+                     minimum_float_array, width_float_array)})
+
+    benchmark_dictionary_list = []
+
+
+    for record_count_integer in record_count_integer_list:
+
+        city_weather_dataframe = return_benchmark_weather_dataframe(record_count_integer)
+
+
+        start_time_float = time.perf_counter()
+
+        range_index_dictionary \
+            = vacationsx.return_vacation_range_index_dictionary(city_weather_dataframe)
+
+        build_seconds_float = time.perf_counter() - start_time_float
+
+
+        index_seconds_float_list = []
+
+        mask_seconds_float_list = []
+
+        matching_row_count_integer_list = []
+
+        agree_boolean = True
+
+        for conditions_dictionary in conditions_dictionary_list:
+
+            start_time_float = time.perf_counter()
+
+            position_integer_array \
+                = vacationsx.return_vacation_index_positions_array \
+                    (range_index_dictionary, conditions_dictionary)
+
+            index_seconds_float_list.append(time.perf_counter() - start_time_float)
+
+
+            start_time_float = time.perf_counter()
+
+            mask_boolean_array \
+                = vacationsx.return_vacation_mask_array \
+                    (city_weather_dataframe, conditions_dictionary)
+
+            mask_seconds_float_list.append(time.perf_counter() - start_time_float)
+
+
+            matching_row_count_integer_list.append(len(position_integer_array))
+
+            agree_boolean \
+                = agree_boolean \
+                  and np.array_equal(position_integer_array, np.flatnonzero(mask_boolean_array))
+
+
+        benchmark_dictionary_list.append \
+            ({'record_count': record_count_integer,
+              'build_seconds': build_seconds_float,
+              'median_index_microseconds': 1000000 * np.median(index_seconds_float_list),
+              'median_mask_microseconds': 1000000 * np.median(mask_seconds_float_list),
+              'median_matching_rows': np.median(matching_row_count_integer_list),
+              'results_agree': agree_boolean})
+
+
+    return pd.DataFrame(benchmark_dictionary_list)
+
+
+# In[16]:
+
+
+#*******************************************************************************************
+ #
+ #  Function Name:  return_vacation_query_benchmark_dataframe
+ #
+ #  Function Description:
+ #      This function moves the vacation cloudiness range one step at a time over a 
+ #      random city weather dataframe, first narrowing it and then widening it, and 
+ #      times the vacation query refresh against recomputing the fused mask.  It 
+ #      returns the median times for each direction and whether the answers agree 
+ #      as a dataframe.
+ #
+ #
+ #  Return Type: dataframe
+ #
+ #
+ #  Function Parameters:
+ #
+ #  Type    Name            Description
+ #  -----   -------------   ----------------------------------------------
+ #  integer record_count_integer
+ #                          The parameter is the number of records.
+ #  integer step_count_integer
+ #                          The parameter is the number of range changes in each 
+ #                          direction.
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def return_vacation_query_benchmark_dataframe \
+        (record_count_integer = 1000000,
+         step_count_integer = 20):
+
+    city_weather_dataframe = return_benchmark_weather_dataframe(record_count_integer)
+
+    original_conditions_dictionary \
+        = {condition_key_string: list(range_list)
+           for condition_key_string, range_list
+           in weather_constants.weather_conditions_dictionary.items()}
+
+    vacationsx.set_vacation_temperature_range(60, 90)
+
+    vacationsx.set_vacation_humidity_range(20, 80)
+
+    vacationsx.set_vacation_cloudiness_range(0, 100)
+
+    vacationsx.set_vacation_wind_speed_range(0, 15)
+
+
+    query_dictionary = vacationsx.return_vacation_query_dictionary(city_weather_dataframe)
+
+    cloudiness_integer_list = list(np.linspace(100, 5, step_count_integer).astype(int))
+
+    benchmark_dictionary_list = []
+
+    for direction_string, maximum_cloudiness_integer_list \
+            in [('narrow', cloudiness_integer_list), 
+                ('widen', cloudiness_integer_list[::-1])]:
+
+        query_seconds_float_list = []
+
+        mask_seconds_float_list = []
+
+        agree_boolean = True
+
+        for maximum_cloudiness_integer in maximum_cloudiness_integer_list:
+
+            vacationsx.set_vacation_cloudiness_range(0, maximum_cloudiness_integer)
+
+
+            start_time_float = time.perf_counter()
+
+            query_mask_boolean_array \
+                = vacationsx.return_vacation_query_mask_array(query_dictionary)
+
+            query_seconds_float_list.append(time.perf_counter() - start_time_float)
+
+
+            start_time_float = time.perf_counter()
+
+            mask_boolean_array = vacationsx.return_vacation_mask_array(city_weather_dataframe)
+
+            mask_seconds_float_list.append(time.perf_counter() - start_time_float)
+
+
+            agree_boolean \
+                = agree_boolean \
+                  and np.array_equal(query_mask_boolean_array, mask_boolean_array)
+
+
+        benchmark_dictionary_list.append \
+            ({'record_count': record_count_integer,
+              'direction': direction_string,
+              'median_query_microseconds': 1000000 * np.median(query_seconds_float_list),
+              'median_mask_microseconds': 1000000 * np.median(mask_seconds_float_list),
+              'results_agree': agree_boolean})
+
+
+    for condition_key_string, range_list in original_conditions_dictionary.items():
+
+        weather_constants.weather_conditions_dictionary[condition_key_string][:] = range_list
+
+
+    return pd.DataFrame(benchmark_dictionary_list)
+
+
+# In[17]:
+
+
+#*******************************************************************************************
+ #
+ #  Function Name:  return_vacation_criteria_benchmark_dataframe
+ #
+ #  Function Description:
+ #      This function builds random vacation criteria with the vacation range 
+ #      setters, evaluates all of them against one shared city weather dataframe 
+ #      with each thread pool size, and returns the throughput and whether every 
+ #      pool size found the same matching row counts as a dataframe.
+ #
+ #
+ #  Return Type: dataframe
+ #
+ #
+ #  Function Parameters:
+ #
+ #  Type    Name            Description
+ #  -----   -------------   ----------------------------------------------
+ #  integer record_count_integer
+ #                          The parameter is the number of records.
+ #  integer criteria_count_integer
+ #                          The parameter is the number of criteria to evaluate.
+ #  integer list
+ #          worker_count_integer_list
+ #                          The parameter is the list of thread pool sizes.
+ #  integer seed_integer    The parameter is the random number generator seed.
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def return_vacation_criteria_benchmark_dataframe \
+        (record_count_integer = 100000,
+         criteria_count_integer = 10000,
+         worker_count_integer_list = [1, 4, 8],
+         seed_integer = 42):
+
+    city_weather_dataframe = return_benchmark_weather_dataframe(record_count_integer)
+
+    random_generator = np.random.default_rng(seed_integer)
+
+    base_criteria_dictionary = vacationsx.return_vacation_criteria_dictionary()
+
+    criteria_dictionary_list = []
+
+    for _ in range(criteria_count_integer):
+
+        minimum_integer_array = random_generator.integers([40, 0, 0, 0], [90, 80, 50, 10])
+
+        width_integer_array = random_generator.integers([5, 10, 0, 2], [30, 40, 50, 15])
+
+        upper_integer_array = minimum_integer_array + width_integer_array
+
+        criteria_dictionary \
+            = vacationsx.set_vacation_temperature_range \
+                (minimum_integer_array[0], upper_integer_array[0], base_criteria_dictionary)
+
+        criteria_dictionary \
+            = vacationsx.set_vacation_humidity_range \
+                (minimum_integer_array[1], upper_integer_array[1], criteria_dictionary)
+
+        criteria_dictionary \
+            = vacationsx.set_vacation_cloudiness_range \
+                (minimum_integer_array[2], upper_integer_array[2], criteria_dictionary)
+
+        criteria_dictionary_list.append \
+            (vacationsx.set_vacation_wind_speed_range \
+                 (minimum_integer_array[3], upper_integer_array[3], criteria_dictionary))
+
+
+    def return_matching_row_count_integer(criteria_dictionary):
+
+        return \
+            int(np.count_nonzero \
+                    (vacationsx.return_vacation_mask_array \
+                         (city_weather_dataframe, criteria_dictionary)))
+
+
+    baseline_row_count_integer_list = None
+
+    benchmark_dictionary_list = []
+
+    for worker_count_integer in worker_count_integer_list:
+
+        start_time_float = time.perf_counter()
+
+        with ThreadPoolExecutor(max_workers = worker_count_integer) as executor:
+
+            row_count_integer_list \
+                = list(executor.map(return_matching_row_count_integer, criteria_dictionary_list))
+
+        elapsed_seconds_float = time.perf_counter() - start_time_float
+
+
+        if baseline_row_count_integer_list is None:
+
+            baseline_row_count_integer_list = row_count_integer_list
+
+        benchmark_dictionary_list.append \
+            ({'record_count': record_count_integer,
+              'criteria_count': criteria_count_integer,
+              'worker_count': worker_count_integer,
+              'seconds': elapsed_seconds_float,
+              'evaluations_per_second': criteria_count_integer / elapsed_seconds_float,
+              'results_agree': row_count_integer_list == baseline_row_count_integer_list})
+
+
+    return pd.DataFrame(benchmark_dictionary_list)
+
+
+# In[18]:
+
+
+#*******************************************************************************************
+ #
+ #  Function Name:  return_vacation_criteria_matrix_benchmark_dataframe
+ #
+ #  Function Description:
+ #      This function evaluates random vacation criteria against one random city 
+ #      weather dataframe, once criteria by criteria with the fused mask and then 
+ #      with the blocked criteria matrix for each thread pool size, and returns the 
+ #      times and whether the matching row counts agree as a dataframe.
+ #
+ #
+ #  Return Type: dataframe
+ #
+ #
+ #  Function Parameters:
+ #
+ #  Type    Name            Description
+ #  -----   -------------   ----------------------------------------------
+ #  integer record_count_integer
+ #                          The parameter is the number of records.
+ #  integer criteria_count_integer
+ #                          The parameter is the number of criteria.
+ #  integer list
+ #          worker_count_integer_list
+ #                          The parameter is the list of thread pool sizes.
+ #  integer seed_integer    The parameter is the random number generator seed.
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def return_vacation_criteria_matrix_benchmark_dataframe \
+        (record_count_integer = 100000,
+         criteria_count_integer = 10000,
+         worker_count_integer_list = [1, 4, 8],
+         seed_integer = 42):
+
+    city_weather_dataframe = return_benchmark_weather_dataframe(record_count_integer)
+
+    random_generator = np.random.default_rng(seed_integer)
+
+    base_criteria_dictionary = vacationsx.return_vacation_criteria_dictionary()
+
+    criteria_dictionary_list = []
+
+    for _ in range(criteria_count_integer):
+
+        minimum_integer_array = random_generator.integers([40, 0, 0, 0], [90, 80, 50, 10])
+
+        upper_integer_array \
+            = minimum_integer_array + random_generator.integers([5, 10, 0, 2], [30, 40, 50, 15])
+
+        criteria_dictionary_list.append \
+            (vacationsx.return_vacation_criteria_dictionary \
+                 (base_criteria_dictionary,
+                  {'temperature_range': (minimum_integer_array[0], upper_integer_array[0]),
+                   'humidity_range': (minimum_integer_array[1], upper_integer_array[1]),
+                   'cloudiness_range': (minimum_integer_array[2], upper_integer_array[2]),
+                   'wind_speed_range': (minimum_integer_array[3], upper_integer_array[3])}))
+
+
+    start_time_float = time.perf_counter()
+
+    baseline_count_integer_array \
+        = np.array \
+            ([np.count_nonzero \
+                  (vacationsx.return_vacation_mask_array \
+                       (city_weather_dataframe, criteria_dictionary))
+              for criteria_dictionary in criteria_dictionary_list])
+
+    benchmark_dictionary_list \
+        = [{'record_count': record_count_integer,
+            'criteria_count': criteria_count_integer,
+            'method': 'mask per criteria',
+            'worker_count': 1,
+            'seconds': time.perf_counter() - start_time_float,
+            'results_agree': True}]
+
+
+    for worker_count_integer in worker_count_integer_list:
+
+        start_time_float = time.perf_counter()
+
+        count_integer_array \
+            = vacationsx.return_vacation_criteria_matrix_array \
+                (city_weather_dataframe, 
+                 criteria_dictionary_list, 
+                 'count', 
+                 worker_count_integer)
+
+        benchmark_dictionary_list.append \
+            ({'record_count': record_count_integer,
+              'criteria_count': criteria_count_integer,
+              'method': 'criteria matrix',
+              'worker_count': worker_count_integer,
+              'seconds': time.perf_counter() - start_time_float,
+              'results_agree': np.array_equal(count_integer_array, baseline_count_integer_array)})
+
+
+    return pd.DataFrame(benchmark_dictionary_list)
+
+
+# In[19]:
+
+
+#*******************************************************************************************
+ #
+ #  Function Name:  return_ranked_vacation_benchmark_dataframe
+ #
+ #  Function Description:
+ #      This function ranks random city weather dataframes against the notebook's 
+ #      vacation ranges, times the partitioned shortlist against a shortlist from 
+ #      sorting every penalty, and returns the times, the number of cities inside every range, 
+ #      and whether both shortlists have the same penalties as a dataframe.
+ #
+ #
+ #  Return Type: dataframe
+ #
+ #
+ #  Function Parameters:
+ #
+ #  Type    Name            Description
+ #  -----   -------------   ----------------------------------------------
+ #  integer list
+ #          record_count_integer_list
+ #                          The parameter is the list of record counts to rank.
+ #  integer city_count_integer
+ #                          The parameter is the number of cities in the shortlist.
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def return_ranked_vacation_benchmark_dataframe \
+        (record_count_integer_list = [3000, 1000000],
+         city_count_integer = 50):
+
+    conditions_dictionary \
+        = {'temperature_range': [70, 95],
+           'humidity_range': [35, 65],
+           'cloudiness_range': [0, 10],
+           'wind_speed_range': [0, 10]}
+
+    benchmark_dictionary_list = []
+
+
+    for record_count_integer in record_count_integer_list:
+
+        city_weather_dataframe = return_benchmark_weather_dataframe(record_count_integer)
+
+
+        start_time_float = time.perf_counter()
+
+        ranked_vacations_dataframe \
+            = vacationsx.return_ranked_vacations_dataframe \
+                (city_weather_dataframe, city_count_integer, conditions_dictionary)
+
+        ranked_seconds_float = time.perf_counter() - start_time_float
+
+
+        start_time_float = time.perf_counter()
+
+        penalty_float_array \
+            = vacationsx.return_vacation_penalty_array \
+                (city_weather_dataframe, conditions_dictionary)
+
+        position_integer_array \
+            = np.argsort(penalty_float_array, kind = 'stable')[:city_count_integer]
+
+        sorted_vacations_dataframe \
+            = city_weather_dataframe.iloc[position_integer_array] \
+                  .assign(penalty = penalty_float_array[position_integer_array])
+
+        sort_seconds_float = time.perf_counter() - start_time_float
+
+
+        benchmark_dictionary_list.append \
+            ({'record_count': record_count_integer,
+              'in_range_cities': np.count_nonzero(penalty_float_array == 0.0),
+              'shortlist_cities': len(ranked_vacations_dataframe),
+              'ranked_seconds': ranked_seconds_float,
+              'full_sort_seconds': sort_seconds_float,
+              'results_agree': np.array_equal \
+                                   (ranked_vacations_dataframe['penalty'].to_numpy(), 
+                                    sorted_vacations_dataframe['penalty'].to_numpy())})
+
+
+    return pd.DataFrame(benchmark_dictionary_list)
+
+
+# In[20]:
+
+
+#*******************************************************************************************
+ #
+ #  Function Name:  return_places_concurrency_benchmark_dataframe
+ #
+ #  Function Description:
+ #      This function times vacationsx.update_dataframe_location against the stub 
+ #      places server for each worker count, with the places cache disabled, and 
+ #      returns the times and whether every worker count located the same places 
+ #      as a dataframe.
+ #
+ #
+ #  Return Type: dataframe
+ #
+ #
+ #  Function Parameters:
+ #
+ #  Type    Name            Description
+ #  -----   -------------   ----------------------------------------------
+ #  integer city_count_integer
+ #                          The parameter is the number of cities to search around.
+ #  integer list
+ #          worker_count_integer_list
+ #                          The parameter is the list of worker counts to time.
+ #  float   requests_per_second_float
+ #                          The parameter is the client rate limit.
+ #  float   latency_seconds_float
+ #                          The parameter is the simulated network latency per request.
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def return_places_concurrency_benchmark_dataframe \
+        (city_count_integer = 200,
+         worker_count_integer_list = [1, 8, 32],
+         requests_per_second_float = 200.0,
+         latency_seconds_float = 0.05):
+
+    vacations_dataframe \
+        = return_benchmark_weather_dataframe(city_count_integer).reset_index(drop = True)
+
+    benchmark_dictionary_list = []
+
+    baseline_location_name_string_list = None
+
+
+    stub_server = stubserverx.start_stub_server(latency_seconds_float)
+
+    website_string = weather_constants.CONSTANT_GEOAPIFY_WEBSITE
+
+    weather_constants.CONSTANT_GEOAPIFY_WEBSITE = stub_server.base_url_string
+
+    requestsx.set_rate_limit(stubserverx.CONSTANT_STUB_HOST_NAME, requests_per_second_float)
+
+
+    try:
+
+        for worker_count_integer in worker_count_integer_list:
+
+            start_time_float = time.perf_counter()
+
+            hotels_dataframe \
+                = vacationsx.update_dataframe_location \
+                    (vacations_dataframe.copy(), 
+                     'hotel_name', 
+                     cache_ttl_seconds_integer = 0,
+                     worker_count_integer = worker_count_integer)
+
+            elapsed_seconds_float = time.perf_counter() - start_time_float
+
+
+            location_name_string_list = hotels_dataframe['hotel_name'].tolist()
+
+            if baseline_location_name_string_list is None:
+
+                baseline_location_name_string_list = location_name_string_list
+
+            benchmark_dictionary_list.append \
+                ({'worker_count': worker_count_integer,
+                  'city_count': city_count_integer,
+                  'located_count': len(hotels_dataframe),
+                  'seconds': elapsed_seconds_float,
+                  'searches_per_second': city_count_integer / elapsed_seconds_float,
+                  'results_agree': location_name_string_list \
+                                   == baseline_location_name_string_list})
+
+    finally:
+
+        weather_constants.CONSTANT_GEOAPIFY_WEBSITE = website_string
+
+        requestsx.set_rate_limit(stubserverx.CONSTANT_STUB_HOST_NAME, None)
+
+        stubserverx.stop_stub_server(stub_server)
+
+
+    return pd.DataFrame(benchmark_dictionary_list)
+
+
+# In[21]:
+
+
+#*******************************************************************************************
+ #
+ #  Function Name:  return_place_categories_benchmark_dataframe
+ #
+ #  Function Description:
+ #      This function finds hotels, restaurants, and tourism attractions around 
+ #      random cities with the stub places server, first the way the notebook did 
+ #      with one vacationsx.update_dataframe_location call per category and then 
+ #      with one vacationsx.update_dataframe_locations call, which asks for every 
+ #      category in one request per city and searches again only for crowded-out 
+ #      categories.  It checks that the combined method sends fewer requests and 
+ #      returns the HTTP requests, rows scanned, times, and whether both found the 
+ #      same places as a dataframe.
+ #
+ #
+ #  Return Type: dataframe
+ #
+ #
+ #  Function Parameters:
+ #
+ #  Type    Name            Description
+ #  -----   -------------   ----------------------------------------------
+ #  integer city_count_integer
+ #                          The parameter is the number of cities to search around.
+ #  integer worker_count_integer
+ #                          The parameter is the number of concurrent searches.
+ #  float   latency_seconds_float
+ #                          The parameter is the simulated network latency per request.
+ #  integer result_limit_integer   
+ #                          The parameter is a limit on the number of results per 
+ #                          category (small limits make categories crowd each 
+ #                          other out of the combined responses).
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def return_place_categories_benchmark_dataframe \
+        (city_count_integer = 300,
+         worker_count_integer = 8,
+         latency_seconds_float = 0.02,
+         result_limit_integer = 20):
+
+    vacations_dataframe \
+        = return_benchmark_weather_dataframe(city_count_integer).reset_index(drop = True)
+
+    benchmark_dictionary_list = []
+
+
+    stub_server = stubserverx.start_stub_server(latency_seconds_float)
+
+    website_string = weather_constants.CONSTANT_GEOAPIFY_WEBSITE
+
+    weather_constants.CONSTANT_GEOAPIFY_WEBSITE = stub_server.base_url_string
+
+
+    try:
+
+        requestsx.reset_connection_statistics()
+
+        start_time_float = time.perf_counter()
+
+        locations_dataframe = vacations_dataframe
+
+        row_count_integer = 0
+
+        for column_name_string, category_string \
+                in vacationsx.CONSTANT_PLACE_COLUMN_CATEGORY_DICTIONARY.items():
+
+            row_count_integer += len(locations_dataframe)
+
+            locations_dataframe = locations_dataframe.copy()
+
+            locations_dataframe[column_name_string] = pd.Series(dtype = 'str')
+
+            locations_dataframe \
+                = vacationsx.update_dataframe_location \
+                    (locations_dataframe, 
+                     column_name_string, 
+                     category_string, 
+                     result_limit_integer = result_limit_integer,
+                     cache_ttl_seconds_integer = 0,
+                     worker_count_integer = worker_count_integer)
+
+        per_category_dataframe = locations_dataframe
+
+        benchmark_dictionary_list.append \
+            ({'method': 'one call per category',
+              'http_requests': requestsx.return_connection_statistics_dictionary()['requests'],
+              'rows_scanned': row_count_integer,
+              'located_count': len(per_category_dataframe),
+              'seconds': time.perf_counter() - start_time_float})
+
+
+        requestsx.reset_connection_statistics()
+
+        start_time_float = time.perf_counter()
+
+        locations_dataframe \
+            = vacationsx.update_dataframe_locations \
+                (vacations_dataframe, 
+                 result_limit_integer = result_limit_integer,
+                 cache_ttl_seconds_integer = 0, 
+                 worker_count_integer = worker_count_integer) \
+                  .dropna()
+
+        benchmark_dictionary_list.append \
+            ({'method': 'one call for all categories',
+              'http_requests': requestsx.return_connection_statistics_dictionary()['requests'],
+              'rows_scanned': len(vacations_dataframe),
+              'located_count': len(locations_dataframe),
+              'seconds': time.perf_counter() - start_time_float})
+
+    finally:
+
+        weather_constants.CONSTANT_GEOAPIFY_WEBSITE = website_string
+
+        stubserverx.stop_stub_server(stub_server)
+
+
+    benchmark_dataframe = pd.DataFrame(benchmark_dictionary_list)
+
+    assert benchmark_dataframe['http_requests'].iloc[1] \
+               < benchmark_dataframe['http_requests'].iloc[0], \
+        'The combined place search sent no fewer requests than one search per category.'
+
+    column_name_string_list \
+        = ['city'] + list(vacationsx.CONSTANT_PLACE_COLUMN_CATEGORY_DICTIONARY)
+
+    benchmark_dataframe['results_agree'] \
+        = per_category_dataframe[column_name_string_list].values.tolist() \
+          == locations_dataframe[column_name_string_list].values.tolist()
+
+
+    return benchmark_dataframe
+
+
+# In[22]:
+
+
+#*******************************************************************************************
+ #
+ #  Function Name:  return_place_lookup_benchmark_dataframe
+ #
+ #  Function Description:
+ #      This function runs vacationsx.update_dataframe_location over random cities 
+ #      twice with a temporary places cache, first against the stub places server 
+ #      and then entirely from the cache, which leaves only the row handling.  It 
+ #      returns the times, the located rows, and whether every located name 
+ #      belongs to its row's coordinates as a dataframe.
+ #
+ #
+ #  Return Type: dataframe
+ #
+ #
+ #  Function Parameters:
+ #
+ #  Type    Name            Description
+ #  -----   -------------   ----------------------------------------------
+ #  integer record_count_integer
+ #                          The parameter is the number of random cities before 
+ #                          cities at the same coordinates are dropped.
+ #  integer worker_count_integer
+ #                          The parameter is the number of concurrent searches.
+ #  float   latency_seconds_float
+ #                          The parameter is the simulated network latency per request.
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def return_place_lookup_benchmark_dataframe \
+        (record_count_integer = 100000,
+         worker_count_integer = 32,
+         latency_seconds_float = 0.0):
+
+    vacations_dataframe \
+        = return_benchmark_weather_dataframe(record_count_integer).reset_index(drop = True)
+
+    vacations_dataframe \
+        = vacations_dataframe.drop_duplicates(['latitude', 'longitude']).reset_index(drop = True)
+
+    benchmark_dictionary_list = []
+
+
+    stub_server = stubserverx.start_stub_server(latency_seconds_float)
+
+    website_string = weather_constants.CONSTANT_GEOAPIFY_WEBSITE
+
+    weather_constants.CONSTANT_GEOAPIFY_WEBSITE = stub_server.base_url_string
+
+    cache_file_path_string = cachex.CACHE_FILE_PATH
+
+    temporary_directory = tempfile.TemporaryDirectory()
+
+    cachex.set_cache_file_path \
+        (os.path.join(temporary_directory.name, 'benchmark_cache.sqlite'))
+
+
+    try:
+
+        for source_string in ['stub server', 'places cache']:
+
+            requestsx.reset_connection_statistics()
+
+            start_time_float = time.perf_counter()
+
+            hotels_dataframe \
+                = vacationsx.update_dataframe_location \
+                    (vacations_dataframe, 
+                     'hotel_name', 
+                     worker_count_integer = worker_count_integer)
+
+            elapsed_seconds_float = time.perf_counter() - start_time_float
+
+
+            aligned_boolean \
+                = all(stubserverx.return_stub_places_dictionary \
+                          (f'circle:{longitude_float},{latitude_float},10000', 
+                           'accommodation.hotel', 
+                           20)['features'][0]['properties']['name'] == hotel_name_string
+                      for latitude_float, longitude_float, hotel_name_string
+                      in zip(hotels_dataframe['latitude'], 
+                             hotels_dataframe['longitude'], 
+                             hotels_dataframe['hotel_name']))
+
+            benchmark_dictionary_list.append \
+                ({'record_count': len(vacations_dataframe),
+                  'source': source_string,
+                  'http_requests': requestsx.return_connection_statistics_dictionary()['requests'],
+                  'located_count': len(hotels_dataframe),
+                  'seconds': elapsed_seconds_float,
+                  'rows_aligned': aligned_boolean})
+
+    finally:
+
+        weather_constants.CONSTANT_GEOAPIFY_WEBSITE = website_string
+
+        stubserverx.stop_stub_server(stub_server)
+
+        cachex.set_cache_file_path(cache_file_path_string)
+
+        temporary_directory.cleanup()
+
+
+    return pd.DataFrame(benchmark_dictionary_list)
+
+
+# In[23]:
+
+
+#*******************************************************************************************
+ #
+ #  Function Name:  return_place_cluster_benchmark_dataframe
+ #
+ #  Function Description:
+ #      This function scatters random cities around a number of bays, finds their 
+ #      places with vacationsx.update_dataframe_locations against the stub places 
+ #      server for each cluster radius, and returns the HTTP requests, located 
+ #      cities, and times as a dataframe.
+ #
+ #
+ #  Return Type: dataframe
+ #
+ #
+ #  Function Parameters:
+ #
+ #  Type    Name            Description
+ #  -----   -------------   ----------------------------------------------
+ #  integer bay_count_integer
+ #                          The parameter is the number of bays.
+ #  integer city_count_integer
+ #                          The parameter is the number of cities around each bay.
+ #  float   spread_meters_float
+ #                          The parameter is the standard deviation in meters of the 
+ #                          cities' distance from their bay.
+ #  integer list
+ #          cluster_radius_meters_integer_list
+ #                          The parameter is the list of cluster radii to time.
+ #  integer seed_integer    The parameter is the random number generator seed.
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def return_place_cluster_benchmark_dataframe \
+        (bay_count_integer = 50,
+         city_count_integer = 20,
+         spread_meters_float = 3000.0,
+         cluster_radius_meters_integer_list = [0, 2500, 5000, 10000],
+         seed_integer = 42):
+
+    random_generator = np.random.default_rng(seed_integer)
+
+    vacations_dataframe \
+        = return_benchmark_weather_dataframe \
+            (bay_count_integer * city_count_integer, seed_integer).reset_index(drop = True)
+
+    spread_degrees_float \
+        = np.degrees(spread_meters_float / spatialx.CONSTANT_EARTH_RADIUS_METERS)
+
+    vacations_dataframe['latitude'] \
+        = np.repeat(random_generator.uniform(-60, 60, bay_count_integer), city_count_integer) \
+          + random_generator.normal(0.0, spread_degrees_float, len(vacations_dataframe))
+
+    vacations_dataframe['longitude'] \
+        = np.repeat(random_generator.uniform(-180, 180, bay_count_integer), city_count_integer) \
+          + random_generator.normal(0.0, spread_degrees_float, len(vacations_dataframe)) \
+            / np.cos(np.radians(vacations_dataframe['latitude'].to_numpy()))
+
+    benchmark_dictionary_list = []
+
+
+    stub_server = stubserverx.start_stub_server()
+
+    website_string = weather_constants.CONSTANT_GEOAPIFY_WEBSITE
+
+    weather_constants.CONSTANT_GEOAPIFY_WEBSITE = stub_server.base_url_string
+
+
+    try:
+
+        for cluster_radius_meters_integer in cluster_radius_meters_integer_list:
+
+            requestsx.reset_connection_statistics()
+
+            start_time_float = time.perf_counter()
+
+            locations_dataframe \
+                = vacationsx.update_dataframe_locations \
+                    (vacations_dataframe, 
+                     cache_ttl_seconds_integer = 0, 
+                     cluster_radius_meters_integer = cluster_radius_meters_integer)
+
+            elapsed_seconds_float = time.perf_counter() - start_time_float
+
+
+            benchmark_dictionary_list.append \
+                ({'city_count': len(vacations_dataframe),
+                  'cluster_radius_meters': cluster_radius_meters_integer,
+                  'http_requests': requestsx.return_connection_statistics_dictionary()['requests'],
+                  'hotels_located': locations_dataframe['hotel_name'].notna().sum(),
+                  'seconds': elapsed_seconds_float})
+
+    finally:
+
+        weather_constants.CONSTANT_GEOAPIFY_WEBSITE = website_string
+
+        stubserverx.stop_stub_server(stub_server)
+
+
+    return pd.DataFrame(benchmark_dictionary_list)
+
+
+# In[24]:
+
+
+#*******************************************************************************************
+ #
+ #  Function Name:  return_local_places_benchmark_dataframe
+ #
+ #  Function Description:
+ #      This function scatters random points of interest around random cities, 
+ #      writes them to a Parquet file, and finds the cities' places with 
+ #      vacationsx.update_dataframe_locations on the stub places server and on the 
+ #      local places backend.  It checks the local hotels for a sample of cities 
+ #      against a brute-force nearest-hotel search and returns the load times, 
+ #      HTTP requests, located hotels, matches, and times as a dataframe.
+ #
+ #
+ #  Return Type: dataframe
+ #
+ #
+ #  Function Parameters:
+ #
+ #  Type    Name            Description
+ #  -----   -------------   ----------------------------------------------
+ #  integer city_count_integer
+ #                          The parameter is the number of cities.
+ #  integer poi_count_integer
+ #                          The parameter is the number of points of interest.
+ #  float   spread_meters_float
+ #                          The parameter is the standard deviation in meters of the 
+ #                          points of interest's distance from their city.
+ #  integer sample_count_integer
+ #                          The parameter is the number of cities to check by brute 
+ #                          force.
+ #  integer seed_integer    The parameter is the random number generator seed.
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def return_local_places_benchmark_dataframe \
+        (city_count_integer = 1000,
+         poi_count_integer = 1000000,
+         spread_meters_float = 5000.0,
+         sample_count_integer = 100,
+         seed_integer = 42):
+
+    random_generator = np.random.default_rng(seed_integer)
+
+    vacations_dataframe \
+        = return_benchmark_weather_dataframe(city_count_integer, seed_integer) \
+              .reset_index(drop = True)
+
+    vacations_dataframe['latitude'] = random_generator.uniform(-60, 60, city_count_integer)
+
+    vacations_dataframe['longitude'] = random_generator.uniform(-180, 180, city_count_integer)
+
+
+    spread_degrees_float \
+        = np.degrees(spread_meters_float / spatialx.CONSTANT_EARTH_RADIUS_METERS)
+
+    city_index_integer_array = random_generator.integers(0, city_count_integer, poi_count_integer)
+
+    poi_latitude_float_array \
+        = vacations_dataframe['latitude'].to_numpy()[city_index_integer_array] \
+          + random_generator.normal(0.0, spread_degrees_float, poi_count_integer)
+
+    poi_longitude_float_array \
+        = vacations_dataframe['longitude'].to_numpy()[city_index_integer_array] \
+          + random_generator.normal(0.0, spread_degrees_float, poi_count_integer) \
+            / np.cos(np.radians(poi_latitude_float_array))
+
+    category_string_array \
+        = np.array(list(vacationsx.CONSTANT_PLACE_COLUMN_CATEGORY_DICTIONARY.values())) \
+              [random_generator.integers \
+                   (0, len(vacationsx.CONSTANT_PLACE_COLUMN_CATEGORY_DICTIONARY), 
+                    poi_count_integer)]
+
+    poi_dataframe \
+        = pd.DataFrame \
+            ({'name': [f'poi {index}' for index in range(poi_count_integer)],
+              'latitude': poi_latitude_float_array,
+              'longitude': poi_longitude_float_array,
+              'categories': [[category_string.split('.')[0], category_string] 
+                             for category_string in category_string_array]})
+
+
+    benchmark_dictionary_list = []
+
+    locations_dataframe_dictionary = {}
+
+
+    stub_server = stubserverx.start_stub_server()
+
+    website_string = weather_constants.CONSTANT_GEOAPIFY_WEBSITE
+
+    weather_constants.CONSTANT_GEOAPIFY_WEBSITE = stub_server.base_url_string
+
+    places_index_dictionary = vacationsx.PLACES_INDEX_DICTIONARY
+
+
+    try:
+
+        with tempfile.TemporaryDirectory() as temp_directory_string:
+
+            poi_file_path_string = os.path.join(temp_directory_string, 'places_poi.parquet')
+
+            poi_dataframe.to_parquet(poi_file_path_string, index = False)
+
+
+            for backend_string in ['geoapify', 'local']:
+
+                start_time_float = time.perf_counter()
+
+                vacationsx.set_places_backend(backend_string, poi_file_path_string)
+
+                load_seconds_float = time.perf_counter() - start_time_float
+
+
+                requestsx.reset_connection_statistics()
+
+                start_time_float = time.perf_counter()
+
+                locations_dataframe_dictionary[backend_string] \
+                    = vacationsx.update_dataframe_locations \
+                        (vacations_dataframe, cache_ttl_seconds_integer = 0)
+
+                elapsed_seconds_float = time.perf_counter() - start_time_float
+
+
+                benchmark_dictionary_list.append \
+                    ({'backend': backend_string,
+                      'city_count': city_count_integer,
+                      'poi_count': poi_count_integer,
+                      'load_seconds': load_seconds_float,
+                      'http_requests': 
+                          requestsx.return_connection_statistics_dictionary()['requests'],
+                      'hotels_located': 
+                          locations_dataframe_dictionary[backend_string]['hotel_name'] \
+                              .notna().sum(),
+                      'seconds': elapsed_seconds_float})
+
+    finally:
+
+        vacationsx.PLACES_INDEX_DICTIONARY = places_index_dictionary
+
+        weather_constants.CONSTANT_GEOAPIFY_WEBSITE = website_string
+
+        stubserverx.stop_stub_server(stub_server)
+
+
+    hotel_boolean_array = category_string_array == 'accommodation.hotel'
+
+    local_locations_dataframe = locations_dataframe_dictionary['local']
+
+    match_count_integer = 0
+
+
+    for row_index in range(min(sample_count_integer, len(local_locations_dataframe))):
+
+        distance_float_array \
+            = spatialx.return_haversine_distance_array \
+                (local_locations_dataframe['latitude'].iloc[row_index],
+                 local_locations_dataframe['longitude'].iloc[row_index],
+                 poi_latitude_float_array[hotel_boolean_array],
+                 poi_longitude_float_array[hotel_boolean_array])
+
+        nearest_index = int(np.argmin(distance_float_array))
+
+        if distance_float_array[nearest_index] <= 10000:
+
+            hotel_name_string = poi_dataframe['name'].to_numpy()[hotel_boolean_array][nearest_index]
+
+        else:
+
+            hotel_name_string = None
+
+        match_count_integer \
+            += local_locations_dataframe['hotel_name'].iloc[row_index] == hotel_name_string
+
+
+    for benchmark_dictionary in benchmark_dictionary_list:
+
+        benchmark_dictionary['brute_force_matches'] \
+            = f'{match_count_integer}/{min(sample_count_integer, len(local_locations_dataframe))}' \
+              if benchmark_dictionary['backend'] == 'local' else None
+
+
+    return pd.DataFrame(benchmark_dictionary_list)
+
+
+# In[25]:
+
+
+#*******************************************************************************************
+ #
+ #  Function Name:  return_nearest_city_benchmark_dataframe
+ #
+ #  Function Description:
+ #      This function times weatherx.return_nearest_city_names_array against 
+ #      per-point citipy.nearest_city calls for each point count and returns the 
+ #      results as a dataframe.  Beyond the baseline point count, the citipy time 
+ #      is extrapolated from the baseline sample, and the match fraction compares 
+ #      the two methods on that sample.
+ #
+ #
+ #  Return Type: dataframe
+ #
+ #
+ #  Function Parameters:
+ #
+ #  Type    Name            Description
+ #  -----   -------------   ----------------------------------------------
+ #  integer list
+ #          point_count_integer_list
+ #                          The parameter is the list of point counts to time.
+ #  integer baseline_point_count_integer
+ #                          The parameter is the largest point count to time with citipy.
+ #  integer seed_integer    The parameter is the random number generator seed.
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def return_nearest_city_benchmark_dataframe \
+        (point_count_integer_list = [3000, 100000, 1000000],
+         baseline_point_count_integer = 3000,
+         seed_integer = 42):
+
+    random_generator = np.random.default_rng(seed_integer)
+
+    benchmark_dictionary_list = []
+
+
+    start_time_float = time.perf_counter()
+
+    weatherx.return_city_kdtree()
+
+    build_seconds_float = time.perf_counter() - start_time_float
+
+
+    for point_count_integer in point_count_integer_list:
+
+        latitude_float_array = random_generator.uniform(-90.0, 90.0, point_count_integer)
+
+        longitude_float_array = random_generator.uniform(-180.0, 180.0, point_count_integer)
+
+
+        start_time_float = time.perf_counter()
+
+        city_names_string_array \
+            = weatherx.return_nearest_city_names_array \
+                (latitude_float_array, longitude_float_array)
+
+        kdtree_seconds_float = time.perf_counter() - start_time_float
+
+
+        sample_count_integer = min(point_count_integer, baseline_point_count_integer)
+
+        start_time_float = time.perf_counter()
+
+        citipy_names_string_list \
+            = [citipy.nearest_city(latitude_float, longitude_float).city_name
+               for latitude_float, longitude_float
+               in zip(latitude_float_array[:sample_count_integer], 
+                      longitude_float_array[:sample_count_integer])]
+
+        citipy_seconds_float \
+            = (time.perf_counter() - start_time_float) \
+              * point_count_integer / sample_count_integer
+
+
+        benchmark_dictionary_list.append \
+            ({'point_count': point_count_integer,
+              'index_build_seconds': build_seconds_float,
+              'kdtree_seconds': kdtree_seconds_float,
+              'citipy_seconds': citipy_seconds_float,
+              'citipy_extrapolated': sample_count_integer < point_count_integer,
+              'speedup': citipy_seconds_float / kdtree_seconds_float,
+              'match_fraction': 
+                  np.mean(city_names_string_array[:sample_count_integer] 
+                          == np.array(citipy_names_string_list, dtype = object))})
+
+
+    return pd.DataFrame(benchmark_dictionary_list)
+
+
+# In[26]:
+
+
+#*******************************************************************************************
+ #
+ #  Function Name:  return_city_sampling_benchmark_dataframe
+ #
+ #  Function Description:
+ #      This function draws the same number of samples with each city sampling 
+ #      mode and returns, as a dataframe, the unique cities found, the unique 
+ #      cities per sample, and the samples each mode needed to reach the target 
+ #      number of unique cities.
+ #
+ #
+ #  Return Type: dataframe
+ #
+ #
+ #  Function Parameters:
+ #
+ #  Type    Name            Description
+ #  -----   -------------   ----------------------------------------------
+ #  integer sample_count_integer
+ #                          The parameter is the number of samples per mode.
+ #  integer target_city_count_integer
+ #                          The parameter is the target number of unique cities.
+ #  integer seed_integer    The parameter is the random number generator seed.
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def return_city_sampling_benchmark_dataframe \
+        (sample_count_integer = 100000,
+         target_city_count_integer = weather_constants.CONSTANT_CITY_NAME_COUNT,
+         seed_integer = 42):
+
+    benchmark_dictionary_list = []
+
+
+    for sampling_mode_string in ['uniform', 'sphere', 'city']:
+
+        random_generator = np.random.default_rng(seed_integer)
+
+
+        start_time_float = time.perf_counter()
+
+        latitude_float_array, longitude_float_array \
+            = weatherx.return_random_coordinate_arrays \
+                (sample_count_integer, sampling_mode_string, random_generator)
+
+        city_names_string_array \
+            = weatherx.return_nearest_city_names_array \
+                (latitude_float_array, longitude_float_array)
+
+        elapsed_seconds_float = time.perf_counter() - start_time_float
+
+
+        first_index_integer_array \
+            = np.sort(np.unique(city_names_string_array, return_index = True)[1])
+
+        if len(first_index_integer_array) >= target_city_count_integer:
+
+            samples_to_target_integer \
+                = int(first_index_integer_array[target_city_count_integer - 1]) + 1
+
+        else:
+
+            samples_to_target_integer = None
+
+
+        benchmark_dictionary_list.append \
+            ({'sampling_mode': sampling_mode_string,
+              'sample_count': sample_count_integer,
+              'unique_cities': len(first_index_integer_array),
+              'unique_cities_per_sample': len(first_index_integer_array) / sample_count_integer,
+              'samples_to_target': samples_to_target_integer,
+              'seconds': elapsed_seconds_float})
+
+
+    return pd.DataFrame(benchmark_dictionary_list)
+
+
+# In[27]:
+
+
+#*******************************************************************************************
+ #
+ #  Function Name:  run_benchmark_checks
+ #
+ #  Function Description:
+ #      This subroutine runs every function in this file whose name starts with 
+ #      check_, in the order they appear; a failed check raises an AssertionError.
+ #
+ #
+ #  Return Type: n/a
+ #
+ #
+ #  Function Parameters:
+ #
+ #  Type    Name            Description
+ #  -----   -------------   ----------------------------------------------
+ #  n/a     n/a             n/a
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def run_benchmark_checks():
+
+    for function_name_string, check_function in list(globals().items()):
+
+        if function_name_string.startswith('check_'):
+
+            check_function()
+
+
+# In[28]:
+
+
+#*******************************************************************************************
+ #
+ #  Function Name:  assert_stub_weather_dataframe
+ #
+ #  Function Description:
+ #      This subroutine checks that a weather dataframe from the stub server has 
+ #      the expected cities, in order, with the values the server sent.
+ #
+ #
+ #  Return Type: n/a
+ #
+ #
+ #  Function Parameters:
+ #
+ #  Type    Name            Description
+ #  -----   -------------   ----------------------------------------------
+ #  dataframe
+ #          city_weather_dataframe
+ #                          The parameter is the weather dataframe.
+ #  string list
+ #          city_names_string_list
+ #                          The parameter is the list of expected city names.
+ #  list    expected_field_list_list
+ #                          The parameter is the list of expected weather field 
+ #                          lists, one per city.
+ #  string  fetch_path_string
+ #                          The parameter is the fetch path name for the messages.
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def assert_stub_weather_dataframe \
+        (city_weather_dataframe,
+         city_names_string_list,
+         expected_field_list_list,
+         fetch_path_string):
+
+    assert city_weather_dataframe['city'].tolist() == city_names_string_list, \
+        f'The {fetch_path_string} path returned the wrong cities.'
+
+    assert np.allclose \
+               (city_weather_dataframe \
+                    [['latitude', 'longitude', 'temperature', 
+                      'humidity', 'cloudiness', 'wind_speed']] \
+                    .to_numpy(dtype = np.float64),
+                np.array([field_list[:6] for field_list in expected_field_list_list])), \
+        f'The {fetch_path_string} path returned the wrong weather values.'
+
+    assert city_weather_dataframe['country'].astype(str).tolist() \
+               == [field_list[6] for field_list in expected_field_list_list], \
+        f'The {fetch_path_string} path returned the wrong countries.'
+
+    assert (city_weather_dataframe['date_time'] 
+            == datetime.fromtimestamp(stubserverx.CONSTANT_STUB_TIMESTAMP)).all(), \
+        f'The {fetch_path_string} path returned the wrong date times.'
+
+
+# In[29]:
+
+
+#*******************************************************************************************
+ #
+ #  Function Name:  check_weather_fetch
+ #
+ #  Function Description:
+ #      This subroutine fetches weather by city name from the stub server with 
+ #      one worker and with several, and checks that both return every known 
+ #      city once, in order, with the values the server sent, and skip a city 
+ #      the server does not find.
+ #
+ #
+ #  Return Type: n/a
+ #
+ #
+ #  Function Parameters:
+ #
+ #  Type    Name            Description
+ #  -----   -------------   ----------------------------------------------
+ #  integer city_count_integer
+ #                          The parameter is the number of cities to fetch.
+ #  integer list
+ #          worker_count_integer_list
+ #                          The parameter is the list of worker counts to check.
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def check_weather_fetch \
+        (city_count_integer = 60,
+         worker_count_integer_list = [1, 8]):
+
+    city_names_string_list = return_benchmark_city_names_list(city_count_integer)
+
+    expected_field_list_list \
+        = [weatherx.return_weather_field_list \
+               (stubserverx.return_stub_weather_dictionary(city_name_string))
+           for city_name_string in city_names_string_list]
+
+
+    stub_server = stubserverx.start_stub_server()
+
+    website_string = weather_constants.CONSTANT_OPEN_WEATHERMAP_WEBSITE
+
+    weather_constants.CONSTANT_OPEN_WEATHERMAP_WEBSITE = stub_server.base_url_string
+
+
+    try:
+
+        for worker_count_integer in worker_count_integer_list:
+
+            city_weather_dataframe \
+                = weatherx.return_weather_dataframe \
+                    (city_names_string_list 
+                     + [f'{stubserverx.CONSTANT_STUB_NOT_FOUND_PREFIX} city'], 
+                     worker_count_integer,
+                     cache_ttl_seconds_integer = 0,
+                     output_file_path_string = None)
+
+            assert_stub_weather_dataframe \
+                (city_weather_dataframe, 
+                 city_names_string_list, 
+                 expected_field_list_list,
+                 f'{worker_count_integer}-worker name')
+
+    finally:
+
+        weather_constants.CONSTANT_OPEN_WEATHERMAP_WEBSITE = website_string
+
+        stubserverx.stop_stub_server(stub_server)
+
+
+# In[30]:
+
+
+#*******************************************************************************************
+ #
+ #  Function Name:  check_place_lookup
+ #
+ #  Function Description:
+ #      This subroutine looks up hotels around random cities with the stub places 
+ #      server, first from the server and then from the places cache, and checks 
+ #      that vacationsx.update_dataframe_location gives each city the first hotel 
+ #      the server returns and that the second pass sends no requests.
+ #
+ #
+ #  Return Type: n/a
+ #
+ #
+ #  Function Parameters:
+ #
+ #  Type    Name            Description
+ #  -----   -------------   ----------------------------------------------
+ #  integer city_count_integer
+ #                          The parameter is the number of cities to search around.
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def check_place_lookup(city_count_integer = 50):
+
+    vacations_dataframe \
+        = return_benchmark_weather_dataframe(city_count_integer).reset_index(drop = True)
+
+    hotel_column_name_string, hotel_category_string \
+        = list(vacationsx.CONSTANT_PLACE_COLUMN_CATEGORY_DICTIONARY.items())[0]
+
+
+    expected_name_string_list = []
+
+    for latitude_float, longitude_float \
+            in zip(vacations_dataframe['latitude'], vacations_dataframe['longitude']):
+
+        feature_dictionary_list \
+            = stubserverx.return_stub_places_dictionary \
+                (f'circle:{longitude_float},{latitude_float},10000', 
+                 hotel_category_string, 
+                 20)['features']
+
+        if len(feature_dictionary_list) > 0:
+
+            expected_name_string_list.append(feature_dictionary_list[0]['properties']['name'])
+
+
+    stub_server = stubserverx.start_stub_server()
+
+    website_string = weather_constants.CONSTANT_GEOAPIFY_WEBSITE
+
+    weather_constants.CONSTANT_GEOAPIFY_WEBSITE = stub_server.base_url_string
+
+    cache_file_path_string = cachex.CACHE_FILE_PATH
+
+    temporary_directory = tempfile.TemporaryDirectory()
+
+    cachex.set_cache_file_path \
+        (os.path.join(temporary_directory.name, 'check_cache.sqlite'))
+
+
+    try:
+
+        for source_string in ['stub server', 'places cache']:
+
+            requestsx.reset_connection_statistics()
+
+            hotels_dataframe \
+                = vacationsx.update_dataframe_location \
+                    (vacations_dataframe.copy(), 
+                     hotel_column_name_string, 
+                     hotel_category_string)
+
+            request_count_integer \
+                = requestsx.return_connection_statistics_dictionary()['requests']
+
+
+            assert hotels_dataframe[hotel_column_name_string].tolist() \
+                       == expected_name_string_list, \
+                f'The hotel search from the {source_string} returned the wrong hotels.'
+
+            assert (source_string == 'stub server') == (request_count_integer > 0), \
+                f'The hotel search from the {source_string} sent {request_count_integer} requests.'
+
+    finally:
+
+        weather_constants.CONSTANT_GEOAPIFY_WEBSITE = website_string
+
+        stubserverx.stop_stub_server(stub_server)
+
+        cachex.set_cache_file_path(cache_file_path_string)
+
+        temporary_directory.cleanup()
+
+
+# In[31]:
+
+
+#*******************************************************************************************
+ #
+ #  Function Name:  check_nearest_city
+ #
+ #  Function Description:
+ #      This subroutine checks that weatherx.return_nearest_city_names_array 
+ #      returns the same city names as per-point citipy.nearest_city calls for 
+ #      random points.
+ #
+ #
+ #  Return Type: n/a
+ #
+ #
+ #  Function Parameters:
+ #
+ #  Type    Name            Description
+ #  -----   -------------   ----------------------------------------------
+ #  integer point_count_integer
+ #                          The parameter is the number of random points.
+ #  integer seed_integer    The parameter is the random number generator seed.
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def check_nearest_city \
+        (point_count_integer = 2000,
+         seed_integer = 42):
+
+    random_generator = np.random.default_rng(seed_integer)
+
+    latitude_float_array = random_generator.uniform(-90.0, 90.0, point_count_integer)
+
+    longitude_float_array = random_generator.uniform(-180.0, 180.0, point_count_integer)
+
+
+    city_names_string_array \
+        = weatherx.return_nearest_city_names_array(latitude_float_array, longitude_float_array)
+
+    citipy_names_string_list \
+        = [citipy.nearest_city(latitude_float, longitude_float).city_name
+           for latitude_float, longitude_float 
+           in zip(latitude_float_array, longitude_float_array)]
+
+
+    assert list(city_names_string_array) == citipy_names_string_list, \
+        'The nearest city names differ from citipy.'
+
+
+# In[32]:
+
+
+#*******************************************************************************************
+ #
+ #  Function Name:  check_weather_group_fetch
+ #
+ #  Function Description:
+ #      This subroutine fetches weather from the stub server by city id in groups, 
+ #      and by city id with groups the server rejects, and checks that both paths 
+ #      return every known city once, in order, with the values the server sent, 
+ #      and skip a city the server does not find.
+ #
+ #
+ #  Return Type: n/a
+ #
+ #
+ #  Function Parameters:
+ #
+ #  Type    Name            Description
+ #  -----   -------------   ----------------------------------------------
+ #  integer city_count_integer
+ #                          The parameter is the number of cities to fetch.
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def check_weather_group_fetch(city_count_integer = 60):
+
+    city_names_string_list \
+        = return_benchmark_city_names_list(city_count_integer) \
+          + [f'{stubserverx.CONSTANT_STUB_NOT_FOUND_PREFIX} city']
+
+    city_ids_dictionary \
+        = {city_name_string: index + 1
+           for index, city_name_string 
+           in enumerate(city_names_string_list[:2 * city_count_integer // 3])}
+
+
+    def return_expected_field_list_list(group_boolean):
+
+        return \
+            [weatherx.return_weather_field_list \
+                 (stubserverx.return_stub_weather_dictionary \
+                      (f'city id {city_ids_dictionary[city_name_string]}', 
+                       city_ids_dictionary[city_name_string])
+                  if group_boolean and city_name_string in city_ids_dictionary
+                  else stubserverx.return_stub_weather_dictionary(city_name_string))
+             for city_name_string in city_names_string_list[:city_count_integer]]
+
+
+    stub_server = stubserverx.start_stub_server()
+
+    website_string = weather_constants.CONSTANT_OPEN_WEATHERMAP_WEBSITE
+
+    group_size_integer = weather_constants.CONSTANT_OPEN_WEATHERMAP_GROUP_SIZE
+
+    weather_constants.CONSTANT_OPEN_WEATHERMAP_WEBSITE = stub_server.base_url_string
+
+
+    try:
+
+        for fetch_path_string, server_group_size_integer, group_boolean \
+                in [('group', group_size_integer, True),
+                    ('rejected group', 
+                     max(len(city_ids_dictionary), stubserverx.CONSTANT_STUB_GROUP_SIZE + 1), 
+                     False)]:
+
+            weather_constants.CONSTANT_OPEN_WEATHERMAP_GROUP_SIZE = server_group_size_integer
+
+            city_weather_dataframe \
+                = weatherx.return_weather_dataframe \
+                    (city_names_string_list, 
+                     cache_ttl_seconds_integer = 0,
+                     city_ids_dictionary = city_ids_dictionary,
+                     output_file_path_string = None)
+
+            assert_stub_weather_dataframe \
+                (city_weather_dataframe, 
+                 city_names_string_list[:city_count_integer], 
+                 return_expected_field_list_list(group_boolean),
+                 fetch_path_string)
+
+    finally:
+
+        weather_constants.CONSTANT_OPEN_WEATHERMAP_WEBSITE = website_string
+
+        weather_constants.CONSTANT_OPEN_WEATHERMAP_GROUP_SIZE = group_size_integer
+
+        stubserverx.stop_stub_server(stub_server)
+
+
+# In[33]:
+
+
+#*******************************************************************************************
+ #
+ #  Function Name:  check_vacation_filter
+ #
+ #  Function Description:
+ #      This subroutine checks that vacationsx.return_vacations_dataframe and one 
+ #      DataFrame.query expression return the same rows as the four chained .loc 
+ #      passes timed in return_vacation_filter_benchmark_dataframe.
+ #
+ #
+ #  Return Type: n/a
+ #
+ #
+ #  Function Parameters:
+ #
+ #  Type    Name            Description
+ #  -----   -------------   ----------------------------------------------
+ #  integer record_count_integer
+ #                          The parameter is the number of cities.
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def check_vacation_filter(record_count_integer = 100000):
+
+    city_weather_dataframe = return_benchmark_weather_dataframe(record_count_integer)
+
+    conditions_dictionary = weather_constants.weather_conditions_dictionary
+
+
+    chained_vacations_dataframe = city_weather_dataframe
+
+    for condition_key_string, range_list in conditions_dictionary.items():
+
+        column_name_string = condition_key_string.removesuffix('_range')
+
+        chained_vacations_dataframe \
+            = chained_vacations_dataframe \
+                .loc[(chained_vacations_dataframe[column_name_string] >= range_list[0])
+                     & (chained_vacations_dataframe[column_name_string] <= range_list[1]), 
+                     :]
+
+    query_string \
+        = ' & '.join \
+            (f'{range_list[0]} <= {condition_key_string.removesuffix("_range")} <= {range_list[1]}'
+             for condition_key_string, range_list in conditions_dictionary.items())
+
+
+    assert len(chained_vacations_dataframe) > 0, \
+        'The chained .loc filter found no rows to compare.'
+
+    pd.testing.assert_frame_equal \
+        (vacationsx.return_vacations_dataframe(city_weather_dataframe), 
+         chained_vacations_dataframe)
+
+    pd.testing.assert_frame_equal \
+        (city_weather_dataframe.query(query_string), 
+         chained_vacations_dataframe)
+
+
+# In[34]:
+
+
+#*******************************************************************************************
+ #
+ #  Function Name:  check_vacation_range_index
+ #
+ #  Function Description:
+ #      This subroutine checks that the vacation range index returns the same row 
+ #      positions as the fused mask for random slider-style range queries, 
+ #      including empty and full ranges.
+ #
+ #
+ #  Return Type: n/a
+ #
+ #
+ #  Function Parameters:
+ #
+ #  Type    Name            Description
+ #  -----   -------------   ----------------------------------------------
+ #  integer record_count_integer
+ #                          The parameter is the number of cities.
+ #  integer query_count_integer
+ #                          The parameter is the number of random queries.
+ #  integer seed_integer    The parameter is the random number generator seed.
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def check_vacation_range_index \
+        (record_count_integer = 100000,
+         query_count_integer = 50,
+         seed_integer = 42):
+
+    random_generator = np.random.default_rng(seed_integer)
+
+    city_weather_dataframe = return_benchmark_weather_dataframe(record_count_integer)
+
+    range_index_dictionary \
+        = vacationsx.return_vacation_range_index_dictionary(city_weather_dataframe)
+
+
+    conditions_dictionary_list \
+        = [{'temperature_range': [-100, 200],
+            'humidity_range': [0, 100],
+            'cloudiness_range': [0, 100],
+            'wind_speed_range': [0, 100]},
+           {'temperature_range': [80, 70],
+            'humidity_range': [0, 100],
+            'cloudiness_range': [0, 100],
+            'wind_speed_range': [0, 100]}]
+
+    for _ in range(query_count_integer):
+
+        minimum_float_array = random_generator.uniform([40, 0, 0, 0], [90, 80, 50, 10])
+
+        width_float_array = random_generator.uniform([5, 10, 0, 2], [30, 40, 50, 15])
+
+        conditions_dictionary_list.append \
+            ({condition_key_string: [minimum_float, minimum_float + width_float]
+              for condition_key_string, minimum_float, width_float
+              in zip(['temperature_range', 'humidity_range', 
+                      'cloudiness_range', 'wind_speed_range'],
+                     minimum_float_array, width_float_array)})
+
+
+    for conditions_dictionary in conditions_dictionary_list:
+
+        position_integer_array \
+            = vacationsx.return_vacation_index_positions_array \
+                (range_index_dictionary, conditions_dictionary)
+
+        mask_boolean_array \
+            = vacationsx.return_vacation_mask_array \
+                (city_weather_dataframe, conditions_dictionary)
+
+        assert np.array_equal(position_integer_array, np.flatnonzero(mask_boolean_array)), \
+            f'The range index and the fused mask disagree for {conditions_dictionary}.'
+
+
+# In[35]:
+
+
+#*******************************************************************************************
+ #
+ #  Function Name:  check_vacation_query
+ #
+ #  Function Description:
+ #      This subroutine narrows and then widens the vacation cloudiness range one 
+ #      step at a time and checks that the vacation query mask equals the fused 
+ #      mask after every change and that masks the query returned earlier do not 
+ #      change.
+ #
+ #
+ #  Return Type: n/a
+ #
+ #
+ #  Function Parameters:
+ #
+ #  Type    Name            Description
+ #  -----   -------------   ----------------------------------------------
+ #  integer record_count_integer
+ #                          The parameter is the number of records.
+ #  integer step_count_integer
+ #                          The parameter is the number of range changes in each 
+ #                          direction.
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def check_vacation_query \
+        (record_count_integer = 100000,
+         step_count_integer = 10):
+
+    city_weather_dataframe = return_benchmark_weather_dataframe(record_count_integer)
+
+    original_conditions_dictionary \
+        = {condition_key_string: list(range_list)
+           for condition_key_string, range_list
+           in weather_constants.weather_conditions_dictionary.items()}
+
+
+    try:
+
+        vacationsx.set_vacation_temperature_range(60, 90)
+
+        vacationsx.set_vacation_humidity_range(20, 80)
+
+        vacationsx.set_vacation_cloudiness_range(0, 100)
+
+        vacationsx.set_vacation_wind_speed_range(0, 15)
+
+
+        query_dictionary = vacationsx.return_vacation_query_dictionary(city_weather_dataframe)
+
+        cloudiness_integer_list = list(np.linspace(100, 5, step_count_integer).astype(int))
+
+        returned_mask_tuple_list = []
+
+        for maximum_cloudiness_integer in cloudiness_integer_list + cloudiness_integer_list[::-1]:
+
+            vacationsx.set_vacation_cloudiness_range(0, maximum_cloudiness_integer)
+
+            query_mask_boolean_array = vacationsx.return_vacation_query_mask_array(query_dictionary)
+
+            mask_boolean_array = vacationsx.return_vacation_mask_array(city_weather_dataframe)
+
+            assert np.array_equal(query_mask_boolean_array, mask_boolean_array), \
+                f'The vacation query and the fused mask disagree at cloudiness ' \
+                + f'0 to {maximum_cloudiness_integer}.'
+
+            returned_mask_tuple_list.append \
+                ((query_mask_boolean_array, query_mask_boolean_array.copy()))
+
+
+        for query_mask_boolean_array, expected_mask_boolean_array in returned_mask_tuple_list:
+
+            assert np.array_equal(query_mask_boolean_array, expected_mask_boolean_array), \
+                'A mask the vacation query returned earlier changed.'
+
+    finally:
+
+        for condition_key_string, range_list in original_conditions_dictionary.items():
+
+            weather_constants.weather_conditions_dictionary[condition_key_string][:] = range_list
+
+
+# In[36]:
+
+
+#*******************************************************************************************
+ #
+ #  Function Name:  check_ranked_vacations
+ #
+ #  Function Description:
+ #      This subroutine checks that the partitioned vacation shortlist has the 
+ #      same penalties, in order, as a shortlist from sorting every penalty, and 
+ #      that each shortlisted city carries its own penalty.
+ #
+ #
+ #  Return Type: n/a
+ #
+ #
+ #  Function Parameters:
+ #
+ #  Type    Name            Description
+ #  -----   -------------   ----------------------------------------------
+ #  integer list
+ #          record_count_integer_list
+ #                          The parameter is the list of record counts to rank.
+ #  integer city_count_integer
+ #                          The parameter is the number of cities in the shortlist.
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def check_ranked_vacations \
+        (record_count_integer_list = [30, 100000],
+         city_count_integer = 50):
+
+    conditions_dictionary \
+        = {'temperature_range': [70, 95],
+           'humidity_range': [35, 65],
+           'cloudiness_range': [0, 10],
+           'wind_speed_range': [0, 10]}
+
+
+    for record_count_integer in record_count_integer_list:
+
+        city_weather_dataframe = return_benchmark_weather_dataframe(record_count_integer)
+
+        ranked_vacations_dataframe \
+            = vacationsx.return_ranked_vacations_dataframe \
+                (city_weather_dataframe, city_count_integer, conditions_dictionary)
+
+        penalty_float_array \
+            = vacationsx.return_vacation_penalty_array \
+                (city_weather_dataframe, conditions_dictionary)
+
+        sorted_penalty_float_array \
+            = np.sort(penalty_float_array, kind = 'stable')[:city_count_integer]
+
+
+        assert len(ranked_vacations_dataframe) == min(record_count_integer, city_count_integer), \
+            f'The shortlist of {record_count_integer} cities has the wrong length.'
+
+        assert ranked_vacations_dataframe.index.is_unique, \
+            f'The shortlist of {record_count_integer} cities repeats a city.'
+
+        assert np.array_equal \
+                   (ranked_vacations_dataframe['penalty'].to_numpy(), sorted_penalty_float_array), \
+            f'The shortlist of {record_count_integer} cities does not match the full sort.'
+
+        assert np.array_equal \
+                   (ranked_vacations_dataframe['penalty'].to_numpy(),
+                    penalty_float_array \
+                        [city_weather_dataframe.index.get_indexer(ranked_vacations_dataframe.index)]), \
+            f'The shortlist of {record_count_integer} cities has misaligned penalties.'
+
+
+# In[37]:
+
+
+#*******************************************************************************************
+ #
+ #  Function Name:  check_place_categories
+ #
+ #  Function Description:
+ #      This subroutine looks up places around random cities with the stub places 
+ #      server, first from the server and then from the places cache, and checks 
+ #      that vacationsx.update_dataframe_locations gives each city the first place 
+ #      the server returns for each category, stopping at the first category with 
+ #      no place, both when every place fits the combined search and when a 
+ #      result limit of one crowds places out.  It also checks that the combined 
+ #      search sends fewer requests than one search per category and that the 
+ #      second pass sends no requests.
+ #
+ #
+ #  Return Type: n/a
+ #
+ #
+ #  Function Parameters:
+ #
+ #  Type    Name            Description
+ #  -----   -------------   ----------------------------------------------
+ #  integer city_count_integer
+ #                          The parameter is the number of cities to search around.
+ #  integer list
+ #          result_limit_integer_list
+ #                          The parameter is the list of per-category result limits.
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def check_place_categories \
+        (city_count_integer = 50,
+         result_limit_integer_list = [20, 1]):
+
+    vacations_dataframe \
+        = return_benchmark_weather_dataframe(city_count_integer).reset_index(drop = True)
+
+    column_category_dictionary = vacationsx.CONSTANT_PLACE_COLUMN_CATEGORY_DICTIONARY
+
+
+    def return_expected_place_name_string(latitude_float, longitude_float, category_string):
+
+        feature_dictionary_list \
+            = stubserverx.return_stub_places_dictionary \
+                (f'circle:{longitude_float},{latitude_float},10000', 
+                 category_string, 
+                 20)['features']
+
+        return feature_dictionary_list[0]['properties']['name'] \
+               if len(feature_dictionary_list) > 0 else None
+
+
+    expected_name_string_list_dictionary \
+        = {column_name_string: 
+               [return_expected_place_name_string 
+                    (latitude_float, longitude_float, category_string)
+                for latitude_float, longitude_float 
+                in zip(vacations_dataframe['latitude'], vacations_dataframe['longitude'])]
+           for column_name_string, category_string in column_category_dictionary.items()}
+
+    category_request_count_integer = city_count_integer
+
+    for previous_column_name_string, column_name_string \
+            in zip(list(column_category_dictionary), list(column_category_dictionary)[1:]):
+
+        expected_name_string_list_dictionary[column_name_string] \
+            = [None if previous_name_string is None else name_string
+               for previous_name_string, name_string 
+               in zip(expected_name_string_list_dictionary[previous_column_name_string],
+                      expected_name_string_list_dictionary[column_name_string])]
+
+        category_request_count_integer \
+            += sum(name_string is not None 
+                   for name_string 
+                   in expected_name_string_list_dictionary[previous_column_name_string])
+
+
+    stub_server = stubserverx.start_stub_server()
+
+    website_string = weather_constants.CONSTANT_GEOAPIFY_WEBSITE
+
+    weather_constants.CONSTANT_GEOAPIFY_WEBSITE = stub_server.base_url_string
+
+    cache_file_path_string = cachex.CACHE_FILE_PATH
+
+    temporary_directory = tempfile.TemporaryDirectory()
+
+    cachex.set_cache_file_path \
+        (os.path.join(temporary_directory.name, 'check_cache.sqlite'))
+
+
+    try:
+
+        for result_limit_integer in result_limit_integer_list:
+
+            for source_string in ['stub server', 'places cache']:
+
+                requestsx.reset_connection_statistics()
+
+                places_dataframe \
+                    = vacationsx.update_dataframe_locations \
+                        (vacations_dataframe.copy(), 
+                         result_limit_integer = result_limit_integer)
+
+                request_count_integer \
+                    = requestsx.return_connection_statistics_dictionary()['requests']
+
+
+                assert len(places_dataframe) == city_count_integer, \
+                    f'The place search from the {source_string} with limit ' \
+                    + f'{result_limit_integer} dropped cities.'
+
+                for column_name_string, expected_name_string_list \
+                        in expected_name_string_list_dictionary.items():
+
+                    assert places_dataframe[column_name_string].tolist() \
+                               == expected_name_string_list, \
+                        f'The place search from the {source_string} with limit ' \
+                        + f'{result_limit_integer} returned the wrong {column_name_string} values.'
+
+                if source_string == 'stub server':
+
+                    assert 0 < request_count_integer < category_request_count_integer, \
+                        f'The place search with limit {result_limit_integer} sent ' \
+                        + f'{request_count_integer} requests, not fewer than the ' \
+                        + f'{category_request_count_integer} of one search per category.'
+
+                else:
+
+                    assert request_count_integer == 0, \
+                        f'The place search from the places cache with limit ' \
+                        + f'{result_limit_integer} sent {request_count_integer} requests.'
+
+    finally:
+
+        weather_constants.CONSTANT_GEOAPIFY_WEBSITE = website_string
+
+        stubserverx.stop_stub_server(stub_server)
+
+        cachex.set_cache_file_path(cache_file_path_string)
+
+        temporary_directory.cleanup()
+
+
+# In[ ]:
+
+
+
+
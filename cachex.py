@@ -0,0 +1,538 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+# In[1]:
+
+
+#*******************************************************************************************
+ #
+ #  File Name:  cachex.py
+ #
+ #  File Description:
+ #      This Python script, cachex.py, contains generic Python functions for a
+ #      persistent key-value cache on disk with a time-to-live and least recently
+ #      used eviction.  Here is the list:
+ #
+ #  set_cache_file_path
+ #
+ #  return_cache_connection
+ #  close_cache_connection
+ #
+ #  return_cached_values_dictionary
+ #  store_cached_values
+ #  evict_cached_values
+ #  clear_cache
+ #
+ #  return_cache_statistics_dictionary
+ #  reset_cache_statistics
+ #
+ #
+ #  Date            Description                             Programmer
+ #  ----------      ------------------------------------    ------------------
+ #  10/18/2026      Initial Development                     Nicholas J. George
+ #
+ #******************************************************************************************/
+
+import json
+import os
+import sqlite3
+import threading
+import time
+
+
+# In[2]:
+
+
+CONSTANT_LOCAL_FILE_NAME = 'cachex.py'
+
+
+# In[3]:
+
+
+CONSTANT_SQL_VARIABLE_LIMIT = 500
+
+
+CACHE_FILE_PATH = './resources/api_cache.sqlite'
+
+CACHE_CONNECTION = None
+
+CACHE_LOCK = threading.Lock()
+
+
+CACHE_STATISTICS_DICTIONARY = {}
+
+
+# In[4]:
+
+
+#*******************************************************************************************
+ #
+ #  Function Name:  set_cache_file_path
+ #
+ #  Function Description:
+ #      This subroutine sets the path of the cache database file and closes any
+ #      open connection to the previous file.
+ #
+ #
+ #  Return Type: n/a
+ #
+ #
+ #  Function Parameters:
+ #
+ #  Type    Name            Description
+ #  -----   -------------   ----------------------------------------------
+ #  string  file_path_string
+ #                          The parameter is the cache database file path.
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def set_cache_file_path(file_path_string):
+
+    global CACHE_FILE_PATH
+
+
+    close_cache_connection()
+
+    CACHE_FILE_PATH = file_path_string
+
+
+# In[5]:
+
+
+#*******************************************************************************************
+ #
+ #  Function Name:  return_cache_connection
+ #
+ #  Function Description:
+ #      This function returns the connection to the cache database, creating the
+ #      file and its table on first use.  Callers must hold the cache lock.
+ #
+ #
+ #  Return Type: connection
+ #
+ #
+ #  Function Parameters:
+ #
+ #  Type    Name            Description
+ #  -----   -------------   ----------------------------------------------
+ #  n/a     n/a             n/a
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def return_cache_connection():
+
+    global CACHE_CONNECTION
+
+
+    if CACHE_CONNECTION is None:
+
+        directory_string = os.path.dirname(CACHE_FILE_PATH)
+
+        if directory_string != '':
+
+            os.makedirs(directory_string, exist_ok = True)
+
+
+        CACHE_CONNECTION = sqlite3.connect(CACHE_FILE_PATH, check_same_thread = False)
+
+        CACHE_CONNECTION.execute('PRAGMA journal_mode = WAL')
+
+        CACHE_CONNECTION.execute('PRAGMA synchronous = NORMAL')
+
+        CACHE_CONNECTION.execute \
+            ('CREATE TABLE IF NOT EXISTS cache ' \
+             + '(namespace TEXT NOT NULL, key TEXT NOT NULL, value TEXT NOT NULL, ' \
+             + 'stored_time REAL NOT NULL, access_time REAL NOT NULL, ' \
+             + 'PRIMARY KEY (namespace, key)) WITHOUT ROWID')
+
+        CACHE_CONNECTION.execute \
+            ('CREATE INDEX IF NOT EXISTS cache_access_time_index ' \
+             + 'ON cache (namespace, access_time)')
+
+        CACHE_CONNECTION.commit()
+
+
+    return CACHE_CONNECTION
+
+
+# In[6]:
+
+
+#*******************************************************************************************
+ #
+ #  Function Name:  close_cache_connection
+ #
+ #  Function Description:
+ #      This subroutine closes the connection to the cache database.
+ #
+ #
+ #  Return Type: n/a
+ #
+ #
+ #  Function Parameters:
+ #
+ #  Type    Name            Description
+ #  -----   -------------   ----------------------------------------------
+ #  n/a     n/a             n/a
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def close_cache_connection():
+
+    global CACHE_CONNECTION
+
+
+    with CACHE_LOCK:
+
+        if CACHE_CONNECTION is not None:
+
+            CACHE_CONNECTION.close()
+
+            CACHE_CONNECTION = None
+
+
+# In[7]:
+
+
+#*******************************************************************************************
+ #
+ #  Function Name:  return_cached_values_dictionary
+ #
+ #  Function Description:
+ #      This function looks up a list of keys in one namespace of the cache and
+ #      returns a dictionary of the values stored within the time-to-live; it also
+ #      marks those entries as recently used and updates the hit and miss counters.
+ #
+ #
+ #  Return Type: dictionary
+ #
+ #
+ #  Function Parameters:
+ #
+ #  Type    Name            Description
+ #  -----   -------------   ----------------------------------------------
+ #  string  namespace_string
+ #                          The parameter is the cache namespace.
+ #  list    key_string_list The parameter is the list of keys.
+ #  float   ttl_seconds_float
+ #                          The parameter is the time-to-live in seconds.
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def return_cached_values_dictionary \
+        (namespace_string,
+         key_string_list,
+         ttl_seconds_float):
+
+    current_time_float = time.time()
+
+    cached_values_dictionary = {}
+
+
+    with CACHE_LOCK:
+
+        cache_connection = return_cache_connection()
+
+
+        for index in range(0, len(key_string_list), CONSTANT_SQL_VARIABLE_LIMIT):
+
+            chunk_key_string_list \
+                = key_string_list[index:index + CONSTANT_SQL_VARIABLE_LIMIT]
+
+            row_tuple_list \
+                = cache_connection.execute \
+                    ('SELECT key, value, stored_time FROM cache ' \
+                     + 'WHERE namespace = ? AND key IN ' \
+                     + f"({', '.join('?' * len(chunk_key_string_list))})",
+                     [namespace_string] + chunk_key_string_list) \
+                    .fetchall()
+
+            for key_string, value_string, stored_time_float in row_tuple_list:
+
+                if current_time_float - stored_time_float <= ttl_seconds_float:
+
+                    cached_values_dictionary[key_string] = json.loads(value_string)
+
+
+        cache_connection.executemany \
+            ('UPDATE cache SET access_time = ? WHERE namespace = ? AND key = ?',
+             [(current_time_float, namespace_string, key_string)
+              for key_string in cached_values_dictionary])
+
+        cache_connection.commit()
+
+
+        statistics_dictionary \
+            = CACHE_STATISTICS_DICTIONARY.setdefault \
+                (namespace_string, {'hits': 0, 'misses': 0})
+
+        statistics_dictionary['hits'] += len(cached_values_dictionary)
+
+        statistics_dictionary['misses'] \
+            += len(set(key_string_list)) - len(cached_values_dictionary)
+
+
+    return cached_values_dictionary
+
+
+# In[8]:
+
+
+#*******************************************************************************************
+ #
+ #  Function Name:  store_cached_values
+ #
+ #  Function Description:
+ #      This subroutine stores a dictionary of values in one namespace of the cache
+ #      and then evicts the least recently used entries beyond the maximum.
+ #
+ #
+ #  Return Type: n/a
+ #
+ #
+ #  Function Parameters:
+ #
+ #  Type    Name            Description
+ #  -----   -------------   ----------------------------------------------
+ #  string  namespace_string
+ #                          The parameter is the cache namespace.
+ #  dictionary
+ #          values_dictionary
+ #                          The parameter is the dictionary of keys and JSON-compatible
+ #                          values.
+ #  integer maximum_entries_integer
+ #                          The parameter is the maximum number of entries in the namespace.
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def store_cached_values \
+        (namespace_string,
+         values_dictionary,
+         maximum_entries_integer):
+
+    current_time_float = time.time()
+
+
+    with CACHE_LOCK:
+
+        cache_connection = return_cache_connection()
+
+        cache_connection.executemany \
+            ('INSERT OR REPLACE INTO cache ' \
+             + '(namespace, key, value, stored_time, access_time) VALUES (?, ?, ?, ?, ?)',
+             [(namespace_string, key_string, json.dumps(value),
+               current_time_float, current_time_float)
+              for key_string, value in values_dictionary.items()])
+
+        cache_connection.commit()
+
+
+    evict_cached_values(namespace_string, maximum_entries_integer)
+
+
+# In[9]:
+
+
+#*******************************************************************************************
+ #
+ #  Function Name:  evict_cached_values
+ #
+ #  Function Description:
+ #      This subroutine deletes the least recently used entries in one namespace
+ #      of the cache until no more than the maximum number remain.
+ #
+ #
+ #  Return Type: n/a
+ #
+ #
+ #  Function Parameters:
+ #
+ #  Type    Name            Description
+ #  -----   -------------   ----------------------------------------------
+ #  string  namespace_string
+ #                          The parameter is the cache namespace.
+ #  integer maximum_entries_integer
+ #                          The parameter is the maximum number of entries in the namespace.
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def evict_cached_values \
+        (namespace_string,
+         maximum_entries_integer):
+
+    with CACHE_LOCK:
+
+        cache_connection = return_cache_connection()
+
+        entry_count_integer \
+            = cache_connection.execute \
+                ('SELECT COUNT(*) FROM cache WHERE namespace = ?', (namespace_string,)) \
+                .fetchone()[0]
+
+
+        if entry_count_integer > maximum_entries_integer:
+
+            cache_connection.execute \
+                ('DELETE FROM cache WHERE namespace = ? AND key IN ' \
+                 + '(SELECT key FROM cache WHERE namespace = ? ' \
+                 + 'ORDER BY access_time LIMIT ?)',
+                 (namespace_string, namespace_string,
+                  entry_count_integer - maximum_entries_integer))
+
+            cache_connection.commit()
+
+
+# In[10]:
+
+
+#*******************************************************************************************
+ #
+ #  Function Name:  clear_cache
+ #
+ #  Function Description:
+ #      This subroutine deletes every entry in one namespace of the cache or, if
+ #      the namespace is None, the entire cache.
+ #
+ #
+ #  Return Type: n/a
+ #
+ #
+ #  Function Parameters:
+ #
+ #  Type    Name            Description
+ #  -----   -------------   ----------------------------------------------
+ #  string  namespace_string
+ #                          The parameter is the cache namespace.
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def clear_cache(namespace_string = None):
+
+    with CACHE_LOCK:
+
+        cache_connection = return_cache_connection()
+
+        if namespace_string is None:
+
+            cache_connection.execute('DELETE FROM cache')
+
+        else:
+
+            cache_connection.execute \
+                ('DELETE FROM cache WHERE namespace = ?', (namespace_string,))
+
+        cache_connection.commit()
+
+
+# In[11]:
+
+
+#*******************************************************************************************
+ #
+ #  Function Name:  return_cache_statistics_dictionary
+ #
+ #  Function Description:
+ #      This function returns the hit and miss counts for one namespace of the cache.
+ #
+ #
+ #  Return Type: dictionary
+ #
+ #
+ #  Function Parameters:
+ #
+ #  Type    Name            Description
+ #  -----   -------------   ----------------------------------------------
+ #  string  namespace_string
+ #                          The parameter is the cache namespace.
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def return_cache_statistics_dictionary(namespace_string):
+
+    with CACHE_LOCK:
+
+        return \
+            dict(CACHE_STATISTICS_DICTIONARY.get \
+                     (namespace_string, {'hits': 0, 'misses': 0}))
+
+
+# In[12]:
+
+
+#*******************************************************************************************
+ #
+ #  Function Name:  reset_cache_statistics
+ #
+ #  Function Description:
+ #      This subroutine sets the hit and miss counts for one namespace to zero.
+ #
+ #
+ #  Return Type: n/a
+ #
+ #
+ #  Function Parameters:
+ #
+ #  Type    Name            Description
+ #  -----   -------------   ----------------------------------------------
+ #  string  namespace_string
+ #                          The parameter is the cache namespace.
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def reset_cache_statistics(namespace_string):
+
+    with CACHE_LOCK:
+
+        CACHE_STATISTICS_DICTIONARY[namespace_string] = {'hits': 0, 'misses': 0}
+
+
+# In[ ]:
+
+
+
+
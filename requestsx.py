@@ -0,0 +1,893 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+# In[1]:
+
+
+#*******************************************************************************************
+ #
+ #  File Name:  requestsx.py
+ #
+ #  File Description:
+ #      This Python script, requestsx.py, contains generic Python functions for
+ #      sending HTTP requests through one shared session with keep-alive connection
+ #      pooling, per-host adaptive rate limits, and retries with backoff, and for 
+ #      decoding JSON responses with the fastest installed parser.  
+ #      Here is the list:
+ #
+ #  set_http_pool_sizes
+ #
+ #  return_http_session
+ #  close_http_session
+ #
+ #  set_rate_limit
+ #  acquire_rate_limit_token
+ #  update_rate_limit
+ #
+ #  return_retry_wait_seconds
+ #  return_http_response_and_status
+ #
+ #  set_json_decoder
+ #  return_json_dictionary
+ #
+ #  increment_connection_statistic
+ #  return_connection_statistics_dictionary
+ #  reset_connection_statistics
+ #
+ #
+ #  Date            Description                             Programmer
+ #  ----------      ------------------------------------    ------------------
+ #  10/18/2026      Initial Development                     Nicholas J. George
+ #
+ #******************************************************************************************/
+
+import weather_constants
+
+import json
+import random
+import threading
+import time
+
+import requests
+
+from datetime import datetime
+from datetime import timezone
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlparse
+
+from requests.adapters import HTTPAdapter
+from urllib3.connectionpool import HTTPConnectionPool
+from urllib3.connectionpool import HTTPSConnectionPool
+
+try:
+
+    import orjson
+
+except ImportError:
+
+    orjson = None
+
+
+# In[2]:
+
+
+CONSTANT_LOCAL_FILE_NAME = 'requestsx.py'
+
+
+# In[3]:
+
+
+POOL_CONNECTIONS_INTEGER = 10
+
+POOL_MAXSIZE_INTEGER = 64
+
+POOL_BLOCK_BOOLEAN = True
+
+TIMEOUT_SECONDS_FLOAT = 30.0
+
+
+MAXIMUM_RETRY_COUNT_INTEGER = 5
+
+BACKOFF_BASE_SECONDS_FLOAT = 0.5
+
+BACKOFF_MAXIMUM_SECONDS_FLOAT = 60.0
+
+MINIMUM_RATE_FRACTION_FLOAT = 0.05
+
+RATE_INCREASE_FRACTION_FLOAT = 0.01
+
+DEFAULT_RATE_LIMIT_DICTIONARY \
+    = {urlparse(weather_constants.CONSTANT_OPEN_WEATHERMAP_WEBSITE).hostname: 
+           weather_constants.CONSTANT_OPEN_WEATHERMAP_REQUESTS_PER_SECOND,
+       urlparse(weather_constants.CONSTANT_GEOAPIFY_WEBSITE).hostname: 
+           weather_constants.CONSTANT_GEOAPIFY_REQUESTS_PER_SECOND}
+
+
+RESPONSE_STATUS_OK = 'ok'
+
+RESPONSE_STATUS_NOT_FOUND = 'not_found'
+
+RESPONSE_STATUS_THROTTLED = 'throttled'
+
+RESPONSE_STATUS_NETWORK_ERROR = 'network_error'
+
+RESPONSE_STATUS_CLIENT_ERROR = 'client_error'
+
+
+HTTP_SESSION = None
+
+SESSION_LOCK = threading.Lock()
+
+
+RATE_LIMIT_DICTIONARY = {}
+
+RATE_LIMIT_LOCK = threading.Lock()
+
+
+CONNECTION_STATISTICS_DICTIONARY = {'requests': 0, 'connections_opened': 0}
+
+STATISTICS_LOCK = threading.Lock()
+
+
+JSON_DECODER_STRING = 'json' if orjson is None else 'orjson'
+
+
+# In[4]:
+
+
+#*******************************************************************************************
+ #
+ #  Class Name:  CountingHTTPConnectionPool, CountingHTTPSConnectionPool
+ #
+ #  Class Description:
+ #      These classes are urllib3 connection pools that count every new connection
+ #      they open so the session can report connections opened versus reused.
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+class CountingHTTPConnectionPool(HTTPConnectionPool):
+
+    def _new_conn(self):
+
+        increment_connection_statistic('connections_opened')
+
+        return super()._new_conn()
+
+
+class CountingHTTPSConnectionPool(HTTPSConnectionPool):
+
+    def _new_conn(self):
+
+        increment_connection_statistic('connections_opened')
+
+        return super()._new_conn()
+
+
+# In[5]:
+
+
+#*******************************************************************************************
+ #
+ #  Function Name:  set_http_pool_sizes
+ #
+ #  Function Description:
+ #      This subroutine sets the number of per-host pools the session keeps, the
+ #      maximum number of connections per host, and whether callers wait for a free
+ #      connection when a host is at its limit.  The next request builds a new session.
+ #
+ #
+ #  Return Type: n/a
+ #
+ #
+ #  Function Parameters:
+ #
+ #  Type    Name            Description
+ #  -----   -------------   ----------------------------------------------
+ #  integer pool_connections_integer
+ #                          The parameter is the number of per-host pools to cache.
+ #  integer pool_maxsize_integer
+ #                          The parameter is the maximum number of connections per host.
+ #  boolean pool_block_boolean
+ #                          The parameter indicates whether to block at the per-host limit.
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def set_http_pool_sizes \
+        (pool_connections_integer = 10,
+         pool_maxsize_integer = 64,
+         pool_block_boolean = True):
+
+    global POOL_CONNECTIONS_INTEGER
+
+    global POOL_MAXSIZE_INTEGER
+
+    global POOL_BLOCK_BOOLEAN
+
+
+    POOL_CONNECTIONS_INTEGER = pool_connections_integer
+
+    POOL_MAXSIZE_INTEGER = pool_maxsize_integer
+
+    POOL_BLOCK_BOOLEAN = pool_block_boolean
+
+
+    close_http_session()
+
+
+# In[6]:
+
+
+#*******************************************************************************************
+ #
+ #  Function Name:  return_http_session
+ #
+ #  Function Description:
+ #      This function returns the shared requests session, creating it with the
+ #      current pool sizes on first use.
+ #
+ #
+ #  Return Type: session
+ #
+ #
+ #  Function Parameters:
+ #
+ #  Type    Name            Description
+ #  -----   -------------   ----------------------------------------------
+ #  n/a     n/a             n/a
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def return_http_session():
+
+    global HTTP_SESSION
+
+
+    with SESSION_LOCK:
+
+        if HTTP_SESSION is None:
+
+            http_adapter \
+                = HTTPAdapter \
+                    (pool_connections = POOL_CONNECTIONS_INTEGER,
+                     pool_maxsize = POOL_MAXSIZE_INTEGER,
+                     pool_block = POOL_BLOCK_BOOLEAN)
+
+            http_adapter.poolmanager.pool_classes_by_scheme \
+                = {'http': CountingHTTPConnectionPool,
+                   'https': CountingHTTPSConnectionPool}
+
+
+            HTTP_SESSION = requests.Session()
+
+            HTTP_SESSION.mount('http://', http_adapter)
+
+            HTTP_SESSION.mount('https://', http_adapter)
+
+
+        return HTTP_SESSION
+
+
+# In[7]:
+
+
+#*******************************************************************************************
+ #
+ #  Function Name:  close_http_session
+ #
+ #  Function Description:
+ #      This subroutine closes the shared session and all of its pooled connections.
+ #
+ #
+ #  Return Type: n/a
+ #
+ #
+ #  Function Parameters:
+ #
+ #  Type    Name            Description
+ #  -----   -------------   ----------------------------------------------
+ #  n/a     n/a             n/a
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def close_http_session():
+
+    global HTTP_SESSION
+
+
+    with SESSION_LOCK:
+
+        if HTTP_SESSION is not None:
+
+            HTTP_SESSION.close()
+
+            HTTP_SESSION = None
+
+
+# In[8]:
+
+
+#*******************************************************************************************
+ #
+ #  Function Name:  set_rate_limit
+ #
+ #  Function Description:
+ #      This subroutine sets the request rate ceiling and burst size of the token 
+ #      bucket for one host; None removes the limit.
+ #
+ #
+ #  Return Type: n/a
+ #
+ #
+ #  Function Parameters:
+ #
+ #  Type    Name            Description
+ #  -----   -------------   ----------------------------------------------
+ #  string  host_string     The parameter is the host name.
+ #  float   requests_per_second_float
+ #                          The parameter is the rate ceiling in requests per second.
+ #  integer burst_integer   The parameter is the bucket capacity (None uses the rate).
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def set_rate_limit \
+        (host_string,
+         requests_per_second_float,
+         burst_integer = None):
+
+    with RATE_LIMIT_LOCK:
+
+        if requests_per_second_float is None:
+
+            RATE_LIMIT_DICTIONARY.pop(host_string, None)
+
+            return
+
+
+        if burst_integer is None:
+
+            burst_integer = max(int(requests_per_second_float), 1)
+
+
+        RATE_LIMIT_DICTIONARY[host_string] \
+            = {'ceiling_rate': float(requests_per_second_float),
+               'current_rate': float(requests_per_second_float),
+               'capacity': float(burst_integer),
+               'tokens': float(burst_integer),
+               'update_time': time.monotonic()}
+
+
+# In[9]:
+
+
+#*******************************************************************************************
+ #
+ #  Function Name:  acquire_rate_limit_token
+ #
+ #  Function Description:
+ #      This subroutine waits until the token bucket for a host has a token and 
+ #      then takes it; hosts without a rate limit return immediately.
+ #
+ #
+ #  Return Type: n/a
+ #
+ #
+ #  Function Parameters:
+ #
+ #  Type    Name            Description
+ #  -----   -------------   ----------------------------------------------
+ #  string  host_string     The parameter is the host name.
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def acquire_rate_limit_token(host_string):
+
+    while True:
+
+        with RATE_LIMIT_LOCK:
+
+            rate_limit_dictionary = RATE_LIMIT_DICTIONARY.get(host_string)
+
+            if rate_limit_dictionary is None:
+
+                return
+
+
+            current_time_float = time.monotonic()
+
+            rate_limit_dictionary['tokens'] \
+                = min(rate_limit_dictionary['capacity'],
+                      rate_limit_dictionary['tokens'] 
+                      + (current_time_float - rate_limit_dictionary['update_time']) 
+                        * rate_limit_dictionary['current_rate'])
+
+            rate_limit_dictionary['update_time'] = current_time_float
+
+
+            if rate_limit_dictionary['tokens'] >= 1.0:
+
+                rate_limit_dictionary['tokens'] -= 1.0
+
+                return
+
+
+            wait_seconds_float \
+                = (1.0 - rate_limit_dictionary['tokens']) \
+                  / rate_limit_dictionary['current_rate']
+
+
+        time.sleep(wait_seconds_float)
+
+
+# In[10]:
+
+
+#*******************************************************************************************
+ #
+ #  Function Name:  update_rate_limit
+ #
+ #  Function Description:
+ #      This subroutine adapts the current rate for a host: a throttled response 
+ #      halves it and empties the bucket, and a successful response raises it by 
+ #      a step toward the ceiling.
+ #
+ #
+ #  Return Type: n/a
+ #
+ #
+ #  Function Parameters:
+ #
+ #  Type    Name            Description
+ #  -----   -------------   ----------------------------------------------
+ #  string  host_string     The parameter is the host name.
+ #  boolean throttled_boolean
+ #                          The parameter indicates whether the host throttled the request.
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def update_rate_limit \
+        (host_string,
+         throttled_boolean):
+
+    with RATE_LIMIT_LOCK:
+
+        rate_limit_dictionary = RATE_LIMIT_DICTIONARY.get(host_string)
+
+        if rate_limit_dictionary is None:
+
+            return
+
+
+        if throttled_boolean == True:
+
+            rate_limit_dictionary['current_rate'] \
+                = max(rate_limit_dictionary['current_rate'] * 0.5,
+                      rate_limit_dictionary['ceiling_rate'] * MINIMUM_RATE_FRACTION_FLOAT)
+
+            rate_limit_dictionary['tokens'] = 0.0
+
+        else:
+
+            rate_limit_dictionary['current_rate'] \
+                = min(rate_limit_dictionary['current_rate'] 
+                      + rate_limit_dictionary['ceiling_rate'] * RATE_INCREASE_FRACTION_FLOAT,
+                      rate_limit_dictionary['ceiling_rate'])
+
+
+# In[11]:
+
+
+#*******************************************************************************************
+ #
+ #  Function Name:  return_retry_wait_seconds
+ #
+ #  Function Description:
+ #      This function returns how long to wait before a retry: the Retry-After 
+ #      header if the response has one, otherwise exponential backoff with full 
+ #      jitter.
+ #
+ #
+ #  Return Type: float
+ #
+ #
+ #  Function Parameters:
+ #
+ #  Type    Name            Description
+ #  -----   -------------   ----------------------------------------------
+ #  response
+ #          http_response   The parameter is the response (None after a network error).
+ #  integer attempt_integer The parameter is the zero-based attempt number.
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def return_retry_wait_seconds \
+        (http_response,
+         attempt_integer):
+
+    if http_response is not None and 'Retry-After' in http_response.headers:
+
+        retry_after_string = http_response.headers['Retry-After']
+
+        try:
+
+            return min(float(retry_after_string), BACKOFF_MAXIMUM_SECONDS_FLOAT)
+
+        except ValueError:
+
+            try:
+
+                retry_datetime = parsedate_to_datetime(retry_after_string)
+
+                return \
+                    min(max((retry_datetime - datetime.now(timezone.utc)).total_seconds(), 0.0),
+                        BACKOFF_MAXIMUM_SECONDS_FLOAT)
+
+            except (TypeError, ValueError):
+
+                pass
+
+
+    return \
+        random.uniform \
+            (0.0, 
+             min(BACKOFF_BASE_SECONDS_FLOAT * 2 ** attempt_integer, 
+                 BACKOFF_MAXIMUM_SECONDS_FLOAT))
+
+
+# In[12]:
+
+
+#*******************************************************************************************
+ #
+ #  Function Name:  return_http_response_and_status
+ #
+ #  Function Description:
+ #      This function sends a GET request through the shared session under the 
+ #      host's rate limit, retries throttled, server, and network failures with 
+ #      backoff, and returns the last response with one of these statuses: ok, 
+ #      not_found, throttled, network_error, or client_error.
+ #
+ #
+ #  Return Type: tuple
+ #
+ #
+ #  Function Parameters:
+ #
+ #  Type    Name            Description
+ #  -----   -------------   ----------------------------------------------
+ #  string  url_string      The parameter is the request url.
+ #  dictionary
+ #          parameters_dictionary
+ #                          The parameter is the dictionary of query parameters.
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def return_http_response_and_status \
+        (url_string,
+         parameters_dictionary = None):
+
+    host_string = urlparse(url_string).hostname
+
+    http_response = None
+
+    status_string = RESPONSE_STATUS_NETWORK_ERROR
+
+
+    for attempt_integer in range(MAXIMUM_RETRY_COUNT_INTEGER + 1):
+
+        if attempt_integer > 0:
+
+            time.sleep(return_retry_wait_seconds(http_response, attempt_integer - 1))
+
+
+        acquire_rate_limit_token(host_string)
+
+        increment_connection_statistic('requests')
+
+
+        try:
+
+            http_response \
+                = return_http_session().get \
+                    (url_string, 
+                     params = parameters_dictionary, 
+                     timeout = TIMEOUT_SECONDS_FLOAT)
+
+        except requests.RequestException:
+
+            http_response = None
+
+            status_string = RESPONSE_STATUS_NETWORK_ERROR
+
+            continue
+
+
+        if http_response.status_code == 429:
+
+            update_rate_limit(host_string, True)
+
+            status_string = RESPONSE_STATUS_THROTTLED
+
+            continue
+
+        elif http_response.status_code >= 500:
+
+            status_string = RESPONSE_STATUS_NETWORK_ERROR
+
+            continue
+
+
+        update_rate_limit(host_string, False)
+
+        if http_response.status_code == 404:
+
+            return http_response, RESPONSE_STATUS_NOT_FOUND
+
+        elif http_response.status_code >= 400:
+
+            return http_response, RESPONSE_STATUS_CLIENT_ERROR
+
+        else:
+
+            return http_response, RESPONSE_STATUS_OK
+
+
+    return http_response, status_string
+
+
+# In[13]:
+
+
+#*******************************************************************************************
+ #
+ #  Function Name:  set_json_decoder
+ #
+ #  Function Description:
+ #      This subroutine selects the JSON parser for responses: orjson, which is 
+ #      the default when it is installed, or json from the standard library.
+ #
+ #
+ #  Return Type: n/a
+ #
+ #
+ #  Function Parameters:
+ #
+ #  Type    Name            Description
+ #  -----   -------------   ----------------------------------------------
+ #  string  decoder_string  The parameter is the parser name: 'orjson' or 'json'.
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def set_json_decoder(decoder_string):
+
+    global JSON_DECODER_STRING
+
+
+    if decoder_string not in ['orjson', 'json']:
+
+        raise ValueError(f'The JSON decoder, {decoder_string}, is not valid.')
+
+    elif decoder_string == 'orjson' and orjson is None:
+
+        raise ValueError('The JSON decoder, orjson, is not installed.')
+
+
+    JSON_DECODER_STRING = decoder_string
+
+
+# In[14]:
+
+
+#*******************************************************************************************
+ #
+ #  Function Name:  return_json_dictionary
+ #
+ #  Function Description:
+ #      This function decodes the raw bytes of a JSON response with the selected 
+ #      parser; unlike response.json, it skips character set detection because 
+ #      both APIs send UTF-8.  Only the parser changes: it still decodes the whole 
+ #      document, and the callers pick out the fields they use afterward.
+ #
+ #
+ #  Return Type: dictionary
+ #
+ #
+ #  Function Parameters:
+ #
+ #  Type    Name            Description
+ #  -----   -------------   ----------------------------------------------
+ #  bytes   content_bytes   The parameter is the response body.
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def return_json_dictionary(content_bytes):
+
+    if JSON_DECODER_STRING == 'orjson':
+
+        return orjson.loads(content_bytes)
+
+    else:
+
+        return json.loads(content_bytes)
+
+
+# In[15]:
+
+
+#*******************************************************************************************
+ #
+ #  Function Name:  increment_connection_statistic
+ #
+ #  Function Description:
+ #      This subroutine increments one of the connection statistics counters.
+ #
+ #
+ #  Return Type: n/a
+ #
+ #
+ #  Function Parameters:
+ #
+ #  Type    Name            Description
+ #  -----   -------------   ----------------------------------------------
+ #  string  key_string      The parameter is the counter name.
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def increment_connection_statistic(key_string):
+
+    with STATISTICS_LOCK:
+
+        CONNECTION_STATISTICS_DICTIONARY[key_string] += 1
+
+
+# In[16]:
+
+
+#*******************************************************************************************
+ #
+ #  Function Name:  return_connection_statistics_dictionary
+ #
+ #  Function Description:
+ #      This function returns the number of requests sent, connections opened, and
+ #      connections reused since the last reset.
+ #
+ #
+ #  Return Type: dictionary
+ #
+ #
+ #  Function Parameters:
+ #
+ #  Type    Name            Description
+ #  -----   -------------   ----------------------------------------------
+ #  n/a     n/a             n/a
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def return_connection_statistics_dictionary():
+
+    with STATISTICS_LOCK:
+
+        requests_integer = CONNECTION_STATISTICS_DICTIONARY['requests']
+
+        connections_opened_integer = CONNECTION_STATISTICS_DICTIONARY['connections_opened']
+
+
+    return \
+        {'requests': requests_integer,
+         'connections_opened': connections_opened_integer,
+         'connections_reused': max(requests_integer - connections_opened_integer, 0)}
+
+
+# In[17]:
+
+
+#*******************************************************************************************
+ #
+ #  Function Name:  reset_connection_statistics
+ #
+ #  Function Description:
+ #      This subroutine sets the connection statistics counters to zero.
+ #
+ #
+ #  Return Type: n/a
+ #
+ #
+ #  Function Parameters:
+ #
+ #  Type    Name            Description
+ #  -----   -------------   ----------------------------------------------
+ #  n/a     n/a             n/a
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def reset_connection_statistics():
+
+    with STATISTICS_LOCK:
+
+        for key_string in CONNECTION_STATISTICS_DICTIONARY:
+
+            CONNECTION_STATISTICS_DICTIONARY[key_string] = 0
+
+
+# In[18]:
+
+
+for host_string, requests_per_second_float in DEFAULT_RATE_LIMIT_DICTIONARY.items():
+
+    set_rate_limit(host_string, requests_per_second_float)
+
+
+# In[ ]:
+
+
+
+
@@ -0,0 +1,447 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+# In[1]:
+
+
+#*******************************************************************************************
+ #
+ #  File Name:  spatialx.py
+ #
+ #  File Description:
+ #      This Python script, spatialx.py, contains generic Python functions for
+ #      geographic coordinates and spatial indices.  Here is the list:
+ #
+ #  return_unit_vector_array
+ #  return_haversine_distance_array
+ #  return_cluster_tuple
+ #  return_grid_index_dictionary
+ #  return_grid_candidate_index_array
+ #
+ #
+ #  Date            Description                             Programmer
+ #  ----------      ------------------------------------    ------------------
+ #  10/18/2026      Initial Development                     Nicholas J. George
+ #
+ #******************************************************************************************/
+
+import numpy as np
+
+from scipy.spatial import KDTree
+
+
+# In[2]:
+
+
+CONSTANT_LOCAL_FILE_NAME = 'spatialx.py'
+
+
+# In[3]:
+
+
+CONSTANT_EARTH_RADIUS_METERS = 6371008.8
+
+
+# In[4]:
+
+
+#*******************************************************************************************
+ #
+ #  Function Name:  return_unit_vector_array
+ #
+ #  Function Description:
+ #      This function converts latitudes and longitudes in degrees to 3D unit vectors
+ #      on the sphere; the straight-line distance between two vectors increases with
+ #      the great-circle distance, so a Euclidean spatial index over the vectors
+ #      answers haversine nearest-neighbor queries.
+ #
+ #
+ #  Return Type: numpy array
+ #
+ #
+ #  Function Parameters:
+ #
+ #  Type    Name            Description
+ #  -----   -------------   ----------------------------------------------
+ #  numpy array
+ #          latitude_float_array
+ #                          The parameter is the array of latitudes in degrees.
+ #  numpy array
+ #          longitude_float_array
+ #                          The parameter is the array of longitudes in degrees.
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def return_unit_vector_array \
+        (latitude_float_array,
+         longitude_float_array):
+
+    latitude_radians_array = np.radians(np.asarray(latitude_float_array, dtype = np.float64))
+
+    longitude_radians_array = np.radians(np.asarray(longitude_float_array, dtype = np.float64))
+
+    cosine_latitude_array = np.cos(latitude_radians_array)
+
+
+    return \
+        np.column_stack \
+            ((cosine_latitude_array * np.cos(longitude_radians_array),
+              cosine_latitude_array * np.sin(longitude_radians_array),
+              np.sin(latitude_radians_array)))
+
+
+# In[5]:
+
+
+#*******************************************************************************************
+ #
+ #  Function Name:  return_haversine_distance_array
+ #
+ #  Function Description:
+ #      This function returns the great-circle distances in meters between two sets 
+ #      of coordinates in degrees; the arrays broadcast against each other.
+ #
+ #
+ #  Return Type: numpy array
+ #
+ #
+ #  Function Parameters:
+ #
+ #  Type    Name            Description
+ #  -----   -------------   ----------------------------------------------
+ #  numpy array
+ #          first_latitude_float_array
+ #                          The parameter is the first array of latitudes in degrees.
+ #  numpy array
+ #          first_longitude_float_array
+ #                          The parameter is the first array of longitudes in degrees.
+ #  numpy array
+ #          second_latitude_float_array
+ #                          The parameter is the second array of latitudes in degrees.
+ #  numpy array
+ #          second_longitude_float_array
+ #                          The parameter is the second array of longitudes in degrees.
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def return_haversine_distance_array \
+        (first_latitude_float_array,
+         first_longitude_float_array,
+         second_latitude_float_array,
+         second_longitude_float_array):
+
+    first_latitude_radians_array \
+        = np.radians(np.asarray(first_latitude_float_array, dtype = np.float64))
+
+    second_latitude_radians_array \
+        = np.radians(np.asarray(second_latitude_float_array, dtype = np.float64))
+
+    longitude_difference_radians_array \
+        = np.radians \
+            (np.asarray(second_longitude_float_array, dtype = np.float64) 
+             - np.asarray(first_longitude_float_array, dtype = np.float64))
+
+
+    haversine_float_array \
+        = np.sin((second_latitude_radians_array - first_latitude_radians_array) / 2.0) ** 2 \
+          + np.cos(first_latitude_radians_array) \
+            * np.cos(second_latitude_radians_array) \
+            * np.sin(longitude_difference_radians_array / 2.0) ** 2
+
+
+    return \
+        2.0 * CONSTANT_EARTH_RADIUS_METERS \
+        * np.arcsin(np.sqrt(np.clip(haversine_float_array, 0.0, 1.0)))
+
+
+# In[6]:
+
+
+#*******************************************************************************************
+ #
+ #  Function Name:  return_cluster_tuple
+ #
+ #  Function Description:
+ #      This function groups coordinates into clusters whose members all lie within 
+ #      a radius of the cluster's first coordinate, its leader.  In input order, 
+ #      each coordinate not yet in a cluster becomes a leader and takes every 
+ #      unclustered coordinate within the radius, found with a KD-tree over unit 
+ #      vectors.  The function returns the cluster number of each coordinate and 
+ #      the index of each cluster's leader as a tuple.
+ #
+ #
+ #  Return Type: tuple
+ #
+ #
+ #  Function Parameters:
+ #
+ #  Type    Name            Description
+ #  -----   -------------   ----------------------------------------------
+ #  numpy array
+ #          latitude_float_array
+ #                          The parameter is the array of latitudes in degrees.
+ #  numpy array
+ #          longitude_float_array
+ #                          The parameter is the array of longitudes in degrees.
+ #  float   radius_meters_float
+ #                          The parameter is the cluster radius in meters.
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def return_cluster_tuple \
+        (latitude_float_array,
+         longitude_float_array,
+         radius_meters_float):
+
+    unit_vector_array = return_unit_vector_array(latitude_float_array, longitude_float_array)
+
+    unit_vector_kdtree = KDTree(unit_vector_array)
+
+    chord_length_float \
+        = 2.0 * np.sin(min(radius_meters_float / CONSTANT_EARTH_RADIUS_METERS, np.pi) / 2.0)
+
+
+    cluster_integer_array = np.full(len(unit_vector_array), -1, dtype = np.int64)
+
+    leader_index_integer_list = []
+
+
+    for index in range(len(unit_vector_array)):
+
+        if cluster_integer_array[index] >= 0:
+
+            continue
+
+
+        member_index_integer_array \
+            = np.asarray \
+                (unit_vector_kdtree.query_ball_point(unit_vector_array[index], chord_length_float),
+                 dtype = np.int64)
+
+        member_index_integer_array \
+            = member_index_integer_array[cluster_integer_array[member_index_integer_array] < 0]
+
+        cluster_integer_array[member_index_integer_array] = len(leader_index_integer_list)
+
+        cluster_integer_array[index] = len(leader_index_integer_list)
+
+        leader_index_integer_list.append(index)
+
+
+    return cluster_integer_array, np.array(leader_index_integer_list, dtype = np.int64)
+
+
+# In[7]:
+
+
+#*******************************************************************************************
+ #
+ #  Function Name:  return_grid_index_dictionary
+ #
+ #  Function Description:
+ #      This function builds a spatial index of coordinates in geohash-style 
+ #      buckets: grid cells of a fixed size in degrees.  It sorts the coordinate 
+ #      indices by cell and keeps the distinct cells with the start and stop 
+ #      offsets of their indices, so a lookup is a binary search per cell.
+ #
+ #
+ #  Return Type: dictionary
+ #
+ #
+ #  Function Parameters:
+ #
+ #  Type    Name            Description
+ #  -----   -------------   ----------------------------------------------
+ #  numpy array
+ #          latitude_float_array
+ #                          The parameter is the array of latitudes in degrees.
+ #  numpy array
+ #          longitude_float_array
+ #                          The parameter is the array of longitudes in degrees.
+ #  float   cell_degrees_float
+ #                          The parameter is the size of a grid cell in degrees.
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def return_grid_index_dictionary \
+        (latitude_float_array,
+         longitude_float_array,
+         cell_degrees_float):
+
+    latitude_cell_count_integer = int(np.ceil(180.0 / cell_degrees_float))
+
+    longitude_cell_count_integer = int(np.ceil(360.0 / cell_degrees_float))
+
+
+    latitude_cell_integer_array \
+        = np.clip \
+            (np.floor((np.asarray(latitude_float_array, dtype = np.float64) + 90.0) 
+                      / cell_degrees_float).astype(np.int64),
+             0, latitude_cell_count_integer - 1)
+
+    longitude_cell_integer_array \
+        = np.floor((np.asarray(longitude_float_array, dtype = np.float64) + 180.0) 
+                   / cell_degrees_float).astype(np.int64) % longitude_cell_count_integer
+
+    cell_key_integer_array \
+        = latitude_cell_integer_array * longitude_cell_count_integer \
+          + longitude_cell_integer_array
+
+
+    order_index_integer_array = np.argsort(cell_key_integer_array, kind = 'stable')
+
+    unique_cell_key_integer_array, start_integer_array \
+        = np.unique(cell_key_integer_array[order_index_integer_array], return_index = True)
+
+
+    return \
+        {'cell_degrees': cell_degrees_float,
+         'latitude_cell_count': latitude_cell_count_integer,
+         'longitude_cell_count': longitude_cell_count_integer,
+         'order_index_array': order_index_integer_array,
+         'cell_key_array': unique_cell_key_integer_array,
+         'start_array': start_integer_array,
+         'stop_array': np.append(start_integer_array[1:], len(order_index_integer_array))}
+
+
+# In[8]:
+
+
+#*******************************************************************************************
+ #
+ #  Function Name:  return_grid_candidate_index_array
+ #
+ #  Function Description:
+ #      This function returns the indices of the coordinates in a grid index whose 
+ #      cells overlap the bounding box of a circle: a superset of the coordinates 
+ #      within the radius, which the caller filters by distance.  Longitudes wrap 
+ #      at the antimeridian, and a circle reaching a pole takes every longitude.
+ #
+ #
+ #  Return Type: numpy array
+ #
+ #
+ #  Function Parameters:
+ #
+ #  Type    Name            Description
+ #  -----   -------------   ----------------------------------------------
+ #  dictionary
+ #          grid_index_dictionary
+ #                          The parameter is the grid index.
+ #  float   latitude_float  The parameter is the circle center latitude.
+ #  float   longitude_float The parameter is the circle center longitude.
+ #  float   radius_meters_float
+ #                          The parameter is the circle radius in meters.
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def return_grid_candidate_index_array \
+        (grid_index_dictionary,
+         latitude_float,
+         longitude_float,
+         radius_meters_float):
+
+    cell_degrees_float = grid_index_dictionary['cell_degrees']
+
+    longitude_cell_count_integer = grid_index_dictionary['longitude_cell_count']
+
+    radius_degrees_float = np.degrees(radius_meters_float / CONSTANT_EARTH_RADIUS_METERS)
+
+
+    latitude_cell_integer_array \
+        = np.arange \
+            (max(int(np.floor((latitude_float - radius_degrees_float + 90.0) 
+                              / cell_degrees_float)), 0),
+             min(int(np.floor((latitude_float + radius_degrees_float + 90.0) 
+                              / cell_degrees_float)), 
+                 grid_index_dictionary['latitude_cell_count'] - 1) + 1)
+
+    maximum_latitude_float = abs(latitude_float) + radius_degrees_float
+
+    if maximum_latitude_float < 90.0:
+
+        longitude_radius_degrees_float \
+            = radius_degrees_float / np.cos(np.radians(maximum_latitude_float))
+
+    else:
+
+        longitude_radius_degrees_float = 180.0
+
+
+    if longitude_radius_degrees_float >= 180.0:
+
+        longitude_cell_integer_array = np.arange(longitude_cell_count_integer)
+
+    else:
+
+        longitude_cell_integer_array \
+            = np.unique \
+                (np.arange \
+                    (int(np.floor((longitude_float - longitude_radius_degrees_float + 180.0) 
+                                  / cell_degrees_float)),
+                     int(np.floor((longitude_float + longitude_radius_degrees_float + 180.0) 
+                                  / cell_degrees_float)) + 1) 
+                 % longitude_cell_count_integer)
+
+
+    cell_key_integer_array \
+        = (latitude_cell_integer_array[:, None] * longitude_cell_count_integer 
+           + longitude_cell_integer_array[None, :]).ravel()
+
+    cell_key_array = grid_index_dictionary['cell_key_array']
+
+    if len(cell_key_array) == 0:
+
+        return np.empty(0, dtype = np.int64)
+
+
+    position_integer_array \
+        = np.minimum \
+            (np.searchsorted(cell_key_array, cell_key_integer_array), len(cell_key_array) - 1)
+
+    position_integer_array \
+        = position_integer_array[cell_key_array[position_integer_array] == cell_key_integer_array]
+
+
+    order_index_integer_array = grid_index_dictionary['order_index_array']
+
+    return \
+        np.concatenate \
+            ([order_index_integer_array[start_integer:stop_integer]
+              for start_integer, stop_integer 
+              in zip(grid_index_dictionary['start_array'][position_integer_array],
+                     grid_index_dictionary['stop_array'][position_integer_array])]
+             + [np.empty(0, dtype = np.int64)])
+
+
+# In[ ]:
+
+
+
+
+
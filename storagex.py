@@ -0,0 +1,625 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+# In[1]:
+
+
+#*******************************************************************************************
+ #
+ #  File Name:  storagex.py
+ #
+ #  File Description:
+ #      This Python script, storagex.py, contains Python functions for reading and
+ #      writing the city weather table as Parquet, Arrow IPC, or CSV files with an
+ #      explicit schema, column projection, and range filters, and for publishing
+ #      it as a memory-mapped Arrow snapshot.  Here is the list:
+ #
+ #  return_weather_arrow_schema
+ #  return_weather_file_format_string
+ #  return_weather_arrow_table
+ #  return_weather_filter_expression
+ #
+ #  write_weather_file
+ #  return_weather_dataframe_from_file
+ #
+ #  publish_weather_snapshot
+ #  refresh_weather_snapshot
+ #  return_weather_snapshot_table
+ #  return_weather_dataframe_from_snapshot
+ #
+ #
+ #  Date            Description                             Programmer
+ #  ----------      ------------------------------------    ------------------
+ #  10/18/2026      Initial Development                     Nicholas J. George
+ #
+ #******************************************************************************************/
+
+import weather_constants
+
+import os
+import tempfile
+
+import pyarrow as pa
+import pyarrow.csv as pacsv
+import pyarrow.dataset as ds
+import pyarrow.feather as feather
+import pyarrow.ipc as ipc
+import pyarrow.parquet as pq
+
+
+# In[2]:
+
+
+CONSTANT_LOCAL_FILE_NAME = 'storagex.py'
+
+
+# In[3]:
+
+
+CONSTANT_FILE_FORMAT_DICTIONARY \
+    = {'.parquet': 'parquet',
+       '.arrow': 'ipc',
+       '.feather': 'ipc',
+       '.csv': 'csv'}
+
+CONSTANT_PARQUET_ROW_GROUP_SIZE = 65536
+
+
+# In[4]:
+
+
+#*******************************************************************************************
+ #
+ #  Function Name:  return_weather_arrow_schema
+ #
+ #  Function Description:
+ #      This function returns the Arrow schema of the city weather table:
+ #      dictionary-encoded countries, float32 coordinates, small integers for
+ #      humidity and cloudiness, and timestamps in seconds.
+ #
+ #
+ #  Return Type: schema
+ #
+ #
+ #  Function Parameters:
+ #
+ #  Type    Name            Description
+ #  -----   -------------   ----------------------------------------------
+ #  n/a     n/a             n/a
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def return_weather_arrow_schema():
+
+    return \
+        pa.schema \
+            ([(weather_constants.CONSTANT_WEATHER_DATA_FILE_INDEX_NAME, pa.int64()),
+              ('city', pa.string()),
+              ('latitude', pa.float32()),
+              ('longitude', pa.float32()),
+              ('temperature', pa.float64()),
+              ('humidity', pa.uint8()),
+              ('cloudiness', pa.uint8()),
+              ('wind_speed', pa.float64()),
+              ('country', pa.dictionary(pa.int32(), pa.string())),
+              ('date_time', pa.timestamp('s'))])
+
+
+# In[5]:
+
+
+#*******************************************************************************************
+ #
+ #  Function Name:  return_weather_file_format_string
+ #
+ #  Function Description:
+ #      This function returns the storage format, parquet, ipc, or csv, for a
+ #      file path based on its extension.
+ #
+ #
+ #  Return Type: string
+ #
+ #
+ #  Function Parameters:
+ #
+ #  Type    Name            Description
+ #  -----   -------------   ----------------------------------------------
+ #  string  file_path_string
+ #                          The parameter is the file path.
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def return_weather_file_format_string(file_path_string):
+
+    extension_string = os.path.splitext(file_path_string)[1].lower()
+
+    if extension_string not in CONSTANT_FILE_FORMAT_DICTIONARY:
+
+        raise ValueError(f'The file extension, {extension_string}, is not supported.')
+
+
+    return CONSTANT_FILE_FORMAT_DICTIONARY[extension_string]
+
+
+# In[6]:
+
+
+#*******************************************************************************************
+ #
+ #  Function Name:  return_weather_arrow_table
+ #
+ #  Function Description:
+ #      This function converts a city weather dataframe, with the city id as its
+ #      index, to an Arrow table with the weather schema.
+ #
+ #
+ #  Return Type: table
+ #
+ #
+ #  Function Parameters:
+ #
+ #  Type    Name            Description
+ #  -----   -------------   ----------------------------------------------
+ #  dataframe
+ #          input_dataframe The parameter is the city weather dataframe.
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def return_weather_arrow_table(input_dataframe):
+
+    temp_dataframe = input_dataframe.reset_index()
+
+    temp_dataframe.rename \
+        (columns = {temp_dataframe.columns[0]:
+                        weather_constants.CONSTANT_WEATHER_DATA_FILE_INDEX_NAME},
+         inplace = True)
+
+    temp_dataframe['country'] = temp_dataframe['country'].astype(str)
+
+
+    return \
+        pa.Table.from_pandas \
+            (temp_dataframe,
+             schema = return_weather_arrow_schema(),
+             preserve_index = False,
+             safe = False) \
+            .replace_schema_metadata(None)
+
+
+# In[7]:
+
+
+#*******************************************************************************************
+ #
+ #  Function Name:  return_weather_filter_expression
+ #
+ #  Function Description:
+ #      This function converts a dictionary of column names and inclusive
+ #      [minimum, maximum] ranges to an Arrow dataset filter expression; it
+ #      returns None for an empty dictionary.
+ #
+ #
+ #  Return Type: expression
+ #
+ #
+ #  Function Parameters:
+ #
+ #  Type    Name            Description
+ #  -----   -------------   ----------------------------------------------
+ #  dictionary
+ #          range_dictionary
+ #                          The parameter is the dictionary of column names and ranges.
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def return_weather_filter_expression(range_dictionary):
+
+    filter_expression = None
+
+
+    for column_name_string, range_list in range_dictionary.items():
+
+        range_expression \
+            = (ds.field(column_name_string) >= range_list[0]) \
+              & (ds.field(column_name_string) <= range_list[1])
+
+        if filter_expression is None:
+
+            filter_expression = range_expression
+
+        else:
+
+            filter_expression = filter_expression & range_expression
+
+
+    return filter_expression
+
+
+# In[8]:
+
+
+#*******************************************************************************************
+ #
+ #  Function Name:  write_weather_file
+ #
+ #  Function Description:
+ #      This subroutine writes a city weather dataframe to a Parquet, Arrow IPC,
+ #      or CSV file, chosen by the file extension, through a uniquely named 
+ #      temporary file in the same folder, so concurrent writers never share a 
+ #      partial file and readers only ever see a complete one.
+ #
+ #
+ #  Return Type: n/a
+ #
+ #
+ #  Function Parameters:
+ #
+ #  Type    Name            Description
+ #  -----   -------------   ----------------------------------------------
+ #  dataframe
+ #          input_dataframe The parameter is the city weather dataframe.
+ #  string  file_path_string
+ #                          The parameter is the output file path.
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def write_weather_file \
+        (input_dataframe,
+         file_path_string):
+
+    file_format_string = return_weather_file_format_string(file_path_string)
+
+    file_descriptor_integer, temporary_file_path_string \
+        = tempfile.mkstemp \
+            (suffix = '.tmp',
+             prefix = os.path.basename(file_path_string) + '.',
+             dir = os.path.dirname(os.path.abspath(file_path_string)))
+
+    os.close(file_descriptor_integer)
+
+
+    try:
+
+        if file_format_string == 'csv':
+
+            input_dataframe.to_csv \
+                (temporary_file_path_string,
+                 index_label = weather_constants.CONSTANT_WEATHER_DATA_FILE_INDEX_NAME)
+
+        else:
+
+            weather_table = return_weather_arrow_table(input_dataframe)
+
+            if file_format_string == 'parquet':
+
+                pq.write_table \
+                    (weather_table,
+                     temporary_file_path_string,
+                     row_group_size = CONSTANT_PARQUET_ROW_GROUP_SIZE)
+
+            else:
+
+                feather.write_feather \
+                    (weather_table, temporary_file_path_string, compression = 'uncompressed')
+
+
+        if os.path.exists(file_path_string):
+
+            os.chmod(temporary_file_path_string, os.stat(file_path_string).st_mode)
+
+        os.replace(temporary_file_path_string, file_path_string)
+
+    except:
+
+        if os.path.exists(temporary_file_path_string):
+
+            os.remove(temporary_file_path_string)
+
+        raise
+
+
+# In[9]:
+
+
+#*******************************************************************************************
+ #
+ #  Function Name:  return_weather_dataframe_from_file
+ #
+ #  Function Description:
+ #      This function reads a city weather table from a Parquet, Arrow IPC, or CSV
+ #      file and returns it as a dataframe indexed by city id.  For Parquet and
+ #      Arrow IPC files, the reader skips unrequested columns and applies the range
+ #      filters during the scan, so Parquet row groups outside the ranges are never
+ #      decoded; CSV files are parsed in full with the same schema, which also keeps
+ #      country codes such as NA (Namibia) from becoming missing values.
+ #
+ #
+ #  Return Type: dataframe
+ #
+ #
+ #  Function Parameters:
+ #
+ #  Type    Name            Description
+ #  -----   -------------   ----------------------------------------------
+ #  string  file_path_string
+ #                          The parameter is the input file path.
+ #  string list
+ #          column_string_list
+ #                          The parameter is the list of columns to read (None reads
+ #                          every column).
+ #  dictionary
+ #          range_dictionary
+ #                          The parameter is the dictionary of column names and
+ #                          inclusive [minimum, maximum] ranges (None reads every row).
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def return_weather_dataframe_from_file \
+        (file_path_string,
+         column_string_list = None,
+         range_dictionary = None):
+
+    file_format_string = return_weather_file_format_string(file_path_string)
+
+    weather_schema = return_weather_arrow_schema()
+
+    index_name_string = weather_constants.CONSTANT_WEATHER_DATA_FILE_INDEX_NAME
+
+
+    if column_string_list is not None:
+
+        column_string_list \
+            = [index_name_string] \
+              + [column_string for column_string in column_string_list
+                 if column_string != index_name_string]
+
+    filter_expression = return_weather_filter_expression(range_dictionary or {})
+
+
+    if file_format_string == 'csv':
+
+        weather_dataset \
+            = ds.dataset \
+                (file_path_string,
+                 schema = weather_schema,
+                 format = ds.CsvFileFormat \
+                     (convert_options = pacsv.ConvertOptions \
+                          (column_types = weather_schema,
+                           strings_can_be_null = False,
+                           quoted_strings_can_be_null = False)))
+
+    else:
+
+        weather_dataset \
+            = ds.dataset(file_path_string, schema = weather_schema, format = file_format_string)
+
+
+    weather_table \
+        = weather_dataset.to_table(columns = column_string_list, filter = filter_expression)
+
+
+    return weather_table.to_pandas().set_index(index_name_string)
+
+
+# In[10]:
+
+
+#*******************************************************************************************
+ #
+ #  Function Name:  publish_weather_snapshot
+ #
+ #  Function Description:
+ #      This subroutine writes a city weather dataframe to an uncompressed Arrow 
+ #      IPC snapshot file through a temporary file, so readers that already have 
+ #      the old snapshot mapped keep a consistent copy.
+ #
+ #
+ #  Return Type: n/a
+ #
+ #
+ #  Function Parameters:
+ #
+ #  Type    Name            Description
+ #  -----   -------------   ----------------------------------------------
+ #  dataframe
+ #          input_dataframe The parameter is the city weather dataframe.
+ #  string  snapshot_file_path_string
+ #                          The parameter is the snapshot file path.
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def publish_weather_snapshot \
+        (input_dataframe,
+         snapshot_file_path_string = weather_constants.CONSTANT_WEATHER_SNAPSHOT_FILE_PATH):
+
+    if return_weather_file_format_string(snapshot_file_path_string) != 'ipc':
+
+        raise ValueError \
+            (f'The snapshot file, {snapshot_file_path_string}, is not an Arrow file.')
+
+
+    write_weather_file(input_dataframe, snapshot_file_path_string)
+
+
+# In[11]:
+
+
+#*******************************************************************************************
+ #
+ #  Function Name:  refresh_weather_snapshot
+ #
+ #  Function Description:
+ #      This subroutine publishes the Arrow snapshot from the weather data file if 
+ #      the snapshot is missing or older than the file.  The snapshot reads the 
+ #      country column as strings, so, unlike pandas.read_csv, it keeps the 
+ #      country code NA (Namibia) instead of turning it into a missing value.
+ #
+ #
+ #  Return Type: n/a
+ #
+ #
+ #  Function Parameters:
+ #
+ #  Type    Name            Description
+ #  -----   -------------   ----------------------------------------------
+ #  string  snapshot_file_path_string
+ #                          The parameter is the snapshot file path.
+ #  string  source_file_path_string
+ #                          The parameter is the weather data file path.
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def refresh_weather_snapshot \
+        (snapshot_file_path_string = weather_constants.CONSTANT_WEATHER_SNAPSHOT_FILE_PATH,
+         source_file_path_string = weather_constants.CONSTANT_WEATHER_DATA_FILE_PATH):
+
+    if os.path.exists(snapshot_file_path_string) == False \
+       or os.path.getmtime(snapshot_file_path_string) \
+          < os.path.getmtime(source_file_path_string):
+
+        publish_weather_snapshot \
+            (return_weather_dataframe_from_file(source_file_path_string), 
+             snapshot_file_path_string)
+
+
+# In[12]:
+
+
+#*******************************************************************************************
+ #
+ #  Function Name:  return_weather_snapshot_table
+ #
+ #  Function Description:
+ #      This function memory-maps the Arrow snapshot and returns it as a table 
+ #      whose columns point into the mapped file, so opening it costs the same 
+ #      for any number of rows and every process shares the pages in the 
+ #      operating system cache.  The function only reads the snapshot; 
+ #      refresh_weather_snapshot writes it.
+ #
+ #
+ #  Return Type: table
+ #
+ #
+ #  Function Parameters:
+ #
+ #  Type    Name            Description
+ #  -----   -------------   ----------------------------------------------
+ #  string  snapshot_file_path_string
+ #                          The parameter is the snapshot file path.
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def return_weather_snapshot_table \
+        (snapshot_file_path_string = weather_constants.CONSTANT_WEATHER_SNAPSHOT_FILE_PATH):
+
+    memory_map = pa.memory_map(snapshot_file_path_string, 'r')
+
+
+    return ipc.open_file(memory_map).read_all()
+
+
+# In[13]:
+
+
+#*******************************************************************************************
+ #
+ #  Function Name:  return_weather_dataframe_from_snapshot
+ #
+ #  Function Description:
+ #      This function returns the Arrow snapshot as a dataframe indexed by city id; 
+ #      the numeric and date columns are views of the mapped file rather than 
+ #      copies.
+ #
+ #
+ #  Return Type: dataframe
+ #
+ #
+ #  Function Parameters:
+ #
+ #  Type    Name            Description
+ #  -----   -------------   ----------------------------------------------
+ #  string  snapshot_file_path_string
+ #                          The parameter is the snapshot file path.
+ #  string list
+ #          column_string_list
+ #                          The parameter is the list of columns to return (None 
+ #                          returns every column).
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def return_weather_dataframe_from_snapshot \
+        (snapshot_file_path_string = weather_constants.CONSTANT_WEATHER_SNAPSHOT_FILE_PATH,
+         column_string_list = None):
+
+    weather_table = return_weather_snapshot_table(snapshot_file_path_string)
+
+    index_name_string = weather_constants.CONSTANT_WEATHER_DATA_FILE_INDEX_NAME
+
+
+    if column_string_list is not None:
+
+        weather_table \
+            = weather_table.select \
+                ([index_name_string] 
+                 + [column_string for column_string in column_string_list
+                    if column_string != index_name_string])
+
+
+    return weather_table.to_pandas(split_blocks = True).set_index(index_name_string)
+
+
+# In[ ]:
+
+
+
+
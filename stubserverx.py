@@ -0,0 +1,523 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+# In[1]:
+
+
+#*******************************************************************************************
+ #
+ #  File Name:  stubserverx.py
+ #
+ #  File Description:
+ #      This Python script, stubserverx.py, contains Python functions for running a
+ #      local HTTP server that stands in for the OpenWeatherMap API and the 
+ #      Geoapify Places API during testing and benchmarking.  Here is the list:
+ #
+ #  return_stub_weather_dictionary
+ #  return_stub_places_dictionary
+ #  return_stub_quota_boolean
+ #
+ #  start_stub_server
+ #  stop_stub_server
+ #
+ #
+ #  Date            Description                             Programmer
+ #  ----------      ------------------------------------    ------------------
+ #  10/18/2026      Initial Development                     Nicholas J. George
+ #
+ #******************************************************************************************/
+
+import json
+import threading
+import time
+import zlib
+
+from http.server import BaseHTTPRequestHandler
+from http.server import ThreadingHTTPServer
+from urllib.parse import parse_qs
+from urllib.parse import urlparse
+
+
+# In[2]:
+
+
+CONSTANT_LOCAL_FILE_NAME = 'stubserverx.py'
+
+
+# In[3]:
+
+
+CONSTANT_STUB_HOST_NAME = '127.0.0.1'
+
+CONSTANT_STUB_NOT_FOUND_PREFIX = 'notfound'
+
+CONSTANT_STUB_TIMESTAMP = 1769536092
+
+CONSTANT_STUB_GROUP_SIZE = 20
+
+
+# In[4]:
+
+
+#*******************************************************************************************
+ #
+ #  Class Name:  StubHTTPServer
+ #
+ #  Class Description:
+ #      This class is a threaded HTTP server with a listen backlog large enough
+ #      for highly concurrent clients.
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+class StubHTTPServer(ThreadingHTTPServer):
+
+    daemon_threads = True
+
+    request_queue_size = 1024
+
+
+# In[5]:
+
+
+#*******************************************************************************************
+ #
+ #  Class Name:  StubRequestHandler
+ #
+ #  Class Description:
+ #      This class answers GET requests with JSON bodies shaped like the
+ #      OpenWeatherMap current weather and group responses and the Geoapify 
+ #      places responses after waiting for
+ #      the server's simulated latency; requests over the server's quota receive
+ #      429 responses with a Retry-After header.
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+class StubRequestHandler(BaseHTTPRequestHandler):
+
+    protocol_version = 'HTTP/1.1'
+
+    disable_nagle_algorithm = True
+
+
+    def do_GET(self):
+
+        parsed_url = urlparse(self.path)
+
+        query_dictionary = parse_qs(parsed_url.query)
+
+
+        time.sleep(self.server.latency_seconds_float)
+
+
+        if return_stub_quota_boolean(self.server) == False:
+
+            self.send_json_response \
+                (429, {'cod': 429, 'message': 'rate limit exceeded'}, {'Retry-After': '1'})
+
+            return
+
+
+        if parsed_url.path == '/data/2.5/weather':
+
+            city_name_string = query_dictionary.get('q', [''])[0]
+
+            if city_name_string.startswith(CONSTANT_STUB_NOT_FOUND_PREFIX):
+
+                self.send_json_response \
+                    (404, {'cod': '404', 'message': 'city not found'})
+
+            else:
+
+                self.send_json_response \
+                    (200, return_stub_weather_dictionary(city_name_string))
+
+        elif parsed_url.path == '/data/2.5/group':
+
+            city_id_string_list = query_dictionary.get('id', [''])[0].split(',')
+
+            if len(city_id_string_list) > CONSTANT_STUB_GROUP_SIZE:
+
+                self.send_json_response \
+                    (400, {'cod': '400', 'message': 'too many city ids'})
+
+            else:
+
+                self.send_json_response \
+                    (200, 
+                     {'cnt': len(city_id_string_list),
+                      'list': [return_stub_weather_dictionary(f'city id {city_id_string}', 
+                                                              int(city_id_string))
+                               for city_id_string in city_id_string_list]})
+
+        elif parsed_url.path == '/v2/places':
+
+            self.send_json_response \
+                (200, 
+                 return_stub_places_dictionary \
+                     (query_dictionary.get('filter', [''])[0],
+                      query_dictionary.get('categories', [''])[0],
+                      int(query_dictionary.get('limit', ['20'])[0])))
+
+        else:
+
+            self.send_json_response(404, {'cod': '404', 'message': 'unknown endpoint'})
+
+
+    def send_json_response(self, status_integer, response_dictionary, header_dictionary = None):
+
+        if header_dictionary is None:
+
+            header_dictionary = {}
+
+
+        body_bytes = json.dumps(response_dictionary).encode('utf-8')
+
+        self.send_response(status_integer)
+
+        self.send_header('Content-Type', 'application/json')
+
+        self.send_header('Content-Length', str(len(body_bytes)))
+
+        for header_name_string, header_value_string in header_dictionary.items():
+
+            self.send_header(header_name_string, header_value_string)
+
+        self.end_headers()
+
+        self.wfile.write(body_bytes)
+
+
+    def log_message(self, format, *args):
+
+        pass
+
+
+# In[6]:
+
+
+#*******************************************************************************************
+ #
+ #  Function Name:  return_stub_weather_dictionary
+ #
+ #  Function Description:
+ #      This function returns a deterministic OpenWeatherMap-style weather response
+ #      for a city name.
+ #
+ #
+ #  Return Type: dictionary
+ #
+ #
+ #  Function Parameters:
+ #
+ #  Type    Name            Description
+ #  -----   -------------   ----------------------------------------------
+ #  string  city_name_string
+ #                          The parameter is the city name.
+ #  integer city_id_integer The parameter is the city id (None derives one from the name).
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def return_stub_weather_dictionary \
+        (city_name_string,
+         city_id_integer = None):
+
+    seed_integer = zlib.crc32(city_name_string.encode('utf-8'))
+
+    if city_id_integer is None:
+
+        city_id_integer = seed_integer % 10000000
+
+
+    return \
+        {'coord': {'lon': round((seed_integer % 36000) / 100.0 - 180.0, 4),
+                   'lat': round((seed_integer // 36000 % 18000) / 100.0 - 90.0, 4)},
+         'weather': [{'id': 800, 'main': 'Clear', 'description': 'clear sky', 'icon': '01d'}],
+         'base': 'stations',
+         'main': {'temp': round((seed_integer % 12000) / 100.0 - 10.0, 2),
+                  'feels_like': 0.0,
+                  'temp_min': 0.0,
+                  'temp_max': 0.0,
+                  'pressure': 1013,
+                  'humidity': seed_integer % 101},
+         'visibility': 10000,
+         'wind': {'speed': round((seed_integer % 3000) / 100.0, 2), 'deg': 0},
+         'clouds': {'all': seed_integer // 101 % 101},
+         'dt': CONSTANT_STUB_TIMESTAMP,
+         'sys': {'country': chr(65 + seed_integer % 26) + chr(65 + seed_integer // 26 % 26)},
+         'timezone': 0,
+         'id': city_id_integer,
+         'name': city_name_string,
+         'cod': 200}
+
+
+# In[7]:
+
+
+#*******************************************************************************************
+ #
+ #  Function Name:  return_stub_places_dictionary
+ #
+ #  Function Description:
+ #      This function returns a deterministic Geoapify-style places response for 
+ #      a circle filter; each category gets zero to two places depending on the 
+ #      circle's center and the category.
+ #
+ #
+ #  Return Type: dictionary
+ #
+ #
+ #  Function Parameters:
+ #
+ #  Type    Name            Description
+ #  -----   -------------   ----------------------------------------------
+ #  string  filter_string   The parameter is the filter, like 
+ #                          'circle:longitude,latitude,radius'.
+ #  string  categories_string
+ #                          The parameter is the comma-separated list of categories.
+ #  integer result_limit_integer
+ #                          The parameter is a limit on the number of results.
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def return_stub_places_dictionary \
+        (filter_string,
+         categories_string,
+         result_limit_integer):
+
+    coordinate_string_list = filter_string.removeprefix('circle:').split(',')
+
+    try:
+
+        longitude_float = float(coordinate_string_list[0])
+
+        latitude_float = float(coordinate_string_list[1])
+
+    except:
+
+        longitude_float = 0.0
+
+        latitude_float = 0.0
+
+
+    feature_dictionary_list = []
+
+
+    for category_string in categories_string.split(','):
+
+        seed_integer \
+            = zlib.crc32 \
+                (f'{longitude_float:.4f},{latitude_float:.4f},{category_string}'.encode('utf-8'))
+
+        for index in range(seed_integer % 3):
+
+            place_longitude_float \
+                = round(longitude_float + (len(feature_dictionary_list) + 1) * 0.001, 6)
+
+            place_latitude_float \
+                = round(latitude_float + (len(feature_dictionary_list) + 1) * 0.001, 6)
+
+            feature_dictionary_list.append \
+                ({'type': 'Feature',
+                  'properties': {'name': f'{category_string} {seed_integer % 10000} {index + 1}',
+                                 'lon': place_longitude_float,
+                                 'lat': place_latitude_float,
+                                 'categories': [category_string.split('.')[0], category_string],
+                                 'distance': 0,
+                                 'place_id': f'{seed_integer:08x}{index:02x}'},
+                  'geometry': {'type': 'Point', 
+                               'coordinates': [place_longitude_float, place_latitude_float]}})
+
+
+    feature_dictionary_list = feature_dictionary_list[:result_limit_integer]
+
+
+    return {'type': 'FeatureCollection', 'features': feature_dictionary_list}
+
+
+# In[8]:
+
+
+#*******************************************************************************************
+ #
+ #  Function Name:  return_stub_quota_boolean
+ #
+ #  Function Description:
+ #      This function takes one token from the stub server's quota bucket and 
+ #      returns False if the bucket is empty; a server without a quota always 
+ #      returns True.
+ #
+ #
+ #  Return Type: boolean
+ #
+ #
+ #  Function Parameters:
+ #
+ #  Type    Name            Description
+ #  -----   -------------   ----------------------------------------------
+ #  server  stub_server     The parameter is the server from start_stub_server.
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def return_stub_quota_boolean(stub_server):
+
+    if stub_server.requests_per_second_float is None:
+
+        return True
+
+
+    with stub_server.quota_lock:
+
+        current_time_float = time.monotonic()
+
+        stub_server.quota_tokens_float \
+            = min(stub_server.requests_per_second_float,
+                  stub_server.quota_tokens_float 
+                  + (current_time_float - stub_server.quota_update_time_float) 
+                    * stub_server.requests_per_second_float)
+
+        stub_server.quota_update_time_float = current_time_float
+
+
+        if stub_server.quota_tokens_float >= 1.0:
+
+            stub_server.quota_tokens_float -= 1.0
+
+            return True
+
+
+        stub_server.throttled_count_integer += 1
+
+        return False
+
+
+# In[9]:
+
+
+#*******************************************************************************************
+ #
+ #  Function Name:  start_stub_server
+ #
+ #  Function Description:
+ #      This function starts the stub server on a background thread and returns
+ #      the server to the caller; the attribute, base_url_string, holds the website
+ #      to substitute for the real API.
+ #
+ #
+ #  Return Type: server
+ #
+ #
+ #  Function Parameters:
+ #
+ #  Type    Name            Description
+ #  -----   -------------   ----------------------------------------------
+ #  float   latency_seconds_float
+ #                          The parameter is the simulated network latency per request.
+ #  integer port_integer    The parameter is the port number (0 picks a free port).
+ #  float   requests_per_second_float
+ #                          The parameter is the quota; the server answers requests over 
+ #                          it with 429 responses (None disables the quota).
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def start_stub_server \
+        (latency_seconds_float = 0.02,
+         port_integer = 0,
+         requests_per_second_float = None):
+
+    stub_server \
+        = StubHTTPServer \
+            ((CONSTANT_STUB_HOST_NAME, port_integer), StubRequestHandler)
+
+    stub_server.latency_seconds_float = latency_seconds_float
+
+    stub_server.requests_per_second_float = requests_per_second_float
+
+    stub_server.quota_tokens_float = requests_per_second_float or 0.0
+
+    stub_server.quota_update_time_float = time.monotonic()
+
+    stub_server.quota_lock = threading.Lock()
+
+    stub_server.throttled_count_integer = 0
+
+    stub_server.base_url_string \
+        = f'http://{CONSTANT_STUB_HOST_NAME}:{stub_server.server_address[1]}'
+
+
+    server_thread = threading.Thread(target = stub_server.serve_forever, daemon = True)
+
+    server_thread.start()
+
+
+    return stub_server
+
+
+# In[10]:
+
+
+#*******************************************************************************************
+ #
+ #  Function Name:  stop_stub_server
+ #
+ #  Function Description:
+ #      This subroutine shuts down a stub server and releases its socket.
+ #
+ #
+ #  Return Type: n/a
+ #
+ #
+ #  Function Parameters:
+ #
+ #  Type    Name            Description
+ #  -----   -------------   ----------------------------------------------
+ #  server  stub_server     The parameter is the server from start_stub_server.
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def stop_stub_server(stub_server):
+
+    stub_server.shutdown()
+
+    stub_server.server_close()
+
+
+# In[ ]:
+
+
+
+
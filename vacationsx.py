@@ -12,12 +12,41 @@
  #      This Python script, vacationsx.py, provides functions for completing tasks 
  #      associated with the Jupyter Notebook, vacations.ipynb. Here is the list:
  #      
+ #  return_vacation_criteria_dictionary
  #  set_vacation_temperature_range
  #  set_vacation_humidity_range
  #  set_vacation_cloudiness_range
  #  set_vacation_wind_speed_range
  #
+ #  return_vacation_mask_array
+ #  return_vacations_dataframe
+ #
+ #  return_vacation_penalty_array
+ #  return_ranked_vacations_dataframe
+ #
+ #  return_vacation_criteria_bound_tuple
+ #  return_vacation_criteria_matrix_array
+ #
+ #  return_vacation_range_index_dictionary
+ #  return_typed_bound
+ #  return_vacation_index_positions_array
+ #  return_indexed_vacations_dataframe
+ #
+ #  return_vacation_query_dictionary
+ #  notify_vacation_queries
+ #  return_vacation_query_mask_array
+ #  return_vacation_query_dataframe
+ #
+ #  return_places_cache_key_string
+ #  return_place_field_list_list
+ #  set_places_backend
+ #  return_places_index_dictionary
+ #  return_local_places_dictionary
+ #  return_location_place_field_list_list
+ #  return_place_name_string
+ #  return_location_place_field_list_list_dictionary
  #  update_dataframe_location
+ #  update_dataframe_locations
  #
  #
  #  Date            Description                             Programmer
@@ -26,12 +55,23 @@
  #
  #******************************************************************************************/
 
+import cachex
 import logx
+import requestsx
+import spatialx
+import storagex
 import weather_constants
 
-import requests
+import math
 
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.dataset as ds
+
+from concurrent.futures import ThreadPoolExecutor
+from types import MappingProxyType
 
 from weather_api_keys import geoapify_key
 
@@ -43,19 +83,104 @@ pd.options.mode.chained_assignment = None
 
 CONSTANT_LOCAL_FILE_NAME = 'vacationsx.py'
 
+CONSTANT_CRITERIA_BLOCK_SIZE = 32
+
+CONSTANT_ROW_BLOCK_SIZE = 8192
+
+CONSTANT_PLACES_MAXIMUM_RESULT_LIMIT = 500
+
+CONSTANT_PLACES_INDEX_CELL_DEGREES = 0.1
+
+CONSTANT_PLACES_INDEX_COLUMN_LIST = ['name', 'latitude', 'longitude', 'categories']
+
+CONSTANT_PLACE_COLUMN_CATEGORY_DICTIONARY \
+    = {'hotel_name': 'accommodation.hotel',
+       'restaurant_name': 'catering.restaurant',
+       'tourist_attraction': 'tourism.attraction'}
+
+CONSTANT_PLACE_CATEGORY_NAME_DICTIONARY \
+    = {'accommodation.hotel': 'hotel',
+       'catering.restaurant': 'restaurant',
+       'tourism.attraction': 'tourism attraction'}
+
+
+VACATION_RANGE_VERSION_DICTIONARY = {}
+
+PLACES_INDEX_DICTIONARY = None
+
 
 # In[3]:
 
 
+#*******************************************************************************************
+ #
+ #  Function Name:  return_vacation_criteria_dictionary
+ #
+ #  Function Description:
+ #      This function returns vacation criteria: a read-only dictionary of range 
+ #      tuples keyed like weather_conditions_dictionary.  The filtering functions 
+ #      accept it in place of the global dictionary, and since it cannot change, 
+ #      many threads can share it while the setters build new criteria from it.
+ #
+ #
+ #  Return Type: dictionary
+ #
+ #
+ #  Function Parameters:
+ #
+ #  Type    Name            Description
+ #  -----   -------------   ----------------------------------------------
+ #  dictionary
+ #          conditions_dictionary
+ #                          The parameter is the dictionary of ranges to copy (None 
+ #                          copies weather_conditions_dictionary).
+ #  dictionary
+ #          update_dictionary
+ #                          The parameter is the dictionary of ranges to replace or 
+ #                          add (None replaces none).
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def return_vacation_criteria_dictionary \
+        (conditions_dictionary = None,
+         update_dictionary = None):
+
+    if conditions_dictionary is None:
+
+        conditions_dictionary = weather_constants.weather_conditions_dictionary
+
+    if update_dictionary is None:
+
+        update_dictionary = {}
+
+
+    return \
+        MappingProxyType \
+            ({condition_key_string: (range_list[0], range_list[1])
+              for condition_key_string, range_list 
+              in (dict(conditions_dictionary) | dict(update_dictionary)).items()})
+
+
+# In[4]:
+
+
 #*******************************************************************************************
  #
  #  Function Name:  set_vacation_temperature_range
  #
  #  Function Description:
- #      This subroutine sets the vacation temperature range in Fahrenheit.
+ #      This function sets the vacation temperature range in Fahrenheit.
+ #      If criteria are passed, it leaves weather_conditions_dictionary alone and 
+ #      returns new criteria with this range replaced; otherwise, it sets the 
+ #      range in weather_conditions_dictionary and returns criteria copied from it.
  #
  #
- #  Return Type: n/a
+ #  Return Type: dictionary
  #
  #
  #  Function Parameters:
@@ -66,17 +191,25 @@ CONSTANT_LOCAL_FILE_NAME = 'vacationsx.py'
  #                          The parameter is the minimum vacation maximum temperature.
  #  integer maximum_temperature_integer
  #                          The parameter is the maximum vacation maximum temperature.
+ #  dictionary
+ #          conditions_dictionary
+ #                          The parameter is the criteria to build on (None sets 
+ #                          weather_conditions_dictionary).
  #
  #
  #  Date                Description                                 Programmer
  #  ---------------     ------------------------------------        ------------------
  #  08/26/2023          Initial Development                         Nicholas J. George
+ #  10/18/2026          Added vacation query notification           Nicholas J. George
+ #  10/18/2026          Added criteria dictionary parameter         Nicholas J. George
+ #  10/18/2026          Returned criteria on both paths             Nicholas J. George
  #
  #******************************************************************************************/
 
 def set_vacation_temperature_range \
         (minimum_temperature_integer,
-         maximum_temperature_integer):
+         maximum_temperature_integer,
+         conditions_dictionary = None):
 
     minimum_temperature_integer = int(minimum_temperature_integer)
 
@@ -97,6 +230,14 @@ def set_vacation_temperature_range \
             = maximum_temperature_integer, minimum_temperature_integer
 
 
+    if conditions_dictionary is not None:
+
+        return \
+            return_vacation_criteria_dictionary \
+                (conditions_dictionary,
+                 {'temperature_range': (minimum_temperature_integer, maximum_temperature_integer)})
+
+
     weather_constants.weather_conditions_dictionary['temperature_range'][0] \
         = minimum_temperature_integer
 
@@ -104,7 +245,13 @@ def set_vacation_temperature_range \
         = maximum_temperature_integer
 
 
-# In[4]:
+    notify_vacation_queries('temperature_range')
+
+
+    return return_vacation_criteria_dictionary()
+
+
+# In[5]:
 
 
 #*******************************************************************************************
@@ -113,9 +260,12 @@ def set_vacation_temperature_range \
  #
  #  Function Description:
  #      This function sets the vacation humidity range.
+ #      If criteria are passed, it leaves weather_conditions_dictionary alone and 
+ #      returns new criteria with this range replaced; otherwise, it sets the 
+ #      range in weather_conditions_dictionary and returns criteria copied from it.
  #
  #
- #  Return Type: n/a
+ #  Return Type: dictionary
  #
  #
  #  Function Parameters:
@@ -126,17 +276,25 @@ def set_vacation_temperature_range \
  #                          The parameter is the minimum vacation humidity.
  #  integer maximum_humidity_integer
  #                          The parameter is the maximum vacation humidity.
+ #  dictionary
+ #          conditions_dictionary
+ #                          The parameter is the criteria to build on (None sets 
+ #                          weather_conditions_dictionary).
  #
  #
  #  Date                Description                                 Programmer
  #  ---------------     ------------------------------------        ------------------
  #  08/26/2023          Initial Development                         Nicholas J. George
+ #  10/18/2026          Added vacation query notification           Nicholas J. George
+ #  10/18/2026          Added criteria dictionary parameter         Nicholas J. George
+ #  10/18/2026          Returned criteria on both paths             Nicholas J. George
  #
  #******************************************************************************************/
 
 def set_vacation_humidity_range \
         (minimum_humidity_integer,
-         maximum_humidity_integer):
+         maximum_humidity_integer,
+         conditions_dictionary = None):
 
     minimum_humidity_integer = int(minimum_humidity_integer)
 
@@ -157,6 +315,14 @@ def set_vacation_humidity_range \
             = maximum_humidity_integer, minimum_humidity_integer
 
 
+    if conditions_dictionary is not None:
+
+        return \
+            return_vacation_criteria_dictionary \
+                (conditions_dictionary,
+                 {'humidity_range': (minimum_humidity_integer, maximum_humidity_integer)})
+
+
     weather_constants.weather_conditions_dictionary['humidity_range'][0] \
         = minimum_humidity_integer
 
@@ -164,7 +330,13 @@ def set_vacation_humidity_range \
         = maximum_humidity_integer
 
 
-# In[5]:
+    notify_vacation_queries('humidity_range')
+
+
+    return return_vacation_criteria_dictionary()
+
+
+# In[6]:
 
 
 #*******************************************************************************************
@@ -173,9 +345,12 @@ def set_vacation_humidity_range \
  #
  #  Function Description:
  #      This function sets the vacation cloudiness range.
+ #      If criteria are passed, it leaves weather_conditions_dictionary alone and 
+ #      returns new criteria with this range replaced; otherwise, it sets the 
+ #      range in weather_conditions_dictionary and returns criteria copied from it.
  #
  #
- #  Return Type: n/a
+ #  Return Type: dictionary
  #
  #
  #  Function Parameters:
@@ -186,17 +361,25 @@ def set_vacation_humidity_range \
  #                          The parameter is the minimum vacation cloudiness.
  #  integer maximum_cloudiness_integer
  #                          The parameter is the maximum vacation cloudiness.
+ #  dictionary
+ #          conditions_dictionary
+ #                          The parameter is the criteria to build on (None sets 
+ #                          weather_conditions_dictionary).
  #
  #
  #  Date                Description                                 Programmer
  #  ---------------     ------------------------------------        ------------------
  #  08/26/2023          Initial Development                         Nicholas J. George
+ #  10/18/2026          Added vacation query notification           Nicholas J. George
+ #  10/18/2026          Added criteria dictionary parameter         Nicholas J. George
+ #  10/18/2026          Returned criteria on both paths             Nicholas J. George
  #
  #******************************************************************************************/
 
 def set_vacation_cloudiness_range \
         (minimum_cloudiness_integer,
-         maximum_cloudiness_integer):
+         maximum_cloudiness_integer,
+         conditions_dictionary = None):
 
     minimum_cloudiness_integer = int(minimum_cloudiness_integer)
 
@@ -217,6 +400,14 @@ def set_vacation_cloudiness_range \
             = maximum_cloudiness_integer, minimum_cloudiness_integer
 
 
+    if conditions_dictionary is not None:
+
+        return \
+            return_vacation_criteria_dictionary \
+                (conditions_dictionary,
+                 {'cloudiness_range': (minimum_cloudiness_integer, maximum_cloudiness_integer)})
+
+
     weather_constants.weather_conditions_dictionary['cloudiness_range'][0] \
         = minimum_cloudiness_integer
 
@@ -224,7 +415,13 @@ def set_vacation_cloudiness_range \
         = maximum_cloudiness_integer
 
 
-# In[6]:
+    notify_vacation_queries('cloudiness_range')
+
+
+    return return_vacation_criteria_dictionary()
+
+
+# In[7]:
 
 
 #*******************************************************************************************
@@ -233,9 +430,12 @@ def set_vacation_cloudiness_range \
  #
  #  Function Description:
  #      This function sets the vacation wind speed range.
+ #      If criteria are passed, it leaves weather_conditions_dictionary alone and 
+ #      returns new criteria with this range replaced; otherwise, it sets the 
+ #      range in weather_conditions_dictionary and returns criteria copied from it.
  #
  #
- #  Return Type: n/a
+ #  Return Type: dictionary
  #
  #
  #  Function Parameters:
@@ -246,17 +446,25 @@ def set_vacation_cloudiness_range \
  #                          The parameter is the minimum vacation wind speed.
  #  integer maximum_wind_speed_integer
  #                          The parameter is the maximum vacation wind speed.
+ #  dictionary
+ #          conditions_dictionary
+ #                          The parameter is the criteria to build on (None sets 
+ #                          weather_conditions_dictionary).
  #
  #
  #  Date                Description                                 Programmer
  #  ---------------     ------------------------------------        ------------------
  #  08/26/2023          Initial Development                         Nicholas J. George
+ #  10/18/2026          Added vacation query notification           Nicholas J. George
+ #  10/18/2026          Added criteria dictionary parameter         Nicholas J. George
+ #  10/18/2026          Returned criteria on both paths             Nicholas J. George
  #
  #******************************************************************************************/
 
 def set_vacation_wind_speed_range \
         (minimum_wind_speed_integer,
-         maximum_wind_speed_integer):
+         maximum_wind_speed_integer,
+         conditions_dictionary = None):
 
     minimum_wind_speed_integer = int(minimum_wind_speed_integer)
 
@@ -277,6 +485,14 @@ def set_vacation_wind_speed_range \
             = maximum_wind_speed_integer, minimum_wind_speed_integer
 
 
+    if conditions_dictionary is not None:
+
+        return \
+            return_vacation_criteria_dictionary \
+                (conditions_dictionary,
+                 {'wind_speed_range': (minimum_wind_speed_integer, maximum_wind_speed_integer)})
+
+
     weather_constants.weather_conditions_dictionary['wind_speed_range'][0] \
         = minimum_wind_speed_integer
 
@@ -284,16 +500,108 @@ def set_vacation_wind_speed_range \
         = maximum_wind_speed_integer
 
 
-# In[7]:
+    notify_vacation_queries('wind_speed_range')
+
+
+    return return_vacation_criteria_dictionary()
+
+
+# In[8]:
 
 
 #*******************************************************************************************
  #
- #  Function Name:  update_dataframe_location
+ #  Function Name:  return_vacation_mask_array
  #
  #  Function Description:
- #      This function takes a dataframe of vacation data, populates the location name 
- #      column, and returns the updated dataframe to the caller.
+ #      This function evaluates every weather range and extra criterion against 
+ #      a city weather dataframe as one boolean mask over the column arrays, 
+ #      combining the comparisons in place instead of building intermediate 
+ #      dataframes, and returns the mask.
+ #
+ #
+ #  Return Type: numpy array
+ #
+ #
+ #  Function Parameters:
+ #
+ #  Type    Name            Description
+ #  -----   -------------   ----------------------------------------------
+ #  dataframe
+ #          input_dataframe The parameter is the city weather dataframe.
+ #  dictionary
+ #          conditions_dictionary
+ #                          The parameter is the dictionary of ranges keyed by column 
+ #                          name plus '_range', like weather_conditions_dictionary; 
+ #                          extra keys filter other columns (None uses 
+ #                          weather_conditions_dictionary).
+ #  function list
+ #          criteria_function_list
+ #                          The parameter is a list of functions that each take the 
+ #                          dataframe and return a boolean array of rows to keep 
+ #                          (None adds no criteria).
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def return_vacation_mask_array \
+        (input_dataframe,
+         conditions_dictionary = None,
+         criteria_function_list = None):
+
+    if conditions_dictionary is None:
+
+        conditions_dictionary = weather_constants.weather_conditions_dictionary
+
+    if criteria_function_list is None:
+
+        criteria_function_list = []
+
+
+    mask_boolean_array = np.ones(len(input_dataframe), dtype = bool)
+
+    comparison_boolean_array = np.empty(len(input_dataframe), dtype = bool)
+
+
+    for condition_key_string, range_list in conditions_dictionary.items():
+
+        column_array \
+            = input_dataframe[condition_key_string.removesuffix('_range')].to_numpy()
+
+        np.greater_equal(column_array, range_list[0], out = comparison_boolean_array)
+
+        np.logical_and(mask_boolean_array, comparison_boolean_array, out = mask_boolean_array)
+
+        np.less_equal(column_array, range_list[1], out = comparison_boolean_array)
+
+        np.logical_and(mask_boolean_array, comparison_boolean_array, out = mask_boolean_array)
+
+
+    for criteria_function in criteria_function_list:
+
+        np.logical_and \
+            (mask_boolean_array, 
+             np.asarray(criteria_function(input_dataframe), dtype = bool), 
+             out = mask_boolean_array)
+
+
+    return mask_boolean_array
+
+
+# In[9]:
+
+
+#*******************************************************************************************
+ #
+ #  Function Name:  return_vacations_dataframe
+ #
+ #  Function Description:
+ #      This function returns the rows of a city weather dataframe that meet the 
+ #      vacation weather ranges and any extra criteria, selected in one pass.
  #
  #
  #  Return Type: dataframe
@@ -304,123 +612,2151 @@ def set_vacation_wind_speed_range \
  #  Type    Name            Description
  #  -----   -------------   ----------------------------------------------
  #  dataframe
- #          input_dataframe The parameter is the input dataframe.
- #  string  column_name_string     
- #                          The parameter is the location column name in the dataframe.
- #  string  category_string The parameter is a search category.
- #  integer search_radius_integer  
- #                          The parameter is the search radius in feet.
- #  integer result_limit_integer   
- #                          The parameter is a limit on the number of results.
- #  string  language_string
- #                          The parameter is the language designation for the search.
+ #          input_dataframe The parameter is the city weather dataframe.
+ #  dictionary
+ #          conditions_dictionary
+ #                          The parameter is the dictionary of ranges keyed by column 
+ #                          name plus '_range' (None uses weather_conditions_dictionary).
+ #  function list
+ #          criteria_function_list
+ #                          The parameter is a list of functions that each take the 
+ #                          dataframe and return a boolean array of rows to keep 
+ #                          (None adds no criteria).
  #
  #
  #  Date                Description                                 Programmer
  #  ---------------     ------------------------------------        ------------------
- #  08/26/2023          Initial Development                         Nicholas J. George
+ #  10/18/2026          Initial Development                         Nicholas J. George
  #
  #******************************************************************************************/
 
-def update_dataframe_location \
+def return_vacations_dataframe \
         (input_dataframe,
-         column_name_string,
-         category_string = 'accommodation.hotel',
-         search_radius_integer = 10000,
-         result_limit_integer = 20,
-         language_string = 'en'):
+         conditions_dictionary = None,
+         criteria_function_list = None):
 
-    parameters_dictionary \
-        = {'categories': [category_string],
-           'filter': '',
-           'bias': '',
-           'limit': result_limit_integer,
-           'lang': language_string,
-           'apiKey': geoapify_key}
+    return \
+        input_dataframe.loc \
+            [return_vacation_mask_array \
+                 (input_dataframe, conditions_dictionary, criteria_function_list)]
 
 
-    if category_string == 'accommodation.hotel':
+# In[10]:
 
-        category_name_string = 'hotel'
 
-    elif category_string == 'catering.restaurant':
+#*******************************************************************************************
+ #
+ #  Function Name:  return_vacation_penalty_array
+ #
+ #  Function Description:
+ #      This function scores every row of a city weather dataframe by how far it 
+ #      falls outside the vacation ranges.  For each range, the distance below the 
+ #      minimum or above the maximum is divided by the span of that weather 
+ #      measure, multiplied by the range's weight, and added to the row's penalty, 
+ #      so rows inside every range score zero.  Rows with missing values score 
+ #      infinity.
+ #
+ #
+ #  Return Type: numpy array
+ #
+ #
+ #  Function Parameters:
+ #
+ #  Type    Name            Description
+ #  -----   -------------   ----------------------------------------------
+ #  dataframe
+ #          input_dataframe The parameter is the city weather dataframe.
+ #  dictionary
+ #          conditions_dictionary
+ #                          The parameter is the dictionary of ranges keyed by column 
+ #                          name plus '_range' (None uses weather_conditions_dictionary).
+ #  dictionary
+ #          weight_dictionary
+ #                          The parameter is the dictionary of weights keyed like the 
+ #                          ranges (missing keys and None weigh one).
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
 
-        category_name_string = 'restaurant'
+def return_vacation_penalty_array \
+        (input_dataframe,
+         conditions_dictionary = None,
+         weight_dictionary = None):
 
-    elif category_string == 'tourism.attraction':
+    if conditions_dictionary is None:
 
-        category_name_string = 'tourism attraction'
+        conditions_dictionary = weather_constants.weather_conditions_dictionary
 
-    else: return input_dataframe
+    if weight_dictionary is None:
 
+        weight_dictionary = {}
 
-    logx.print_and_log_text \
-        (f'STARTING {category_name_string.upper()} SEARCH...\n\n')
 
+    penalty_float_array = np.zeros(len(input_dataframe), dtype = np.float64)
 
-    city_name_string_list = []
+    distance_float_array = np.empty(len(input_dataframe), dtype = np.float64)
 
-    location_name_string_list = []
+    above_float_array = np.empty(len(input_dataframe), dtype = np.float64)
 
 
-    for index, row in input_dataframe.iterrows():
+    for condition_key_string, range_list in conditions_dictionary.items():
 
-        longitude_float = input_dataframe.at[index, 'longitude']
+        column_float_array \
+            = input_dataframe[condition_key_string.removesuffix('_range')] \
+                  .to_numpy(dtype = np.float64)
 
-        latitude_float = input_dataframe.at[index, 'latitude']
+        np.subtract(range_list[0], column_float_array, out = distance_float_array)
 
+        np.subtract(column_float_array, range_list[1], out = above_float_array)
 
-        parameters_dictionary['filter'] \
-            = f'circle:{longitude_float},{latitude_float},{search_radius_integer}'
+        np.maximum(distance_float_array, above_float_array, out = distance_float_array)
 
-        parameters_dictionary['bias'] \
-            = f'proximity:{longitude_float},{latitude_float}'
+        np.maximum(distance_float_array, 0.0, out = distance_float_array)
 
+        np.multiply \
+            (distance_float_array,
+             weight_dictionary.get(condition_key_string, 1.0) \
+             / weather_constants.CONSTANT_WEATHER_CONDITION_SPAN_DICTIONARY \
+                   .get(condition_key_string, 1.0),
+             out = distance_float_array)
 
-        url_string = 'https://api.geoapify.com/v2/places'
+        np.add(penalty_float_array, distance_float_array, out = penalty_float_array)
 
 
-        response_dictionary \
-            = requests.get(url = url_string, params = parameters_dictionary).json()
+    penalty_float_array[np.isnan(penalty_float_array)] = np.inf
 
-        if len(response_dictionary['features']) <= 0:
 
-            continue
+    return penalty_float_array
+
+
+# In[11]:
+
+
+#*******************************************************************************************
+ #
+ #  Function Name:  return_ranked_vacations_dataframe
+ #
+ #  Function Description:
+ #      This function returns the cities with the lowest vacation penalties, best 
+ #      first, with their penalties in a new column.  It selects them with a 
+ #      partition rather than sorting the whole table and sorts only the 
+ #      shortlist; ties at the cut-off are broken arbitrarily.
+ #
+ #
+ #  Return Type: dataframe
+ #
+ #
+ #  Function Parameters:
+ #
+ #  Type    Name            Description
+ #  -----   -------------   ----------------------------------------------
+ #  dataframe
+ #          input_dataframe The parameter is the city weather dataframe.
+ #  integer city_count_integer
+ #                          The parameter is the number of cities to return.
+ #  dictionary
+ #          conditions_dictionary
+ #                          The parameter is the dictionary of ranges keyed by column 
+ #                          name plus '_range' (None uses weather_conditions_dictionary).
+ #  dictionary
+ #          weight_dictionary
+ #                          The parameter is the dictionary of weights keyed like the 
+ #                          ranges (missing keys and None weigh one).
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
 
+def return_ranked_vacations_dataframe \
+        (input_dataframe,
+         city_count_integer = 10,
+         conditions_dictionary = None,
+         weight_dictionary = None):
 
-        for index, location in enumerate(response_dictionary['features']):
+    penalty_float_array \
+        = return_vacation_penalty_array \
+            (input_dataframe, conditions_dictionary, weight_dictionary)
 
-            try:
+    city_count_integer = max(min(city_count_integer, len(input_dataframe)), 0)
 
-                location_name_string = location['properties']['name']
+    if 0 < city_count_integer < len(input_dataframe):
 
-                location_name_string_list.append(location_name_string)
+        position_integer_array \
+            = np.argpartition(penalty_float_array, city_count_integer - 1)[:city_count_integer]
 
-                logx.print_and_log_text \
-                    (f'Located the following {category_name_string}...' \
-                     + f'{location_name_string} ' \
-                     + f"in {input_dataframe.at[index, 'city']}, " \
-                     + f"{input_dataframe.at[index, 'country']}\n\n")
+    else:
 
-                break
+        position_integer_array = np.arange(city_count_integer)
 
-            except:
 
-                continue
+    position_integer_array \
+        = position_integer_array \
+              [np.lexsort((position_integer_array, penalty_float_array[position_integer_array]))]
 
-        city_name_string_list.append(row['city'])
 
+    return \
+        input_dataframe.iloc[position_integer_array] \
+            .assign(penalty = penalty_float_array[position_integer_array])
 
-    temp_dataframe \
-        = input_dataframe.apply \
-            (lambda x: x[input_dataframe['city'].isin(city_name_string_list)])
 
-    temp_dataframe.reset_index(drop = True, inplace = True)
+# In[12]:
+
+
+#*******************************************************************************************
+ #
+ #  Function Name:  return_vacation_criteria_bound_tuple
+ #
+ #  Function Description:
+ #      This function stacks the ranges of a list of vacation criteria into a 
+ #      minimum and a maximum array with one row per criteria and one column per 
+ #      range, and returns the range keys and the two arrays as a tuple.  Every 
+ #      criteria must have the same range keys as the first.
+ #
+ #
+ #  Return Type: tuple
+ #
+ #
+ #  Function Parameters:
+ #
+ #  Type    Name            Description
+ #  -----   -------------   ----------------------------------------------
+ #  dictionary list
+ #          criteria_dictionary_list
+ #                          The parameter is the list of vacation criteria.
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
 
-    temp_dataframe[column_name_string] = pd.Series(location_name_string_list)
+def return_vacation_criteria_bound_tuple(criteria_dictionary_list):
 
+    condition_key_string_list = list(criteria_dictionary_list[0].keys())
 
-    logx.print_and_log_text(f'{category_name_string.upper()} SEARCH COMPLETE...\n\n')
+    bound_float_array \
+        = np.array \
+            ([[criteria_dictionary[condition_key_string] 
+               for condition_key_string in condition_key_string_list]
+              for criteria_dictionary in criteria_dictionary_list],
+             dtype = np.float64) \
+              .reshape(len(criteria_dictionary_list), len(condition_key_string_list), 2)
+
+
+    return \
+        condition_key_string_list, \
+        np.ascontiguousarray(bound_float_array[:, :, 0]), \
+        np.ascontiguousarray(bound_float_array[:, :, 1])
+
+
+# In[13]:
+
+
+#*******************************************************************************************
+ #
+ #  Function Name:  return_vacation_criteria_matrix_array
+ #
+ #  Function Description:
+ #      This function evaluates many vacation criteria against one city weather 
+ #      dataframe at once.  It compares a block of criteria bounds with a block of 
+ #      rows by broadcasting, sized so the working arrays stay in cache, and a 
+ #      thread pool works through the criteria blocks in parallel.  The 'mask' 
+ #      mode returns a criteria by row boolean array, 'score' returns the number of 
+ #      ranges each row meets for each criteria, and 'count' returns only the 
+ #      number of matching rows for each criteria.
+ #
+ #
+ #  Return Type: numpy array
+ #
+ #
+ #  Function Parameters:
+ #
+ #  Type    Name            Description
+ #  -----   -------------   ----------------------------------------------
+ #  dataframe
+ #          input_dataframe The parameter is the city weather dataframe.
+ #  dictionary list
+ #          criteria_dictionary_list
+ #                          The parameter is the list of vacation criteria.
+ #  string  mode_string     The parameter is 'mask', 'score', or 'count'.
+ #  integer worker_count_integer
+ #                          The parameter is the number of threads (None uses the 
+ #                          number of processors).
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def return_vacation_criteria_matrix_array \
+        (input_dataframe,
+         criteria_dictionary_list,
+         mode_string = 'mask',
+         worker_count_integer = None):
+
+    if mode_string not in ('mask', 'score', 'count'):
+
+        raise ValueError(f'The matrix mode, {mode_string}, is not mask, score, or count.')
+
+
+    condition_key_string_list, minimum_float_array, maximum_float_array \
+        = return_vacation_criteria_bound_tuple(criteria_dictionary_list)
+
+    value_array_list \
+        = [input_dataframe[condition_key_string.removesuffix('_range')] \
+               .to_numpy(dtype = np.float64)
+           for condition_key_string in condition_key_string_list]
+
+    criteria_count_integer = len(criteria_dictionary_list)
+
+    row_count_integer = len(input_dataframe)
+
+
+    if mode_string == 'mask':
+
+        matrix_array = np.empty((criteria_count_integer, row_count_integer), dtype = bool)
+
+    elif mode_string == 'score':
+
+        matrix_array = np.empty((criteria_count_integer, row_count_integer), dtype = np.uint8)
+
+    else:
+
+        matrix_array = np.zeros(criteria_count_integer, dtype = np.int64)
+
+
+    def evaluate_criteria_block(criteria_start_integer):
+
+        criteria_stop_integer \
+            = min(criteria_start_integer + CONSTANT_CRITERIA_BLOCK_SIZE, criteria_count_integer)
+
+        block_shape_tuple \
+            = (criteria_stop_integer - criteria_start_integer, CONSTANT_ROW_BLOCK_SIZE)
+
+        block_boolean_array = np.empty(block_shape_tuple, dtype = bool)
+
+        comparison_boolean_array = np.empty(block_shape_tuple, dtype = bool)
+
+        score_integer_array = np.empty(block_shape_tuple, dtype = np.uint8)
+
+
+        for row_start_integer in range(0, row_count_integer, CONSTANT_ROW_BLOCK_SIZE):
+
+            row_stop_integer \
+                = min(row_start_integer + CONSTANT_ROW_BLOCK_SIZE, row_count_integer)
+
+            width_integer = row_stop_integer - row_start_integer
+
+            comparison_view_array = comparison_boolean_array[:, :width_integer]
+
+            if mode_string == 'score':
+
+                result_array = score_integer_array[:, :width_integer]
+
+                result_array.fill(0)
+
+            else:
+
+                result_array = block_boolean_array[:, :width_integer]
+
+                result_array.fill(True)
+
+
+            for column_integer, value_array in enumerate(value_array_list):
+
+                row_value_array = value_array[row_start_integer:row_stop_integer]
+
+                minimum_bound_array \
+                    = minimum_float_array \
+                          [criteria_start_integer:criteria_stop_integer, column_integer, None]
+
+                maximum_bound_array \
+                    = maximum_float_array \
+                          [criteria_start_integer:criteria_stop_integer, column_integer, None]
+
+                np.greater_equal \
+                    (row_value_array, minimum_bound_array, out = comparison_view_array)
+
+                if mode_string == 'score':
+
+                    upper_view_array = block_boolean_array[:, :width_integer]
+
+                    np.less_equal(row_value_array, maximum_bound_array, out = upper_view_array)
+
+                    np.logical_and \
+                        (comparison_view_array, upper_view_array, out = comparison_view_array)
+
+                    np.add(result_array, comparison_view_array, out = result_array)
+
+                else:
+
+                    np.logical_and(result_array, comparison_view_array, out = result_array)
+
+                    np.less_equal \
+                        (row_value_array, maximum_bound_array, out = comparison_view_array)
+
+                    np.logical_and(result_array, comparison_view_array, out = result_array)
+
+
+            if mode_string == 'count':
+
+                matrix_array[criteria_start_integer:criteria_stop_integer] \
+                    += np.count_nonzero(result_array, axis = 1)
+
+            else:
+
+                matrix_array \
+                    [criteria_start_integer:criteria_stop_integer, 
+                     row_start_integer:row_stop_integer] = result_array
+
+
+    with ThreadPoolExecutor(max_workers = worker_count_integer) as executor:
+
+        list(executor.map \
+                 (evaluate_criteria_block, 
+                  range(0, criteria_count_integer, CONSTANT_CRITERIA_BLOCK_SIZE)))
+
+
+    return matrix_array
+
+
+# In[14]:
+
+
+#*******************************************************************************************
+ #
+ #  Function Name:  return_vacation_range_index_dictionary
+ #
+ #  Function Description:
+ #      This function builds a range index over the criterion columns of a city 
+ #      weather dataframe: for each column, the row positions in its sorted order 
+ #      and every criterion column's values rearranged into that order, so a query 
+ #      reads each candidate's other values from contiguous memory.
+ #
+ #
+ #  Return Type: dictionary
+ #
+ #
+ #  Function Parameters:
+ #
+ #  Type    Name            Description
+ #  -----   -------------   ----------------------------------------------
+ #  dataframe
+ #          input_dataframe The parameter is the city weather dataframe.
+ #  string list
+ #          column_string_list
+ #                          The parameter is the list of columns to index (None indexes 
+ #                          the columns in weather_conditions_dictionary).
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def return_vacation_range_index_dictionary \
+        (input_dataframe,
+         column_string_list = None):
+
+    if column_string_list is None:
+
+        column_string_list \
+            = [condition_key_string.removesuffix('_range') 
+               for condition_key_string in weather_constants.weather_conditions_dictionary]
+
+
+    range_index_dictionary = {'row_count': len(input_dataframe), 'columns': {}}
+
+    for column_string in column_string_list:
+
+        order_integer_array \
+            = np.argsort(input_dataframe[column_string].to_numpy(), kind = 'stable')
+
+
+        range_index_dictionary['columns'][column_string] \
+            = {'order': order_integer_array,
+               'values': {value_column_string: 
+                              input_dataframe[value_column_string].to_numpy()[order_integer_array]
+                          for value_column_string in column_string_list}}
+
+
+    return range_index_dictionary
+
+
+# In[15]:
+
+
+#*******************************************************************************************
+ #
+ #  Function Name:  return_typed_bound
+ #
+ #  Function Description:
+ #      This function converts a range bound to a numpy type, rounding toward the 
+ #      inside of the range, so comparing or searching an array of that type gives 
+ #      the same answer as the exact bound without numpy converting the whole array 
+ #      to the bound's type.  It returns None if no value of the type can meet a 
+ #      minimum ('left') or maximum ('right') bound.
+ #
+ #
+ #  Return Type: numpy scalar
+ #
+ #
+ #  Function Parameters:
+ #
+ #  Type    Name            Description
+ #  -----   -------------   ----------------------------------------------
+ #  dtype   array_dtype     The parameter is the numpy type of the array.
+ #  float   bound_float     The parameter is the range bound.
+ #  string  side_string     The parameter is 'left' for a minimum or 'right' for a 
+ #                          maximum.
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def return_typed_bound \
+        (array_dtype,
+         bound_float,
+         side_string):
+
+    if np.issubdtype(array_dtype, np.integer):
+
+        integer_information = np.iinfo(array_dtype)
+
+        if side_string == 'left':
+
+            bound_float = math.ceil(bound_float)
+
+        else:
+
+            bound_float = math.floor(bound_float)
+
+
+        if (side_string == 'left' and bound_float > integer_information.max) \
+           or (side_string == 'right' and bound_float < integer_information.min):
+
+            return None
+
+
+        return \
+            array_dtype.type \
+                (min(max(bound_float, integer_information.min), integer_information.max))
+
+
+    typed_bound = array_dtype.type(bound_float)
+
+    if side_string == 'left' and typed_bound < bound_float:
+
+        typed_bound = np.nextafter(typed_bound, array_dtype.type(np.inf))
+
+    elif side_string == 'right' and typed_bound > bound_float:
+
+        typed_bound = np.nextafter(typed_bound, array_dtype.type(-np.inf))
+
+
+    return typed_bound
+
+
+# In[16]:
+
+
+#*******************************************************************************************
+ #
+ #  Function Name:  return_vacation_index_positions_array
+ #
+ #  Function Description:
+ #      This function answers a multi-criterion range query from a range index 
+ #      and returns the matching row positions in table order.  Two binary 
+ #      searches per criterion find each criterion's slice of its sorted order; 
+ #      the rows in the smallest slice are the candidates, and the function 
+ #      checks the other ranges against that slice of the rearranged columns, so 
+ #      the work grows with the smallest candidate set, not the table.
+ #
+ #
+ #  Return Type: numpy array
+ #
+ #
+ #  Function Parameters:
+ #
+ #  Type    Name            Description
+ #  -----   -------------   ----------------------------------------------
+ #  dictionary
+ #          range_index_dictionary
+ #                          The parameter is the range index.
+ #  dictionary
+ #          conditions_dictionary
+ #                          The parameter is the dictionary of ranges keyed by column 
+ #                          name plus '_range' (None uses weather_conditions_dictionary).
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def return_vacation_index_positions_array \
+        (range_index_dictionary,
+         conditions_dictionary = None):
+
+    if conditions_dictionary is None:
+
+        conditions_dictionary = weather_constants.weather_conditions_dictionary
+
+
+    range_dictionary \
+        = {condition_key_string.removesuffix('_range'): range_list
+           for condition_key_string, range_list in conditions_dictionary.items()}
+
+    if len(range_dictionary) == 0:
+
+        return np.arange(range_index_dictionary['row_count'])
+
+
+    slice_tuple_list = []
+
+    for column_string, range_list in range_dictionary.items():
+
+        column_index_dictionary = range_index_dictionary['columns'][column_string]
+
+        sorted_array = column_index_dictionary['values'][column_string]
+
+        minimum_bound = return_typed_bound(sorted_array.dtype, range_list[0], 'left')
+
+        maximum_bound = return_typed_bound(sorted_array.dtype, range_list[1], 'right')
+
+        if minimum_bound is None or maximum_bound is None:
+
+            return np.empty(0, dtype = np.intp)
+
+
+        start_integer = int(np.searchsorted(sorted_array, minimum_bound, 'left'))
+
+        slice_tuple_list.append \
+            ((column_string,
+              start_integer,
+              max(int(np.searchsorted(sorted_array, maximum_bound, 'right')), start_integer)))
+
+
+    column_string, start_integer, stop_integer \
+        = min(slice_tuple_list, key = lambda slice_tuple: slice_tuple[2] - slice_tuple[1])
+
+    column_index_dictionary = range_index_dictionary['columns'][column_string]
+
+    mask_boolean_array = np.ones(stop_integer - start_integer, dtype = bool)
+
+
+    for value_column_string, range_list in range_dictionary.items():
+
+        if value_column_string == column_string:
+
+            continue
+
+
+        value_array \
+            = column_index_dictionary['values'][value_column_string][start_integer:stop_integer]
+
+        mask_boolean_array \
+            &= value_array >= return_typed_bound(value_array.dtype, range_list[0], 'left')
+
+        mask_boolean_array \
+            &= value_array <= return_typed_bound(value_array.dtype, range_list[1], 'right')
+
+
+    return \
+        np.sort \
+            (column_index_dictionary['order'][start_integer:stop_integer][mask_boolean_array])
+
+
+# In[17]:
+
+
+#*******************************************************************************************
+ #
+ #  Function Name:  return_indexed_vacations_dataframe
+ #
+ #  Function Description:
+ #      This function returns the rows of a city weather dataframe that meet the 
+ #      vacation weather ranges using a range index built from the same dataframe.
+ #
+ #
+ #  Return Type: dataframe
+ #
+ #
+ #  Function Parameters:
+ #
+ #  Type    Name            Description
+ #  -----   -------------   ----------------------------------------------
+ #  dataframe
+ #          input_dataframe The parameter is the city weather dataframe.
+ #  dictionary
+ #          range_index_dictionary
+ #                          The parameter is the range index of the dataframe.
+ #  dictionary
+ #          conditions_dictionary
+ #                          The parameter is the dictionary of ranges keyed by column 
+ #                          name plus '_range' (None uses weather_conditions_dictionary).
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def return_indexed_vacations_dataframe \
+        (input_dataframe,
+         range_index_dictionary,
+         conditions_dictionary = None):
+
+    return \
+        input_dataframe.iloc \
+            [return_vacation_index_positions_array \
+                 (range_index_dictionary, conditions_dictionary)]
+
+
+# In[18]:
+
+
+#*******************************************************************************************
+ #
+ #  Function Name:  return_vacation_query_dictionary
+ #
+ #  Function Description:
+ #      This function returns a vacation query for a city weather dataframe: the 
+ #      mask for each weather range and for the extra criteria, the combined mask, 
+ #      the ranges those masks were computed from, and the set of ranges that have 
+ #      changed since.  A query that follows weather_conditions_dictionary also 
+ #      records the version of each range, which the vacation range setters 
+ #      advance, so it sees their changes without holding a place in a registry.
+ #
+ #
+ #  Return Type: dictionary
+ #
+ #
+ #  Function Parameters:
+ #
+ #  Type    Name            Description
+ #  -----   -------------   ----------------------------------------------
+ #  dataframe
+ #          input_dataframe The parameter is the city weather dataframe.
+ #  dictionary
+ #          conditions_dictionary
+ #                          The parameter is the dictionary of ranges keyed by column 
+ #                          name plus '_range' (None follows 
+ #                          weather_conditions_dictionary).
+ #  function list
+ #          criteria_function_list
+ #                          The parameter is a list of functions that each take the 
+ #                          dataframe and return a boolean array of rows to keep 
+ #                          (None adds no criteria).
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def return_vacation_query_dictionary \
+        (input_dataframe,
+         conditions_dictionary = None,
+         criteria_function_list = None):
+
+    version_dictionary = None
+
+    if conditions_dictionary is None:
+
+        conditions_dictionary = weather_constants.weather_conditions_dictionary
+
+        version_dictionary = dict(VACATION_RANGE_VERSION_DICTIONARY)
+
+
+    mask_dictionary \
+        = {condition_key_string: return_vacation_mask_array \
+                                     (input_dataframe, {condition_key_string: range_list})
+           for condition_key_string, range_list in conditions_dictionary.items()}
+
+    mask_dictionary[None] \
+        = return_vacation_mask_array(input_dataframe, {}, criteria_function_list)
+
+    mask_boolean_array = np.ones(len(input_dataframe), dtype = bool)
+
+    for condition_mask_boolean_array in mask_dictionary.values():
+
+        mask_boolean_array &= condition_mask_boolean_array
+
+
+    query_dictionary \
+        = {'dataframe': input_dataframe,
+           'conditions': conditions_dictionary,
+           'applied_conditions': {condition_key_string: list(range_list)
+                                  for condition_key_string, range_list 
+                                  in conditions_dictionary.items()},
+           'masks': mask_dictionary,
+           'mask': mask_boolean_array,
+           'dirty': set(),
+           'stale': set(),
+           'versions': version_dictionary}
+
+
+    return query_dictionary
+
+
+# In[19]:
+
+
+#*******************************************************************************************
+ #
+ #  Function Name:  notify_vacation_queries
+ #
+ #  Function Description:
+ #      This subroutine marks a weather range as changed in vacation queries so 
+ #      their next refresh recomputes only that range; without a list of queries, 
+ #      it advances the range's version for every query that follows 
+ #      weather_conditions_dictionary.
+ #
+ #
+ #  Return Type: n/a
+ #
+ #
+ #  Function Parameters:
+ #
+ #  Type    Name            Description
+ #  -----   -------------   ----------------------------------------------
+ #  string  condition_key_string
+ #                          The parameter is the changed range key, like 
+ #                          'cloudiness_range'.
+ #  dictionary list
+ #          query_dictionary_list
+ #                          The parameter is the list of queries to notify (None 
+ #                          notifies every query that follows 
+ #                          weather_conditions_dictionary).
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def notify_vacation_queries \
+        (condition_key_string,
+         query_dictionary_list = None):
+
+    if query_dictionary_list is None:
+
+        VACATION_RANGE_VERSION_DICTIONARY[condition_key_string] \
+            = VACATION_RANGE_VERSION_DICTIONARY.get(condition_key_string, 0) + 1
+
+        return
+
+
+    for query_dictionary in query_dictionary_list:
+
+        query_dictionary['dirty'].add(condition_key_string)
+
+
+# In[20]:
+
+
+#*******************************************************************************************
+ #
+ #  Function Name:  return_vacation_query_mask_array
+ #
+ #  Function Description:
+ #      This function brings a vacation query up to date with its ranges and 
+ #      returns the combined mask.  A range that only narrowed is checked against 
+ #      the current matching rows alone; its own mask is then out of date, so it is 
+ #      recomputed in full only if another range widens and the masks must be 
+ #      combined again.  Any other change recomputes that range's mask over the 
+ #      whole column and combines the cached masks.  Narrowing writes a new mask, 
+ #      so a mask returned earlier never changes under the caller.
+ #
+ #
+ #  Return Type: numpy array
+ #
+ #
+ #  Function Parameters:
+ #
+ #  Type    Name            Description
+ #  -----   -------------   ----------------------------------------------
+ #  dictionary
+ #          query_dictionary
+ #                          The parameter is the vacation query.
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def return_vacation_query_mask_array(query_dictionary):
+
+    conditions_dictionary = query_dictionary['conditions']
+
+    applied_conditions_dictionary = query_dictionary['applied_conditions']
+
+    mask_dictionary = query_dictionary['masks']
+
+    stale_key_string_set = query_dictionary['stale']
+
+    narrowed_key_string_list = []
+
+    recombine_boolean = False
+
+
+    if query_dictionary['versions'] is not None:
+
+        for condition_key_string, version_integer in VACATION_RANGE_VERSION_DICTIONARY.items():
+
+            if query_dictionary['versions'].get(condition_key_string, 0) != version_integer:
+
+                query_dictionary['dirty'].add(condition_key_string)
+
+        query_dictionary['versions'] = dict(VACATION_RANGE_VERSION_DICTIONARY)
+
+
+    for condition_key_string in sorted(query_dictionary['dirty']):
+
+        range_list = conditions_dictionary.get(condition_key_string)
+
+        applied_range_list = applied_conditions_dictionary.get(condition_key_string)
+
+        if range_list is None:
+
+            mask_dictionary.pop(condition_key_string, None)
+
+            applied_conditions_dictionary.pop(condition_key_string, None)
+
+            stale_key_string_set.discard(condition_key_string)
+
+            recombine_boolean = True
+
+        elif applied_range_list is not None \
+             and list(range_list) == applied_range_list:
+
+            continue
+
+        elif applied_range_list is not None \
+             and range_list[0] >= applied_range_list[0] \
+             and range_list[1] <= applied_range_list[1]:
+
+            narrowed_key_string_list.append(condition_key_string)
+
+        else:
+
+            stale_key_string_set.add(condition_key_string)
+
+            recombine_boolean = True
+
+    query_dictionary['dirty'].clear()
+
+
+    if recombine_boolean:
+
+        for condition_key_string in stale_key_string_set:
+
+            mask_dictionary[condition_key_string] \
+                = return_vacation_mask_array \
+                    (query_dictionary['dataframe'], 
+                     {condition_key_string: conditions_dictionary[condition_key_string]})
+
+            applied_conditions_dictionary[condition_key_string] \
+                = list(conditions_dictionary[condition_key_string])
+
+        stale_key_string_set.clear()
+
+
+        mask_boolean_array = np.ones(len(query_dictionary['dataframe']), dtype = bool)
+
+        for condition_mask_boolean_array in mask_dictionary.values():
+
+            mask_boolean_array &= condition_mask_boolean_array
+
+        query_dictionary['mask'] = mask_boolean_array
+
+
+    mask_boolean_array = query_dictionary['mask']
+
+    if len(narrowed_key_string_list) > 0:
+
+        mask_boolean_array = mask_boolean_array.copy()
+
+        query_dictionary['mask'] = mask_boolean_array
+
+
+    for condition_key_string in narrowed_key_string_list:
+
+        range_list = conditions_dictionary[condition_key_string]
+
+        position_integer_array = np.flatnonzero(mask_boolean_array)
+
+        value_array \
+            = query_dictionary['dataframe'][condition_key_string.removesuffix('_range')] \
+                  .to_numpy()[position_integer_array]
+
+        mask_boolean_array \
+            [position_integer_array[(value_array < range_list[0]) 
+                                    | (value_array > range_list[1])]] = False
+
+        applied_conditions_dictionary[condition_key_string] = list(range_list)
+
+        stale_key_string_set.add(condition_key_string)
+
+
+    return mask_boolean_array
+
+
+# In[21]:
+
+
+#*******************************************************************************************
+ #
+ #  Function Name:  return_vacation_query_dataframe
+ #
+ #  Function Description:
+ #      This function brings a vacation query up to date with its ranges and 
+ #      returns the matching rows of its city weather dataframe.
+ #
+ #
+ #  Return Type: dataframe
+ #
+ #
+ #  Function Parameters:
+ #
+ #  Type    Name            Description
+ #  -----   -------------   ----------------------------------------------
+ #  dictionary
+ #          query_dictionary
+ #                          The parameter is the vacation query.
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def return_vacation_query_dataframe(query_dictionary):
+
+    return \
+        query_dictionary['dataframe'].loc \
+            [return_vacation_query_mask_array(query_dictionary)]
+
+
+# In[22]:
+
+
+#*******************************************************************************************
+ #
+ #  Function Name:  return_places_cache_key_string
+ #
+ #  Function Description:
+ #      This function returns the places cache key for a search.  The coordinates 
+ #      are written to six decimal places, about 0.1 meters, so only searches 
+ #      around the same location share an entry; nearby cities share a search 
+ #      only when the caller asks for it with a cluster radius.
+ #
+ #
+ #  Return Type: string
+ #
+ #
+ #  Function Parameters:
+ #
+ #  Type    Name            Description
+ #  -----   -------------   ----------------------------------------------
+ #  float   latitude_float  The parameter is the search latitude.
+ #  float   longitude_float The parameter is the search longitude.
+ #  string  category_string The parameter is a search category.
+ #  integer search_radius_integer  
+ #                          The parameter is the search radius in meters.
+ #  integer result_limit_integer   
+ #                          The parameter is a limit on the number of results.
+ #  string  language_string
+ #                          The parameter is the language designation for the search.
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def return_places_cache_key_string \
+        (latitude_float,
+         longitude_float,
+         category_string,
+         search_radius_integer,
+         result_limit_integer,
+         language_string):
+
+    return \
+        f'{latitude_float:.6f}|{longitude_float:.6f}|{category_string}|' \
+        + f'{search_radius_integer}|{result_limit_integer}|{language_string}'
+
+
+# In[23]:
+
+
+#*******************************************************************************************
+ #
+ #  Function Name:  return_place_field_list_list
+ #
+ #  Function Description:
+ #      This function returns the name, latitude, longitude, and categories of 
+ #      each feature in a places response as a list of lists.
+ #
+ #
+ #  Return Type: list
+ #
+ #
+ #  Function Parameters:
+ #
+ #  Type    Name            Description
+ #  -----   -------------   ----------------------------------------------
+ #  dictionary
+ #          response_dictionary
+ #                          The parameter is the decoded places response.
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def return_place_field_list_list(response_dictionary):
+
+    place_field_list_list = []
+
+
+    for location in response_dictionary['features']:
+
+        properties_dictionary = location.get('properties', {})
+
+        place_field_list_list.append \
+            ([properties_dictionary.get('name'),
+              properties_dictionary.get('lat'),
+              properties_dictionary.get('lon'),
+              properties_dictionary.get('categories', [])])
+
+
+    return place_field_list_list
+
+
+# In[24]:
+
+
+#*******************************************************************************************
+ #
+ #  Function Name:  set_places_backend
+ #
+ #  Function Description:
+ #      This subroutine selects the backend for place searches: the Geoapify 
+ #      Places API, which is the default, or a local index of points of interest 
+ #      loaded from a Parquet, Arrow, or CSV file, which answers searches offline.
+ #
+ #
+ #  Return Type: n/a
+ #
+ #
+ #  Function Parameters:
+ #
+ #  Type    Name            Description
+ #  -----   -------------   ----------------------------------------------
+ #  string  backend_string  The parameter is the backend name: 'geoapify' or 'local'.
+ #  string  poi_file_path_string
+ #                          The parameter is the points of interest file path for 
+ #                          the local backend.
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def set_places_backend \
+        (backend_string, 
+         poi_file_path_string = None):
+
+    global PLACES_INDEX_DICTIONARY
+
+
+    if backend_string not in ['geoapify', 'local']:
+
+        raise ValueError(f'The places backend, {backend_string}, is not valid.')
+
+    elif backend_string == 'local' and poi_file_path_string is None:
+
+        raise ValueError('The places backend, local, requires a points of interest file.')
+
+
+    if backend_string == 'local':
+
+        PLACES_INDEX_DICTIONARY = return_places_index_dictionary(poi_file_path_string)
+
+    else:
+
+        PLACES_INDEX_DICTIONARY = None
+
+
+# In[25]:
+
+
+#*******************************************************************************************
+ #
+ #  Function Name:  return_places_index_dictionary
+ #
+ #  Function Description:
+ #      This function loads points of interest with name, latitude, longitude, and 
+ #      categories columns from a Parquet, Arrow, or CSV file, such as an 
+ #      OpenStreetMap extract, and returns them with a grid index of their 
+ #      coordinates and a membership mask per category.  As in Geoapify, each 
+ #      place lists its parent categories too; the categories column is a list of 
+ #      strings or a comma-separated string.
+ #
+ #
+ #  Return Type: dictionary
+ #
+ #
+ #  Function Parameters:
+ #
+ #  Type    Name            Description
+ #  -----   -------------   ----------------------------------------------
+ #  string  poi_file_path_string
+ #                          The parameter is the points of interest file path.
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def return_places_index_dictionary(poi_file_path_string):
+
+    poi_table \
+        = ds.dataset \
+            (poi_file_path_string, 
+             format = storagex.return_weather_file_format_string(poi_file_path_string)) \
+            .to_table(columns = CONSTANT_PLACES_INDEX_COLUMN_LIST)
+
+    categories_list_array = poi_table['categories'].combine_chunks()
+
+    if pa.types.is_string(categories_list_array.type) \
+            or pa.types.is_large_string(categories_list_array.type):
+
+        categories_list_array = pc.split_pattern(categories_list_array, ',')
+
+
+    latitude_float_array \
+        = poi_table['latitude'].to_numpy().astype(np.float64)
+
+    longitude_float_array \
+        = poi_table['longitude'].to_numpy().astype(np.float64)
+
+
+    category_dictionary_array \
+        = pc.dictionary_encode(pc.utf8_trim_whitespace(pc.list_flatten(categories_list_array)))
+
+    category_object_array = category_dictionary_array.dictionary.to_numpy(zero_copy_only = False)
+
+    category_index_integer_array = category_dictionary_array.indices.to_numpy()
+
+    parent_index_integer_array \
+        = pc.list_parent_indices(categories_list_array).to_numpy()
+
+    category_mask_dictionary = {}
+
+    for category_index, category_string in enumerate(category_object_array):
+
+        category_mask_boolean_array = np.zeros(poi_table.num_rows, dtype = bool)
+
+        category_mask_boolean_array \
+            [parent_index_integer_array[category_index_integer_array == category_index]] = True
+
+        category_mask_dictionary[category_string] = category_mask_boolean_array
+
+
+    return \
+        {'name_array': poi_table['name'].combine_chunks(),
+         'latitude_array': latitude_float_array,
+         'longitude_array': longitude_float_array,
+         'categories_list_array': categories_list_array,
+         'category_mask_dictionary': category_mask_dictionary,
+         'grid_index_dictionary': 
+             spatialx.return_grid_index_dictionary \
+                 (latitude_float_array, 
+                  longitude_float_array, 
+                  CONSTANT_PLACES_INDEX_CELL_DEGREES)}
+
+
+# In[26]:
+
+
+#*******************************************************************************************
+ #
+ #  Function Name:  return_local_places_dictionary
+ #
+ #  Function Description:
+ #      This function answers a places search from a local places index and 
+ #      returns a response in the Geoapify FeatureCollection structure: the places 
+ #      in any of the categories within the radius, nearest first, up to the limit.
+ #
+ #
+ #  Return Type: dictionary
+ #
+ #
+ #  Function Parameters:
+ #
+ #  Type    Name            Description
+ #  -----   -------------   ----------------------------------------------
+ #  dictionary
+ #          places_index_dictionary
+ #                          The parameter is the local places index.
+ #  float   latitude_float  The parameter is the search latitude.
+ #  float   longitude_float The parameter is the search longitude.
+ #  list    category_string_list
+ #                          The parameter is the list of search categories.
+ #  integer search_radius_integer  
+ #                          The parameter is the search radius in meters.
+ #  integer result_limit_integer   
+ #                          The parameter is a limit on the number of results.
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def return_local_places_dictionary \
+        (places_index_dictionary,
+         latitude_float,
+         longitude_float,
+         category_string_list,
+         search_radius_integer,
+         result_limit_integer):
+
+    candidate_index_integer_array \
+        = spatialx.return_grid_candidate_index_array \
+            (places_index_dictionary['grid_index_dictionary'], 
+             latitude_float, 
+             longitude_float, 
+             search_radius_integer)
+
+    category_mask_boolean_array = np.zeros(len(candidate_index_integer_array), dtype = bool)
+
+    for category_string in category_string_list:
+
+        if category_string in places_index_dictionary['category_mask_dictionary']:
+
+            category_mask_boolean_array \
+                |= places_index_dictionary['category_mask_dictionary'] \
+                       [category_string][candidate_index_integer_array]
+
+    candidate_index_integer_array = candidate_index_integer_array[category_mask_boolean_array]
+
+
+    distance_float_array \
+        = spatialx.return_haversine_distance_array \
+            (latitude_float,
+             longitude_float,
+             places_index_dictionary['latitude_array'][candidate_index_integer_array],
+             places_index_dictionary['longitude_array'][candidate_index_integer_array])
+
+    within_boolean_array = distance_float_array <= search_radius_integer
+
+    candidate_index_integer_array = candidate_index_integer_array[within_boolean_array]
+
+    distance_float_array = distance_float_array[within_boolean_array]
+
+
+    order_integer_array = np.argsort(distance_float_array, kind = 'stable')[:result_limit_integer]
+
+    place_index_integer_array = candidate_index_integer_array[order_integer_array]
+
+
+    feature_dictionary_list = []
+
+    for place_index, distance_float, name_string, categories_string_list \
+            in zip(place_index_integer_array,
+                   distance_float_array[order_integer_array],
+                   places_index_dictionary['name_array'] \
+                       .take(place_index_integer_array).to_pylist(),
+                   places_index_dictionary['categories_list_array'] \
+                       .take(place_index_integer_array).to_pylist()):
+
+        latitude_float = float(places_index_dictionary['latitude_array'][place_index])
+
+        longitude_float = float(places_index_dictionary['longitude_array'][place_index])
+
+        feature_dictionary_list.append \
+            ({'type': 'Feature',
+              'properties': 
+                  {'name': name_string,
+                   'lat': latitude_float,
+                   'lon': longitude_float,
+                   'categories': [category_string.strip() 
+                                  for category_string in categories_string_list],
+                   'distance': int(round(distance_float))},
+              'geometry': {'type': 'Point', 'coordinates': [longitude_float, latitude_float]}})
+
+
+    return {'type': 'FeatureCollection', 'features': feature_dictionary_list}
+
+
+# In[27]:
+
+
+#*******************************************************************************************
+ #
+ #  Function Name:  return_location_place_field_list_list
+ #
+ #  Function Description:
+ #      This function searches for places around a location and returns the place 
+ #      field lists (None on failure) and the response status as a tuple.  It 
+ #      copies the search parameters, so concurrent searches can share them.  With 
+ #      the local backend selected, the local places index answers the search.
+ #
+ #
+ #  Return Type: tuple
+ #
+ #
+ #  Function Parameters:
+ #
+ #  Type    Name            Description
+ #  -----   -------------   ----------------------------------------------
+ #  float   latitude_float  The parameter is the search latitude.
+ #  float   longitude_float The parameter is the search longitude.
+ #  dictionary
+ #          parameters_dictionary
+ #                          The parameter is the dictionary of search parameters 
+ #                          without the filter and bias.
+ #  integer search_radius_integer  
+ #                          The parameter is the search radius in meters.
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def return_location_place_field_list_list \
+        (latitude_float,
+         longitude_float,
+         parameters_dictionary,
+         search_radius_integer):
+
+    if PLACES_INDEX_DICTIONARY is not None:
+
+        return \
+            return_place_field_list_list \
+                (return_local_places_dictionary \
+                     (PLACES_INDEX_DICTIONARY,
+                      latitude_float,
+                      longitude_float,
+                      ','.join(parameters_dictionary['categories']).split(','),
+                      search_radius_integer,
+                      parameters_dictionary['limit'])), \
+            requestsx.RESPONSE_STATUS_OK
+
+
+    parameters_dictionary \
+        = parameters_dictionary \
+          | {'filter': f'circle:{longitude_float},{latitude_float},{search_radius_integer}',
+             'bias': f'proximity:{longitude_float},{latitude_float}'}
+
+
+    http_response, status_string \
+        = requestsx.return_http_response_and_status \
+            (f'{weather_constants.CONSTANT_GEOAPIFY_WEBSITE}/v2/places', parameters_dictionary)
+
+    if status_string != requestsx.RESPONSE_STATUS_OK:
+
+        return None, status_string
+
+
+    return \
+        return_place_field_list_list(requestsx.return_json_dictionary(http_response.content)), \
+        status_string
+
+
+# In[28]:
+
+
+#*******************************************************************************************
+ #
+ #  Function Name:  return_place_name_string
+ #
+ #  Function Description:
+ #      This function returns the name of a place from a search's place field 
+ #      lists, skipping places without names or outside a category.  Without a 
+ #      maximum distance, it returns the first such place, which is the nearest to 
+ #      the search center; with one, it returns the place nearest the given 
+ #      location within that distance.  It returns None if no place qualifies.
+ #
+ #
+ #  Return Type: string
+ #
+ #
+ #  Function Parameters:
+ #
+ #  Type    Name            Description
+ #  -----   -------------   ----------------------------------------------
+ #  list    place_field_list_list
+ #                          The parameter is the list of place field lists.
+ #  string  category_string The parameter is the place category (None accepts all).
+ #  float   latitude_float  The parameter is the location latitude.
+ #  float   longitude_float The parameter is the location longitude.
+ #  float   maximum_distance_meters_float
+ #                          The parameter is the maximum distance in meters from the 
+ #                          location (None takes the first place).
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def return_place_name_string \
+        (place_field_list_list,
+         category_string,
+         latitude_float,
+         longitude_float,
+         maximum_distance_meters_float):
+
+    place_field_list_list \
+        = [place_field_list for place_field_list in place_field_list_list
+           if place_field_list[0] is not None 
+           and (category_string is None or category_string in place_field_list[3])]
+
+    if len(place_field_list_list) == 0:
+
+        return None
+
+    elif maximum_distance_meters_float is None:
+
+        return place_field_list_list[0][0]
+
+
+    distance_float_array \
+        = spatialx.return_haversine_distance_array \
+            (latitude_float,
+             longitude_float,
+             [place_field_list[1] for place_field_list in place_field_list_list],
+             [place_field_list[2] for place_field_list in place_field_list_list])
+
+    nearest_index = int(np.argmin(distance_float_array))
+
+    if distance_float_array[nearest_index] > maximum_distance_meters_float:
+
+        return None
+
+
+    return place_field_list_list[nearest_index][0]
+
+
+# In[29]:
+
+
+#*******************************************************************************************
+ #
+ #  Function Name:  return_location_place_field_list_list_dictionary
+ #
+ #  Function Description:
+ #      This function looks up the places around each row of a dataframe and 
+ #      returns the cache key for each row, a dictionary of cache keys and place 
+ #      field lists, and a dictionary of cache keys and statuses for failed 
+ #      searches as a tuple.  Results within the cache time-to-live come from the 
+ #      local places cache; each remaining cache key is searched once on a bounded 
+ #      thread pool under the Geoapify rate limit, and the new results are stored 
+ #      in the cache.  With a cluster radius, rows within that radius of a 
+ #      cluster leader share one search around the leader, widened by the cluster 
+ #      radius so it covers every member's search circle.  The local backend 
+ #      answers in memory, so it bypasses the cache and the thread pool.
+ #
+ #
+ #  Return Type: tuple
+ #
+ #
+ #  Function Parameters:
+ #
+ #  Type    Name            Description
+ #  -----   -------------   ----------------------------------------------
+ #  dataframe
+ #          input_dataframe The parameter is the dataframe with latitude and 
+ #                          longitude columns.
+ #  dictionary
+ #          parameters_dictionary
+ #                          The parameter is the dictionary of search parameters 
+ #                          without the filter and bias.
+ #  integer search_radius_integer  
+ #                          The parameter is the search radius in meters.
+ #  integer cache_ttl_seconds_integer
+ #                          The parameter is the cache time-to-live in seconds 
+ #                          (0 disables the cache).
+ #  integer worker_count_integer
+ #                          The parameter is the number of concurrent searches.
+ #  integer cluster_radius_meters_integer
+ #                          The parameter is the cluster radius in meters (0 searches 
+ #                          around every row).
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def return_location_place_field_list_list_dictionary \
+        (input_dataframe,
+         parameters_dictionary,
+         search_radius_integer,
+         cache_ttl_seconds_integer,
+         worker_count_integer,
+         cluster_radius_meters_integer = 0):
+
+    if PLACES_INDEX_DICTIONARY is not None:
+
+        cache_ttl_seconds_integer = 0
+
+        worker_count_integer = 1
+
+
+    if cluster_radius_meters_integer > 0 and len(input_dataframe) > 0:
+
+        cluster_integer_array, leader_index_integer_array \
+            = spatialx.return_cluster_tuple \
+                (input_dataframe['latitude'].to_numpy(), 
+                 input_dataframe['longitude'].to_numpy(), 
+                 cluster_radius_meters_integer)
+
+        search_dataframe = input_dataframe.iloc[leader_index_integer_array]
+
+        search_radius_integer += cluster_radius_meters_integer
+
+        parameters_dictionary \
+            = parameters_dictionary \
+              | {'limit': min(parameters_dictionary['limit'] 
+                              * int(np.bincount(cluster_integer_array).max()),
+                              CONSTANT_PLACES_MAXIMUM_RESULT_LIMIT)}
+
+    else:
+
+        cluster_integer_array = np.arange(len(input_dataframe))
+
+        search_dataframe = input_dataframe
+
+
+    search_cache_key_string_list \
+        = [return_places_cache_key_string \
+               (latitude_float, longitude_float, ','.join(parameters_dictionary['categories']), 
+                search_radius_integer, parameters_dictionary['limit'], 
+                parameters_dictionary['lang'])
+           for latitude_float, longitude_float 
+           in zip(search_dataframe['latitude'], search_dataframe['longitude'])]
+
+    cache_key_string_list \
+        = [search_cache_key_string_list[cluster_integer] 
+           for cluster_integer in cluster_integer_array]
+
+
+    place_field_list_list_dictionary = {}
+
+    fetched_field_list_list_dictionary = {}
+
+
+    if cache_ttl_seconds_integer > 0:
+
+        start_statistics_dictionary \
+            = cachex.return_cache_statistics_dictionary \
+                (weather_constants.CONSTANT_PLACES_CACHE_NAMESPACE)
+
+        place_field_list_list_dictionary \
+            = cachex.return_cached_values_dictionary \
+                (weather_constants.CONSTANT_PLACES_CACHE_NAMESPACE,
+                 search_cache_key_string_list,
+                 cache_ttl_seconds_integer)
+
+
+    search_row_index_dictionary = {}
+
+    for row_index, cache_key_string in enumerate(search_cache_key_string_list):
+
+        if cache_key_string not in place_field_list_list_dictionary:
+
+            search_row_index_dictionary.setdefault(cache_key_string, row_index)
+
+    search_row_index_list = list(search_row_index_dictionary.values())
+
+    failed_status_string_dictionary = {}
+
+
+    with ThreadPoolExecutor(max_workers = max(worker_count_integer, 1)) as executor:
+
+        place_field_list_list_iterator \
+            = executor.map \
+                (return_location_place_field_list_list,
+                 search_dataframe['latitude'].to_numpy()[search_row_index_list],
+                 search_dataframe['longitude'].to_numpy()[search_row_index_list],
+                 [parameters_dictionary] * len(search_row_index_list),
+                 [search_radius_integer] * len(search_row_index_list))
+
+
+        for cache_key_string, (place_field_list_list, status_string) \
+                in zip(search_row_index_dictionary, place_field_list_list_iterator):
+
+            if status_string == requestsx.RESPONSE_STATUS_OK:
+
+                place_field_list_list_dictionary[cache_key_string] = place_field_list_list
+
+                fetched_field_list_list_dictionary[cache_key_string] = place_field_list_list
+
+            else:
+
+                failed_status_string_dictionary[cache_key_string] = status_string
+
+
+    if cache_ttl_seconds_integer > 0:
+
+        cachex.store_cached_values \
+            (weather_constants.CONSTANT_PLACES_CACHE_NAMESPACE,
+             fetched_field_list_list_dictionary,
+             weather_constants.CONSTANT_PLACES_CACHE_MAXIMUM_ENTRIES)
+
+        cache_statistics_dictionary \
+            = cachex.return_cache_statistics_dictionary \
+                (weather_constants.CONSTANT_PLACES_CACHE_NAMESPACE)
+
+        logx.print_and_log_text \
+            (f"PLACES CACHE: " \
+             + f"{cache_statistics_dictionary['hits'] - start_statistics_dictionary['hits']} " \
+             + f"HITS, " \
+             + f"{cache_statistics_dictionary['misses'] - start_statistics_dictionary['misses']} " \
+             + f"MISSES...\n\n")
+
+
+    return \
+        cache_key_string_list, place_field_list_list_dictionary, failed_status_string_dictionary
+
+
+# In[30]:
+
+
+#*******************************************************************************************
+ #
+ #  Function Name:  update_dataframe_location
+ #
+ #  Function Description:
+ #      This function takes a dataframe of vacation data, populates the location name 
+ #      column, and returns the updated dataframe to the caller.  Search results
+ #      within the cache time-to-live come from the local places cache.  The 
+ #      remaining searches run on a bounded thread pool under the Geoapify rate 
+ #      limit, and their results are matched back to the rows in order.
+ #
+ #
+ #  Return Type: dataframe
+ #
+ #
+ #  Function Parameters:
+ #
+ #  Type    Name            Description
+ #  -----   -------------   ----------------------------------------------
+ #  dataframe
+ #          input_dataframe The parameter is the input dataframe.
+ #  string  column_name_string     
+ #                          The parameter is the location column name in the dataframe.
+ #  string  category_string The parameter is a search category.
+ #  integer search_radius_integer  
+ #                          The parameter is the search radius in meters.
+ #  integer result_limit_integer   
+ #                          The parameter is a limit on the number of results.
+ #  string  language_string
+ #                          The parameter is the language designation for the search.
+ #  integer cache_ttl_seconds_integer
+ #                          The parameter is the cache time-to-live in seconds 
+ #                          (0 disables the cache).
+ #  integer worker_count_integer
+ #                          The parameter is the number of concurrent searches.
+ #  integer cluster_radius_meters_integer
+ #                          The parameter is the radius in meters within which cities 
+ #                          share one search and take their nearest place (0 searches 
+ #                          around every city).
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  08/26/2023          Initial Development                         Nicholas J. George
+ #  10/18/2026          Routed requests through shared session      Nicholas J. George
+ #  10/18/2026          Added places cache                          Nicholas J. George
+ #  10/18/2026          Added response status handling              Nicholas J. George
+ #  10/18/2026          Added concurrent searches                   Nicholas J. George
+ #  10/18/2026          Replaced row rebuild with aligned arrays    Nicholas J. George
+ #  10/18/2026          Added shared searches for nearby cities     Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def update_dataframe_location \
+        (input_dataframe,
+         column_name_string,
+         category_string = 'accommodation.hotel',
+         search_radius_integer = 10000,
+         result_limit_integer = 20,
+         language_string = 'en',
+         cache_ttl_seconds_integer = weather_constants.CONSTANT_PLACES_CACHE_TTL_SECONDS,
+         worker_count_integer = weather_constants.CONSTANT_PLACES_WORKER_COUNT,
+         cluster_radius_meters_integer = 0):
+
+    parameters_dictionary \
+        = {'categories': [category_string],
+           'limit': result_limit_integer,
+           'lang': language_string,
+           'apiKey': geoapify_key}
+
+    maximum_distance_meters_float \
+        = search_radius_integer if cluster_radius_meters_integer > 0 else None
+
+
+    if category_string == 'accommodation.hotel':
+
+        category_name_string = 'hotel'
+
+    elif category_string == 'catering.restaurant':
+
+        category_name_string = 'restaurant'
+
+    elif category_string == 'tourism.attraction':
+
+        category_name_string = 'tourism attraction'
+
+    else: return input_dataframe
+
+
+    logx.print_and_log_text \
+        (f'STARTING {category_name_string.upper()} SEARCH...\n\n')
+
+
+    cache_key_string_list, place_field_list_list_dictionary, failed_status_string_dictionary \
+        = return_location_place_field_list_list_dictionary \
+            (input_dataframe, 
+             parameters_dictionary, 
+             search_radius_integer, 
+             cache_ttl_seconds_integer, 
+             worker_count_integer,
+             cluster_radius_meters_integer)
+
+
+    location_name_object_array = np.full(len(input_dataframe), None, dtype = object)
+
+    located_boolean_array = np.zeros(len(input_dataframe), dtype = bool)
+
+
+    for row_index, (cache_key_string, city_name_string, country_code_string, 
+                    latitude_float, longitude_float) \
+            in enumerate(zip(cache_key_string_list, 
+                             input_dataframe['city'], 
+                             input_dataframe['country'],
+                             input_dataframe['latitude'],
+                             input_dataframe['longitude'])):
+
+        if cache_key_string not in place_field_list_list_dictionary:
+
+            logx.print_and_log_text \
+                (f"The {category_name_string} search failed " \
+                 + f"({failed_status_string_dictionary[cache_key_string]}) " \
+                 + f"in {city_name_string}, {country_code_string}. Skipping...\n\n")
+
+            continue
+
+
+        location_name_string \
+            = return_place_name_string \
+                (place_field_list_list_dictionary[cache_key_string],
+                 None,
+                 latitude_float,
+                 longitude_float,
+                 maximum_distance_meters_float)
+
+        if location_name_string is None:
+
+            continue
+
+
+        location_name_object_array[row_index] = location_name_string
+
+        located_boolean_array[row_index] = True
+
+        logx.print_and_log_text \
+            (f'Located the following {category_name_string}...' \
+             + f'{location_name_string} ' \
+             + f'in {city_name_string}, ' \
+             + f'{country_code_string}\n\n')
+
+
+    temp_dataframe = input_dataframe.loc[located_boolean_array]
+
+    temp_dataframe[column_name_string] = location_name_object_array[located_boolean_array]
+
+    temp_dataframe.reset_index(drop = True, inplace = True)
+
+
+    logx.print_and_log_text(f'{category_name_string.upper()} SEARCH COMPLETE...\n\n')
+
+
+    return temp_dataframe
+
+
+# In[31]:
+
+
+#*******************************************************************************************
+ #
+ #  Function Name:  update_dataframe_locations
+ #
+ #  Function Description:
+ #      This function takes a dataframe of vacation data and populates one location 
+ #      name column per place category in one pass: one search per city asks for 
+ #      every category at once, with the result limit times the number of 
+ #      categories, and the results are split by category locally.  If a full 
+ #      response has no place of a category, denser categories may have crowded 
+ #      it out, so the function searches that category again on its own for those 
+ #      cities.  The categories keep the notebook's order: a category is looked up 
+ #      only for cities that have a place of every earlier category, so 
+ #      restaurants and attractions are found only where there is a hotel.  The 
+ #      function returns the rows whose searches succeeded, with None in a column 
+ #      where no place of that category was found or looked up.
+ #
+ #
+ #  Return Type: dataframe
+ #
+ #
+ #  Function Parameters:
+ #
+ #  Type    Name            Description
+ #  -----   -------------   ----------------------------------------------
+ #  dataframe
+ #          input_dataframe The parameter is the input dataframe.
+ #  dictionary
+ #          column_category_dictionary
+ #                          The parameter is the dictionary of location column names 
+ #                          and search categories.
+ #  integer search_radius_integer  
+ #                          The parameter is the search radius in meters.
+ #  integer result_limit_integer   
+ #                          The parameter is a limit on the number of results per 
+ #                          category.
+ #  string  language_string
+ #                          The parameter is the language designation for the search.
+ #  integer cache_ttl_seconds_integer
+ #                          The parameter is the cache time-to-live in seconds 
+ #                          (0 disables the cache).
+ #  integer worker_count_integer
+ #                          The parameter is the number of concurrent searches.
+ #  integer cluster_radius_meters_integer
+ #                          The parameter is the radius in meters within which cities 
+ #                          share one search and take their nearest places (0 
+ #                          searches around every city).
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def update_dataframe_locations \
+        (input_dataframe,
+         column_category_dictionary = CONSTANT_PLACE_COLUMN_CATEGORY_DICTIONARY,
+         search_radius_integer = 10000,
+         result_limit_integer = 20,
+         language_string = 'en',
+         cache_ttl_seconds_integer = weather_constants.CONSTANT_PLACES_CACHE_TTL_SECONDS,
+         worker_count_integer = weather_constants.CONSTANT_PLACES_WORKER_COUNT,
+         cluster_radius_meters_integer = 0):
+
+    combined_limit_integer \
+        = min(result_limit_integer * len(column_category_dictionary),
+              CONSTANT_PLACES_MAXIMUM_RESULT_LIMIT)
+
+    parameters_dictionary \
+        = {'categories': [','.join(column_category_dictionary.values())],
+           'limit': combined_limit_integer,
+           'lang': language_string,
+           'apiKey': geoapify_key}
+
+    maximum_distance_meters_float \
+        = search_radius_integer if cluster_radius_meters_integer > 0 else None
+
+    latitude_float_array = input_dataframe['latitude'].to_numpy()
+
+    longitude_float_array = input_dataframe['longitude'].to_numpy()
+
+
+    logx.print_and_log_text('STARTING PLACE SEARCH...\n\n')
+
+
+    cache_key_string_list, place_field_list_list_dictionary, failed_status_string_dictionary \
+        = return_location_place_field_list_list_dictionary \
+            (input_dataframe, 
+             parameters_dictionary, 
+             search_radius_integer, 
+             cache_ttl_seconds_integer, 
+             worker_count_integer,
+             cluster_radius_meters_integer)
+
+    searched_boolean_array \
+        = np.array \
+            ([cache_key_string in place_field_list_list_dictionary 
+              for cache_key_string in cache_key_string_list],
+             dtype = bool)
+
+    for cache_key_string, city_name_string, country_code_string \
+            in zip(np.array(cache_key_string_list, dtype = object)[~searched_boolean_array], 
+                   input_dataframe['city'].to_numpy()[~searched_boolean_array], 
+                   input_dataframe['country'].to_numpy()[~searched_boolean_array]):
+
+        logx.print_and_log_text \
+            (f"The place search failed " \
+             + f"({failed_status_string_dictionary[cache_key_string]}) " \
+             + f"in {city_name_string}, {country_code_string}. Skipping...\n\n")
+
+
+    location_name_object_array_dictionary = {}
+
+    found_boolean_array = searched_boolean_array.copy()
+
+    for column_name_string, location_category_string in column_category_dictionary.items():
+
+        location_name_object_array = np.full(len(input_dataframe), None, dtype = object)
+
+        crowded_boolean_array = np.zeros(len(input_dataframe), dtype = bool)
+
+        for row_index in np.flatnonzero(found_boolean_array):
+
+            place_field_list_list \
+                = place_field_list_list_dictionary[cache_key_string_list[row_index]]
+
+            location_name_object_array[row_index] \
+                = return_place_name_string \
+                    (place_field_list_list,
+                     location_category_string,
+                     latitude_float_array[row_index],
+                     longitude_float_array[row_index],
+                     maximum_distance_meters_float)
+
+            crowded_boolean_array[row_index] \
+                = location_name_object_array[row_index] is None \
+                  and len(place_field_list_list) >= combined_limit_integer
+
+
+        crowded_index_integer_array = np.flatnonzero(crowded_boolean_array)
+
+        if len(crowded_index_integer_array) > 0:
+
+            logx.print_and_log_text \
+                (f'SEARCHING {len(crowded_index_integer_array)} CROWDED-OUT ' \
+                 + f'{location_category_string.upper()} LOCATIONS AGAIN...\n\n')
+
+            crowded_key_string_list, crowded_field_list_list_dictionary, crowded_status_dictionary \
+                = return_location_place_field_list_list_dictionary \
+                    (input_dataframe.iloc[crowded_index_integer_array], 
+                     parameters_dictionary 
+                     | {'categories': [location_category_string], 
+                        'limit': result_limit_integer}, 
+                     search_radius_integer, 
+                     cache_ttl_seconds_integer, 
+                     worker_count_integer,
+                     cluster_radius_meters_integer)
+
+            for row_index, cache_key_string \
+                    in zip(crowded_index_integer_array, crowded_key_string_list):
+
+                if cache_key_string not in crowded_field_list_list_dictionary:
+
+                    searched_boolean_array[row_index] = False
+
+                    logx.print_and_log_text \
+                        (f"The place search failed " \
+                         + f"({crowded_status_dictionary[cache_key_string]}) " \
+                         + f"in {input_dataframe['city'].iloc[row_index]}, " \
+                         + f"{input_dataframe['country'].iloc[row_index]}. Skipping...\n\n")
+
+                    continue
+
+
+                location_name_object_array[row_index] \
+                    = return_place_name_string \
+                        (crowded_field_list_list_dictionary[cache_key_string],
+                         location_category_string,
+                         latitude_float_array[row_index],
+                         longitude_float_array[row_index],
+                         maximum_distance_meters_float)
+
+
+        location_name_object_array_dictionary[column_name_string] = location_name_object_array
+
+        found_boolean_array \
+            &= searched_boolean_array \
+               & np.array \
+                   ([location_name_string is not None 
+                     for location_name_string in location_name_object_array],
+                    dtype = bool)
+
+
+    temp_dataframe = input_dataframe.loc[searched_boolean_array].reset_index(drop = True)
+
+    for column_name_string, location_name_object_array \
+            in location_name_object_array_dictionary.items():
+
+        temp_dataframe[column_name_string] \
+            = pd.Series(location_name_object_array[searched_boolean_array], dtype = object)
+
+
+    for city_name_string, country_code_string, location_name_string_tuple \
+            in zip(temp_dataframe['city'], 
+                   temp_dataframe['country'],
+                   temp_dataframe[list(column_category_dictionary)].itertuples(index = False)):
+
+        for location_category_string, location_name_string \
+                in zip(column_category_dictionary.values(), location_name_string_tuple):
+
+            if location_name_string is None:
+
+                break
+
+
+            category_name_string \
+                = CONSTANT_PLACE_CATEGORY_NAME_DICTIONARY \
+                      .get(location_category_string, location_category_string)
+
+            logx.print_and_log_text \
+                (f'Located the following {category_name_string}...' \
+                 + f'{location_name_string} ' \
+                 + f'in {city_name_string}, ' \
+                 + f'{country_code_string}\n\n')
+
+
+    logx.print_and_log_text('PLACE SEARCH COMPLETE...\n\n')
 
 
     return temp_dataframe
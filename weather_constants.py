@@ -31,16 +31,56 @@ CONSTANT_LOCAL_FILE_NAME = 'weather_constants.py'
 
 CONSTANT_OPEN_WEATHERMAP_WEBSITE = 'http://api.openweathermap.org'
 
+CONSTANT_OPEN_WEATHERMAP_REQUESTS_PER_SECOND = 10.0
+
 CONSTANT_API_DATA_UNITS = 'imperial'
 
+CONSTANT_OPEN_WEATHERMAP_GROUP_SIZE = 20
+
+CONSTANT_OPEN_WEATHERMAP_CITY_LIST_FILE_PATH = './resources/city.list.json.gz'
+
 CONSTANT_SET_OF_CITIES = 50
 
 CONSTANT_CITY_NAME_COUNT = 3000
 
+CONSTANT_CITY_MAXIMUM_SAMPLE_COUNT = 10000000
+
+CONSTANT_CITY_SAMPLE_BATCH_SIZE = 10000
+
+CONSTANT_CITY_SAMPLING_MODE = 'uniform'
+
+CONSTANT_CITY_REGION_DEGREES = 10.0
+
+CONSTANT_WEATHER_WORKER_COUNT = 1
+
+CONSTANT_WEATHER_CACHE_NAMESPACE = 'weather'
+
+CONSTANT_WEATHER_CACHE_TTL_SECONDS = 3600
+
+CONSTANT_WEATHER_CACHE_MAXIMUM_ENTRIES = 100000
+
+CONSTANT_WEATHER_CHECKPOINT_TTL_SECONDS = 3600
+
+CONSTANT_GEOAPIFY_WEBSITE = 'https://api.geoapify.com'
+
+CONSTANT_GEOAPIFY_REQUESTS_PER_SECOND = 5.0
+
+CONSTANT_PLACES_WORKER_COUNT = 8
+
+CONSTANT_PLACES_CACHE_NAMESPACE = 'places'
+
+CONSTANT_PLACES_CACHE_TTL_SECONDS = 604800
+
+CONSTANT_PLACES_CACHE_MAXIMUM_ENTRIES = 100000
+
 CONSTANT_WEATHER_DATA_FILE_PATH = './resources/cities_weather.csv'
 
 CONSTANT_WEATHER_DATA_FILE_INDEX_NAME = 'city_id'
 
+CONSTANT_WEATHER_SNAPSHOT_FILE_PATH = './resources/cities_weather.arrow'
+
+CONSTANT_WEATHER_CHECKPOINT_FILE_PATH = './resources/cities_weather.checkpoint.jsonl'
+
 
 CONSTANT_MINIMUM_TEMPERATURE = 0
 
@@ -68,3 +108,9 @@ weather_conditions_dictionary \
        'cloudiness_range': [CONSTANT_MINIMUM_CLOUDINESS, CONSTANT_MAXIMUM_CLOUDINESS],
        'wind_speed_range': [CONSTANT_MINIMUM_WIND_SPEED, CONSTANT_MAXIMUM_WIND_SPEED]}
 
+CONSTANT_WEATHER_CONDITION_SPAN_DICTIONARY \
+    = {'temperature_range': CONSTANT_MAXIMUM_TEMPERATURE - CONSTANT_MINIMUM_TEMPERATURE,
+       'humidity_range': CONSTANT_MAXIMUM_HUMIDITY - CONSTANT_MINIMUM_HUMIDITY,
+       'cloudiness_range': CONSTANT_MAXIMUM_CLOUDINESS - CONSTANT_MINIMUM_CLOUDINESS,
+       'wind_speed_range': CONSTANT_MAXIMUM_WIND_SPEED - CONSTANT_MINIMUM_WIND_SPEED}
+
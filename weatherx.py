@@ -13,7 +13,26 @@
  #      associated with the Jupyter Notebook, weather.ipynb. Here is the list:
  #
  #  return_city_weather_styler
+ #  return_city_kdtree
+ #  return_nearest_city_names_array
+ #  return_city_region_strata_tuple
+ #  return_random_coordinate_arrays
+ #  yield_unique_city_names
  #  return_city_names_list
+ #  return_weather_field_list
+ #  return_city_weather_field_list
+ #  log_city_weather_status
+ #  return_checkpoint_run_string
+ #  return_checkpoint_field_list_dictionary
+ #  append_checkpoint_field_lists
+ #  compact_checkpoint_file
+ #  return_city_weather_field_list_dictionary
+ #  return_city_ids_dictionary
+ #  return_group_weather_field_list_dictionary
+ #  return_city_weather_field_list_dictionary_by_id
+ #  return_weather_column_buffer_dictionary
+ #  append_weather_column_buffers
+ #  return_weather_column_dataframe
  #  return_weather_dataframe
  #
  #
@@ -23,16 +42,25 @@
  #
  #******************************************************************************************/
 
+import cachex
 import logx
+import requestsx
+import spatialx
+import storagex
 import weather_constants
 
-import requests
+import gzip
+import hashlib
+import json
+import os
+import time
 
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
 import numpy as np
 import pandas as pd
 
 from citipy import citipy
+from scipy.spatial import KDTree
 from weather_api_keys import weather_api_key
 
 pd.options.mode.chained_assignment = None
@@ -47,6 +75,18 @@ CONSTANT_LOCAL_FILE_NAME = 'weatherx.py'
 # In[3]:
 
 
+CITY_NAME_ARRAY = None
+
+CITY_COORDINATE_ARRAY = None
+
+CITY_KDTREE_DICTIONARY = {}
+
+CITY_REGION_STRATA_TUPLE = None
+
+
+# In[4]:
+
+
 #*******************************************************************************************
  #
  #  Function Name:  return_city_weather_styler
@@ -112,18 +152,141 @@ def return_city_weather_styler \
             .hide()
 
 
-# In[4]:
+# In[5]:
 
 
 #*******************************************************************************************
  #
- #  Function Name:  return_city_names_list
+ #  Function Name:  return_city_kdtree
  #
  #  Function Description:
- #      This function returns a list of cities from the API, citypy.
+ #      This function returns a KD-tree over the citipy world-city table, building 
+ #      it on first use.  The euclidean metric indexes latitude and longitude 
+ #      directly, as citipy does; the haversine metric indexes 3D unit vectors for 
+ #      true great-circle nearest cities.
  #
  #
- #  Return Type: list
+ #  Return Type: KD-tree
+ #
+ #
+ #  Function Parameters:
+ #
+ #  Type    Name            Description
+ #  -----   -------------   ----------------------------------------------
+ #  string  metric_string   The parameter is the distance metric (euclidean or haversine).
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def return_city_kdtree(metric_string = 'euclidean'):
+
+    global CITY_NAME_ARRAY
+
+    global CITY_COORDINATE_ARRAY
+
+
+    if metric_string not in CITY_KDTREE_DICTIONARY:
+
+        CITY_COORDINATE_ARRAY = np.array(list(citipy.WORLD_CITIES_DICT.keys()))
+
+        CITY_NAME_ARRAY \
+            = np.array \
+                ([city.city_name for city in citipy.WORLD_CITIES_DICT.values()], 
+                 dtype = object)
+
+
+        city_coordinate_float_array = CITY_COORDINATE_ARRAY
+
+        if metric_string == 'haversine':
+
+            city_coordinate_float_array \
+                = spatialx.return_unit_vector_array \
+                    (city_coordinate_float_array[:, 0], city_coordinate_float_array[:, 1])
+
+        CITY_KDTREE_DICTIONARY[metric_string] = KDTree(city_coordinate_float_array)
+
+
+    return CITY_KDTREE_DICTIONARY[metric_string]
+
+
+# In[6]:
+
+
+#*******************************************************************************************
+ #
+ #  Function Name:  return_nearest_city_names_array
+ #
+ #  Function Description:
+ #      This function returns the names of the nearest citipy cities for whole 
+ #      arrays of latitudes and longitudes in one vectorized query.  With the 
+ #      euclidean metric, the names match citipy.nearest_city.
+ #
+ #
+ #  Return Type: numpy array
+ #
+ #
+ #  Function Parameters:
+ #
+ #  Type    Name            Description
+ #  -----   -------------   ----------------------------------------------
+ #  numpy array
+ #          latitude_float_array
+ #                          The parameter is the array of latitudes.
+ #  numpy array
+ #          longitude_float_array
+ #                          The parameter is the array of longitudes.
+ #  string  metric_string   The parameter is the distance metric (euclidean or haversine).
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def return_nearest_city_names_array \
+        (latitude_float_array,
+         longitude_float_array,
+         metric_string = 'euclidean'):
+
+    city_kdtree = return_city_kdtree(metric_string)
+
+
+    if metric_string == 'haversine':
+
+        query_float_array \
+            = spatialx.return_unit_vector_array(latitude_float_array, longitude_float_array)
+
+    else:
+
+        query_float_array \
+            = np.column_stack((latitude_float_array, longitude_float_array))
+
+
+    nearest_index_integer_array = city_kdtree.query(query_float_array, workers = -1)[1]
+
+
+    return CITY_NAME_ARRAY[nearest_index_integer_array]
+
+
+# In[7]:
+
+
+#*******************************************************************************************
+ #
+ #  Function Name:  return_city_region_strata_tuple
+ #
+ #  Function Description:
+ #      This function groups the citipy world cities by latitude-longitude region 
+ #      and returns the city indices sorted by region with the start position and 
+ #      city count of each occupied region, building them on first use.
+ #
+ #
+ #  Return Type: tuple
  #
  #
  #  Function Parameters:
@@ -135,165 +298,1520 @@ def return_city_weather_styler \
  #
  #  Date                Description                                 Programmer
  #  ---------------     ------------------------------------        ------------------
- #  08/26/2023          Initial Development                         Nicholas J. George
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def return_city_region_strata_tuple():
+
+    global CITY_REGION_STRATA_TUPLE
+
+
+    if CITY_REGION_STRATA_TUPLE is None:
+
+        return_city_kdtree()
+
+
+        region_degrees_float = weather_constants.CONSTANT_CITY_REGION_DEGREES
+
+        latitude_region_integer_array \
+            = ((CITY_COORDINATE_ARRAY[:, 0] + 90.0) // region_degrees_float).astype(np.int64)
+
+        longitude_region_integer_array \
+            = ((CITY_COORDINATE_ARRAY[:, 1] + 180.0) // region_degrees_float).astype(np.int64)
+
+        region_integer_array \
+            = latitude_region_integer_array * (longitude_region_integer_array.max() + 1) \
+              + longitude_region_integer_array
+
+
+        city_order_integer_array = np.argsort(region_integer_array, kind = 'stable')
+
+        region_count_integer_array \
+            = np.unique(region_integer_array, return_counts = True)[1]
+
+        region_start_integer_array \
+            = np.concatenate(([0], np.cumsum(region_count_integer_array)[:-1]))
+
+
+        CITY_REGION_STRATA_TUPLE \
+            = (city_order_integer_array, 
+               region_start_integer_array, 
+               region_count_integer_array)
+
+
+    return CITY_REGION_STRATA_TUPLE
+
+
+# In[8]:
+
+
+#*******************************************************************************************
+ #
+ #  Function Name:  return_random_coordinate_arrays
+ #
+ #  Function Description:
+ #      This function returns random latitude and longitude arrays using one of 
+ #      these sampling modes: uniform draws latitude and longitude uniformly, which 
+ #      oversamples the poles; sphere draws points uniformly by area on the globe; 
+ #      and city draws city locations directly from the citipy table by first 
+ #      picking an occupied region at random, which skips open ocean.
+ #
+ #
+ #  Return Type: tuple
+ #
+ #
+ #  Function Parameters:
+ #
+ #  Type    Name            Description
+ #  -----   -------------   ----------------------------------------------
+ #  integer sample_count_integer
+ #                          The parameter is the number of coordinates.
+ #  string  sampling_mode_string
+ #                          The parameter is the sampling mode (uniform, sphere, or city).
+ #  generator
+ #          random_generator
+ #                          The parameter is the numpy random number generator.
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
  #
  #******************************************************************************************/
 
-def return_city_names_list():
+def return_random_coordinate_arrays \
+        (sample_count_integer,
+         sampling_mode_string,
+         random_generator):
+
+    if sampling_mode_string == 'city':
+
+        city_order_integer_array, region_start_integer_array, region_count_integer_array \
+            = return_city_region_strata_tuple()
 
-    city_names_string_list = []
 
+        region_integer_array \
+            = random_generator.integers \
+                (len(region_count_integer_array), size = sample_count_integer)
 
-    latitude_range_float_tuple = (-90.0, 90.0)
+        offset_integer_array \
+            = (random_generator.random(sample_count_integer) \
+               * region_count_integer_array[region_integer_array]) \
+              .astype(np.int64)
 
-    longitude_range_float_tuple = (-180.0, 180.0)
+        city_integer_array \
+            = city_order_integer_array \
+                [region_start_integer_array[region_integer_array] + offset_integer_array]
 
 
-    random_latitude_float_array \
-        = np.random.uniform \
-            (latitude_range_float_tuple[0], 
-             longitude_range_float_tuple[1], 
-             size = weather_constants.CONSTANT_CITY_NAME_COUNT)
+        return \
+            (CITY_COORDINATE_ARRAY[city_integer_array, 0], 
+             CITY_COORDINATE_ARRAY[city_integer_array, 1])
+
 
     random_longitude_float_array \
-        = np.random.uniform \
-            (longitude_range_float_tuple[0], 
-             longitude_range_float_tuple[1], 
-             size = weather_constants.CONSTANT_CITY_NAME_COUNT)
+        = random_generator.uniform(-180.0, 180.0, size = sample_count_integer)
 
+    if sampling_mode_string == 'sphere':
 
-    latitude_longitude_float_tuple_list \
-        = zip(random_latitude_float_array, random_longitude_float_array)
+        random_latitude_float_array \
+            = np.degrees \
+                (np.arcsin(random_generator.uniform(-1.0, 1.0, size = sample_count_integer)))
 
+    elif sampling_mode_string == 'uniform':
 
-    for latitude_longitude_float_tuple in latitude_longitude_float_tuple_list:
+        random_latitude_float_array \
+            = random_generator.uniform(-90.0, 90.0, size = sample_count_integer)
 
-        city_name_string \
-            = citipy.nearest_city \
-                (latitude_longitude_float_tuple[0], 
-                 latitude_longitude_float_tuple[1]) \
-                    .city_name
+    else:
 
-        if city_name_string not in city_names_string_list:
+        raise ValueError(f'The sampling mode, {sampling_mode_string}, is not valid.')
 
-            city_names_string_list.append(city_name_string)
 
+    return random_latitude_float_array, random_longitude_float_array
 
-    return city_names_string_list
 
+# In[9]:
+
+
+#*******************************************************************************************
+ #
+ #  Function Name:  yield_unique_city_names
+ #
+ #  Function Description:
+ #      This generator samples random coordinates in batches, resolves them to 
+ #      citipy cities, and yields each city name the first time it appears.  It 
+ #      stops after the requested number of unique cities or samples, whichever 
+ #      comes first.
+ #
+ #
+ #  Return Type: generator
+ #
+ #
+ #  Function Parameters:
+ #
+ #  Type    Name            Description
+ #  -----   -------------   ----------------------------------------------
+ #  integer unique_city_count_integer
+ #                          The parameter is the number of unique cities (None for 
+ #                          no limit).
+ #  integer sample_count_integer
+ #                          The parameter is the maximum number of coordinate samples.
+ #  integer batch_size_integer
+ #                          The parameter is the number of coordinates per batch.
+ #  string  sampling_mode_string
+ #                          The parameter is the sampling mode (uniform, sphere, or city).
+ #  integer seed_integer    The parameter is the random number generator seed (None 
+ #                          for a fresh seed).
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def yield_unique_city_names \
+        (unique_city_count_integer = None,
+         sample_count_integer = weather_constants.CONSTANT_CITY_NAME_COUNT,
+         batch_size_integer = weather_constants.CONSTANT_CITY_SAMPLE_BATCH_SIZE,
+         sampling_mode_string = weather_constants.CONSTANT_CITY_SAMPLING_MODE,
+         seed_integer = None):
+
+    seen_city_names_string_set = set()
+
+    random_generator = np.random.default_rng(seed_integer)
+
+
+    for batch_start_integer in range(0, sample_count_integer, batch_size_integer):
+
+        current_batch_size_integer \
+            = min(batch_size_integer, sample_count_integer - batch_start_integer)
+
+
+        random_latitude_float_array, random_longitude_float_array \
+            = return_random_coordinate_arrays \
+                (current_batch_size_integer, sampling_mode_string, random_generator)
+
+
+        nearest_city_names_string_array \
+            = return_nearest_city_names_array \
+                (random_latitude_float_array, random_longitude_float_array)
+
+
+        for city_name_string in nearest_city_names_string_array:
+
+            if city_name_string in seen_city_names_string_set:
+
+                continue
 
-# In[5]:
+
+            seen_city_names_string_set.add(city_name_string)
+
+            yield city_name_string
+
+
+            if unique_city_count_integer is not None \
+               and len(seen_city_names_string_set) >= unique_city_count_integer:
+
+                return
+
+
+# In[10]:
 
 
 #*******************************************************************************************
  #
- #  Function Name:  return_weather_dataframe
+ #  Function Name:  return_city_names_list
  #
  #  Function Description:
- #      This function returns weather information from the open weathermap website 
- #      using the requests module and a list of cities.
+ #      This function returns a list of cities from the API, citypy.  By default, 
+ #      it draws the standard number of samples; if the caller requests a number 
+ #      of unique cities, it samples until it has that many.
  #
  #
- #  Return Type: dataframe
+ #  Return Type: list
  #
  #
  #  Function Parameters:
  #
  #  Type    Name            Description
  #  -----   -------------   ----------------------------------------------
- #  string list
- #          city_names_string_list
- #                          This parameter is a list of city names.
+ #  integer unique_city_count_integer
+ #                          The parameter is the number of unique cities (None for 
+ #                          no limit).
+ #  integer sample_count_integer
+ #                          The parameter is the maximum number of coordinate samples.
+ #  string  sampling_mode_string
+ #                          The parameter is the sampling mode (uniform, sphere, or city).
+ #  integer seed_integer    The parameter is the random number generator seed (None 
+ #                          for a fresh seed).
  #
  #
  #  Date                Description                                 Programmer
  #  ---------------     ------------------------------------        ------------------
  #  08/26/2023          Initial Development                         Nicholas J. George
+ #  10/18/2026          Resolved cities with a KD-tree              Nicholas J. George
+ #  10/18/2026          De-duplicated with a streaming generator    Nicholas J. George
+ #  10/18/2026          Added sampling modes and seed               Nicholas J. George
  #
  #******************************************************************************************/
 
-def return_weather_dataframe(city_names_string_list):
+def return_city_names_list \
+        (unique_city_count_integer = None,
+         sample_count_integer = None,
+         sampling_mode_string = weather_constants.CONSTANT_CITY_SAMPLING_MODE,
+         seed_integer = None):
 
-    query_url_string \
-        = f'{weather_constants.CONSTANT_OPEN_WEATHERMAP_WEBSITE}/data/2.5/weather?appid=' \
-          + f'{weather_api_key}&units={weather_constants.CONSTANT_API_DATA_UNITS}&q='
+    if sample_count_integer is None:
 
+        if unique_city_count_integer is None:
 
-    city_weather_dictionary_list = []
+            sample_count_integer = weather_constants.CONSTANT_CITY_NAME_COUNT
 
-    record_count_integer = 0
+        else:
 
-    set_of_cities_count_integer = 1
+            sample_count_integer = weather_constants.CONSTANT_CITY_MAXIMUM_SAMPLE_COUNT
 
 
-    logx.print_and_log_text('\nCITY WEATHER DATA RETRIEVAL BEGINS...\n')
+    return \
+        list \
+            (yield_unique_city_names \
+                (unique_city_count_integer, 
+                 sample_count_integer,
+                 sampling_mode_string = sampling_mode_string,
+                 seed_integer = seed_integer))
+
+
+# In[11]:
+
+
+#*******************************************************************************************
+ #
+ #  Function Name:  return_weather_field_list
+ #
+ #  Function Description:
+ #      This function returns the parsed fields (latitude, longitude, temperature, 
+ #      humidity, cloudiness, wind speed, country, and timestamp) of one decoded 
+ #      open weathermap city weather dictionary as a list.
+ #
+ #
+ #  Return Type: list
+ #
+ #
+ #  Function Parameters:
+ #
+ #  Type    Name            Description
+ #  -----   -------------   ----------------------------------------------
+ #  dictionary
+ #          city_weather_dictionary
+ #                          This parameter is the decoded city weather dictionary.
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
 
+def return_weather_field_list(city_weather_dictionary):
 
-    for index, city_name in enumerate(city_names_string_list):
+    return \
+        [city_weather_dictionary['coord']['lat'],
+         city_weather_dictionary['coord']['lon'],
+         city_weather_dictionary['main']['temp'],
+         city_weather_dictionary['main']['humidity'],
+         city_weather_dictionary['clouds']['all'],
+         city_weather_dictionary['wind']['speed'],
+         city_weather_dictionary['sys']['country'],
+         city_weather_dictionary['dt']]
 
-        if index % weather_constants.CONSTANT_SET_OF_CITIES == 0 \
-           and index >= weather_constants.CONSTANT_SET_OF_CITIES:
 
-            record_count_integer = 0
+# In[12]:
 
-            set_of_cities_count_integer += 1
 
+#*******************************************************************************************
+ #
+ #  Function Name:  return_city_weather_field_list
+ #
+ #  Function Description:
+ #      This function requests the weather for one city from the open weathermap 
+ #      website through the shared session and returns the parsed fields (latitude, 
+ #      longitude, temperature, humidity, cloudiness, wind speed, country, and 
+ #      timestamp) as a list, or None if there are none, with the response status.
+ #
+ #
+ #  Return Type: tuple
+ #
+ #
+ #  Function Parameters:
+ #
+ #  Type    Name            Description
+ #  -----   -------------   ----------------------------------------------
+ #  string  city_name_string
+ #                          This parameter is the city name.
+ #  string  query_url_string
+ #                          This parameter is the query url without the city name.
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
 
-        logx.print_and_log_text \
-            (f'\nProcessing record #{record_count_integer + 1} ' \
-             + f'of set {set_of_cities_count_integer} for city, {city_name}.')
+def return_city_weather_field_list \
+        (city_name_string,
+         query_url_string):
 
+    city_url_string = query_url_string + city_name_string
 
-        city_url_string = query_url_string + city_name
 
-        record_count_integer += 1
+    http_response, status_string \
+        = requestsx.return_http_response_and_status(city_url_string)
 
+    if status_string != requestsx.RESPONSE_STATUS_OK:
 
-        try:
+        return None, status_string
 
-            city_weather_dictionary = requests.get(city_url_string).json()
 
+    try:
 
-            city_latitude_float = city_weather_dictionary['coord']['lat']
+        city_weather_dictionary = requestsx.return_json_dictionary(http_response.content)
 
-            city_longitude_float = city_weather_dictionary['coord']['lon']
+        return return_weather_field_list(city_weather_dictionary), status_string
 
-            city_temperature_float = city_weather_dictionary['main']['temp']
+    except:
 
-            city_humidity_integer = city_weather_dictionary['main']['humidity']
+        return None, requestsx.RESPONSE_STATUS_NOT_FOUND
 
-            city_clouds_integer = city_weather_dictionary['clouds']['all']
 
-            city_wind_speed_float = city_weather_dictionary['wind']['speed']
+# In[13]:
 
-            city_country_string = city_weather_dictionary['sys']['country']
 
-            city_datetime = datetime.fromtimestamp(city_weather_dictionary['dt'])
+#*******************************************************************************************
+ #
+ #  Function Name:  log_city_weather_status
+ #
+ #  Function Description:
+ #      This subroutine logs why the script skipped a city: the website did not 
+ #      find it, throttled the request, or failed with a network or other error.
+ #
+ #
+ #  Return Type: n/a
+ #
+ #
+ #  Function Parameters:
+ #
+ #  Type    Name            Description
+ #  -----   -------------   ----------------------------------------------
+ #  string  city_name_string
+ #                          This parameter is the city name.
+ #  string  status_string   This parameter is the response status.
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
 
+def log_city_weather_status \
+        (city_name_string,
+         status_string):
 
-            city_weather_dictionary_list.append \
-                ({'city': city_name, 
-                  'latitude': city_latitude_float, 
-                  'longitude': city_longitude_float, 
-                  'temperature': city_temperature_float,
-                  'humidity': city_humidity_integer,
-                  'cloudiness': city_clouds_integer,
-                  'wind_speed': city_wind_speed_float,
-                  'country': city_country_string,
-                  'date_time': city_datetime})
+    if status_string == requestsx.RESPONSE_STATUS_NOT_FOUND:
 
-        except:
+        logx.print_and_log_text \
+            (f'\nThe script did not find the city, {city_name_string}. Skipping...')
 
-            logx.print_and_log_text \
-                (f'\nThe script did not find the city, {city_name}. Skipping...')
+    elif status_string == requestsx.RESPONSE_STATUS_THROTTLED:
+
+        logx.print_and_log_text \
+            (f'\nThe website throttled the request for the city, {city_name_string}. ' \
+             + 'Skipping...')
 
+    elif status_string == requestsx.RESPONSE_STATUS_NETWORK_ERROR:
 
-    logx.print_and_log_text('\nCITY WEATHER DATA RETRIEVAL IS COMPLETE.') 
+        logx.print_and_log_text \
+            (f'\nThe script had a network error for the city, {city_name_string}. ' \
+             + 'Skipping...')
 
-    city_weather_dataframe =  pd.DataFrame(city_weather_dictionary_list)
+    else:
 
-    city_weather_dataframe.index.name \
-        = weather_constants.CONSTANT_WEATHER_DATA_FILE_INDEX_NAME
+        logx.print_and_log_text \
+            (f'\nThe website rejected the request for the city, {city_name_string}. ' \
+             + 'Skipping...')
+
+
+# In[14]:
+
+
+#*******************************************************************************************
+ #
+ #  Function Name:  return_checkpoint_run_string
+ #
+ #  Function Description:
+ #      This function returns the identity of a weather retrieval run: a hash of 
+ #      the units and the requested city names, so a checkpoint only resumes the 
+ #      run that wrote it.
+ #
+ #
+ #  Return Type: string
+ #
+ #
+ #  Function Parameters:
+ #
+ #  Type    Name            Description
+ #  -----   -------------   ----------------------------------------------
+ #  string list
+ #          city_names_string_list
+ #                          This parameter is a list of city names.
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def return_checkpoint_run_string(city_names_string_list):
+
+    return \
+        hashlib.sha256 \
+            (json.dumps([weather_constants.CONSTANT_API_DATA_UNITS, 
+                         list(city_names_string_list)]).encode('utf-8')) \
+            .hexdigest()
+
+
+# In[15]:
+
+
+#*******************************************************************************************
+ #
+ #  Function Name:  return_checkpoint_field_list_dictionary
+ #
+ #  Function Description:
+ #      This function reads a weather checkpoint file and returns a dictionary of 
+ #      city names and field lists written by the same run within the time-to-live; 
+ #      a missing file returns an empty dictionary, and a partly written last line 
+ #      is ignored.
+ #
+ #
+ #  Return Type: dictionary
+ #
+ #
+ #  Function Parameters:
+ #
+ #  Type    Name            Description
+ #  -----   -------------   ----------------------------------------------
+ #  string  checkpoint_file_path_string
+ #                          This parameter is the checkpoint file path.
+ #  string  run_string      This parameter is the run identity.
+ #  integer ttl_seconds_integer
+ #                          This parameter is the checkpoint time-to-live in seconds.
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def return_checkpoint_field_list_dictionary \
+        (checkpoint_file_path_string,
+         run_string,
+         ttl_seconds_integer):
+
+    checkpoint_field_list_dictionary = {}
+
+    current_time_float = time.time()
+
+
+    if os.path.exists(checkpoint_file_path_string) == False:
+
+        return checkpoint_field_list_dictionary
+
+
+    with open(checkpoint_file_path_string, 'r', encoding = 'utf-8') as checkpoint_file:
+
+        for line_string in checkpoint_file:
+
+            try:
+
+                checkpoint_dictionary = json.loads(line_string)
+
+            except:
+
+                continue
+
+
+            if checkpoint_dictionary.get('run') == run_string \
+               and current_time_float - checkpoint_dictionary.get('time', 0.0) \
+                   <= ttl_seconds_integer:
+
+                checkpoint_field_list_dictionary[checkpoint_dictionary['city']] \
+                    = checkpoint_dictionary['fields']
+
+
+    return checkpoint_field_list_dictionary
+
+
+# In[16]:
+
+
+#*******************************************************************************************
+ #
+ #  Function Name:  append_checkpoint_field_lists
+ #
+ #  Function Description:
+ #      This subroutine appends city names and field lists to a weather checkpoint 
+ #      file, one JSON line per city stamped with the run identity and time, and 
+ #      flushes them to disk.
+ #
+ #
+ #  Return Type: n/a
+ #
+ #
+ #  Function Parameters:
+ #
+ #  Type    Name            Description
+ #  -----   -------------   ----------------------------------------------
+ #  string  checkpoint_file_path_string
+ #                          This parameter is the checkpoint file path (None 
+ #                          disables checkpoints).
+ #  string  run_string      This parameter is the run identity.
+ #  dictionary
+ #          field_list_dictionary
+ #                          This parameter is the dictionary of city names and field 
+ #                          lists.
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def append_checkpoint_field_lists \
+        (checkpoint_file_path_string,
+         run_string,
+         field_list_dictionary):
+
+    if checkpoint_file_path_string is None or len(field_list_dictionary) == 0:
+
+        return
+
+
+    current_time_float = time.time()
+
+
+    with open(checkpoint_file_path_string, 'a', encoding = 'utf-8') as checkpoint_file:
+
+        checkpoint_file.writelines \
+            (json.dumps \
+                 ({'run': run_string,
+                   'time': current_time_float,
+                   'city': city_name,
+                   'fields': field_list}) + '\n'
+             for city_name, field_list in field_list_dictionary.items())
+
+        checkpoint_file.flush()
+
+        os.fsync(checkpoint_file.fileno())
+
+
+# In[17]:
+
+
+#*******************************************************************************************
+ #
+ #  Function Name:  compact_checkpoint_file
+ #
+ #  Function Description:
+ #      This subroutine deletes the checkpoint file of a finished run; if the 
+ #      caller passes an output file path, it first writes the finished weather 
+ #      dataframe to that file, in the format its extension names.
+ #
+ #
+ #  Return Type: n/a
+ #
+ #
+ #  Function Parameters:
+ #
+ #  Type    Name            Description
+ #  -----   -------------   ----------------------------------------------
+ #  string  checkpoint_file_path_string
+ #                          This parameter is the checkpoint file path (None 
+ #                          deletes no file).
+ #  dataframe
+ #          city_weather_dataframe
+ #                          This parameter is the finished weather dataframe.
+ #  string  output_file_path_string
+ #                          This parameter is the weather data file path (None 
+ #                          writes no file).
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def compact_checkpoint_file \
+        (checkpoint_file_path_string,
+         city_weather_dataframe,
+         output_file_path_string = None):
+
+    if output_file_path_string is not None:
+
+        storagex.write_weather_file(city_weather_dataframe, output_file_path_string)
+
+
+    if checkpoint_file_path_string is not None and os.path.exists(checkpoint_file_path_string):
+
+        os.remove(checkpoint_file_path_string)
+
+
+# In[18]:
+
+
+#*******************************************************************************************
+ #
+ #  Function Name:  return_city_weather_field_list_dictionary
+ #
+ #  Function Description:
+ #      This function requests the weather for a list of cities and returns a 
+ #      dictionary of city names and field lists, with None for cities the website 
+ #      did not find; cities that failed for other reasons are left out so a later 
+ #      run can retry them.  If the worker count is greater than one, a bounded 
+ #      thread pool fetches the cities concurrently and the function reports 
+ #      progress once per set of cities.  After each set of cities, the function 
+ #      appends the finished cities to the checkpoint file.
+ #
+ #
+ #  Return Type: dictionary
+ #
+ #
+ #  Function Parameters:
+ #
+ #  Type    Name            Description
+ #  -----   -------------   ----------------------------------------------
+ #  string list
+ #          city_names_string_list
+ #                          This parameter is a list of city names.
+ #  string  query_url_string
+ #                          This parameter is the query url without the city name.
+ #  integer worker_count_integer
+ #                          This parameter is the number of concurrent requests.
+ #  string  checkpoint_file_path_string
+ #                          This parameter is the checkpoint file path (None 
+ #                          disables checkpoints).
+ #  string  checkpoint_run_string
+ #                          This parameter is the run identity for the checkpoint.
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def return_city_weather_field_list_dictionary \
+        (city_names_string_list,
+         query_url_string,
+         worker_count_integer,
+         checkpoint_file_path_string = None,
+         checkpoint_run_string = None):
+
+    city_weather_field_list_dictionary = {}
+
+    checkpoint_field_list_dictionary = {}
+
+
+    if worker_count_integer <= 1:
+
+        record_count_integer = 0
+
+        set_of_cities_count_integer = 1
+
+
+        for index, city_name in enumerate(city_names_string_list):
+
+            if index % weather_constants.CONSTANT_SET_OF_CITIES == 0 \
+               and index >= weather_constants.CONSTANT_SET_OF_CITIES:
+
+                record_count_integer = 0
+
+                set_of_cities_count_integer += 1
+
+
+            logx.print_and_log_text \
+                (f'\nProcessing record #{record_count_integer + 1} ' \
+                 + f'of set {set_of_cities_count_integer} for city, {city_name}.')
+
+            record_count_integer += 1
+
+
+            city_weather_field_list, status_string \
+                = return_city_weather_field_list(city_name, query_url_string)
+
+            if status_string != requestsx.RESPONSE_STATUS_OK:
+
+                log_city_weather_status(city_name, status_string)
+
+            if status_string in [requestsx.RESPONSE_STATUS_OK, 
+                                 requestsx.RESPONSE_STATUS_NOT_FOUND]:
+
+                city_weather_field_list_dictionary[city_name] = city_weather_field_list
+
+                checkpoint_field_list_dictionary[city_name] = city_weather_field_list
+
+
+            if (index + 1) % weather_constants.CONSTANT_SET_OF_CITIES == 0 \
+               or index + 1 == len(city_names_string_list):
+
+                append_checkpoint_field_lists \
+                    (checkpoint_file_path_string, 
+                     checkpoint_run_string, 
+                     checkpoint_field_list_dictionary)
+
+                checkpoint_field_list_dictionary = {}
+
+    else:
+
+        set_count_integer \
+            = -(-len(city_names_string_list) // weather_constants.CONSTANT_SET_OF_CITIES)
+
+        found_count_integer = 0
+
+        skipped_city_status_tuple_list = []
+
+
+        with ThreadPoolExecutor(max_workers = worker_count_integer) as executor:
+
+            city_weather_field_list_iterator \
+                = executor.map \
+                    (return_city_weather_field_list, 
+                     city_names_string_list,
+                     [query_url_string] * len(city_names_string_list))
+
+
+            for index, (city_weather_field_list, status_string) \
+                    in enumerate(city_weather_field_list_iterator):
+
+                city_name = city_names_string_list[index]
+
+                if status_string == requestsx.RESPONSE_STATUS_OK:
+
+                    found_count_integer += 1
+
+                else:
+
+                    skipped_city_status_tuple_list.append((city_name, status_string))
+
+                if status_string in [requestsx.RESPONSE_STATUS_OK, 
+                                     requestsx.RESPONSE_STATUS_NOT_FOUND]:
+
+                    city_weather_field_list_dictionary[city_name] = city_weather_field_list
+
+                    checkpoint_field_list_dictionary[city_name] = city_weather_field_list
+
+
+                if (index + 1) % weather_constants.CONSTANT_SET_OF_CITIES == 0 \
+                   or index + 1 == len(city_names_string_list):
+
+                    set_of_cities_count_integer \
+                        = index // weather_constants.CONSTANT_SET_OF_CITIES + 1
+
+                    logx.print_and_log_text \
+                        (f'\nProcessed set {set_of_cities_count_integer} ' \
+                         + f'of {set_count_integer}: {found_count_integer} ' \
+                         + f'of {index + 1} records retrieved.')
+
+                    for skipped_city_name, skipped_status_string \
+                            in skipped_city_status_tuple_list:
+
+                        log_city_weather_status(skipped_city_name, skipped_status_string)
+
+                    skipped_city_status_tuple_list = []
+
+
+                    append_checkpoint_field_lists \
+                        (checkpoint_file_path_string, 
+                         checkpoint_run_string, 
+                         checkpoint_field_list_dictionary)
+
+                    checkpoint_field_list_dictionary = {}
+
+
+    return city_weather_field_list_dictionary
+
+
+# In[19]:
+
+
+#*******************************************************************************************
+ #
+ #  Function Name:  return_city_ids_dictionary
+ #
+ #  Function Description:
+ #      This function reads the open weathermap city list (city.list.json or 
+ #      city.list.json.gz from the bulk download site) and returns a dictionary of 
+ #      lowercase city names and city ids; for duplicate names, the first city in 
+ #      the file wins.  The file is not in the repository: download it from 
+ #      http://bulk.openweathermap.org/sample/city.list.json.gz into the resources 
+ #      folder.  If the file is missing, the function returns None, so callers 
+ #      request every city by name.
+ #
+ #
+ #  Return Type: dictionary
+ #
+ #
+ #  Function Parameters:
+ #
+ #  Type    Name            Description
+ #  -----   -------------   ----------------------------------------------
+ #  string  file_path_string
+ #                          This parameter is the city list file path.
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def return_city_ids_dictionary \
+        (file_path_string = weather_constants.CONSTANT_OPEN_WEATHERMAP_CITY_LIST_FILE_PATH):
+
+    if os.path.exists(file_path_string) == False:
+
+        logx.print_and_log_text \
+            (f'\nThe city list, {file_path_string}, is missing; ' \
+             + 'cities will be requested by name.')
+
+        return None
+
+
+    if file_path_string.endswith('.gz'):
+
+        with gzip.open(file_path_string, 'rt', encoding = 'utf-8') as city_list_file:
+
+            city_dictionary_list = json.load(city_list_file)
+
+    else:
+
+        with open(file_path_string, 'r', encoding = 'utf-8') as city_list_file:
+
+            city_dictionary_list = json.load(city_list_file)
+
+
+    city_ids_dictionary = {}
+
+    for city_dictionary in city_dictionary_list:
+
+        city_ids_dictionary.setdefault(city_dictionary['name'].lower(), city_dictionary['id'])
+
+
+    return city_ids_dictionary
+
+
+# In[20]:
+
+
+#*******************************************************************************************
+ #
+ #  Function Name:  return_group_weather_field_list_dictionary
+ #
+ #  Function Description:
+ #      This function requests the weather for a group of city ids in one call to 
+ #      the open weathermap group endpoint and returns a dictionary of city ids and 
+ #      field lists with the response status; the dictionary is empty if the 
+ #      request fails.
+ #
+ #
+ #  Return Type: tuple
+ #
+ #
+ #  Function Parameters:
+ #
+ #  Type    Name            Description
+ #  -----   -------------   ----------------------------------------------
+ #  integer list
+ #          city_id_integer_list
+ #                          This parameter is the list of city ids.
+ #  string  query_url_string
+ #                          This parameter is the group query url without the city ids.
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def return_group_weather_field_list_dictionary \
+        (city_id_integer_list,
+         query_url_string):
+
+    group_url_string \
+        = query_url_string + ','.join(str(city_id) for city_id in city_id_integer_list)
+
+    group_field_list_dictionary = {}
+
+
+    http_response, status_string \
+        = requestsx.return_http_response_and_status(group_url_string)
+
+    if status_string != requestsx.RESPONSE_STATUS_OK:
+
+        return group_field_list_dictionary, status_string
+
+
+    try:
+
+        city_weather_dictionary_list \
+            = requestsx.return_json_dictionary(http_response.content)['list']
+
+    except:
+
+        return group_field_list_dictionary, requestsx.RESPONSE_STATUS_CLIENT_ERROR
+
+
+    for city_weather_dictionary in city_weather_dictionary_list:
+
+        try:
+
+            group_field_list_dictionary[city_weather_dictionary['id']] \
+                = return_weather_field_list(city_weather_dictionary)
+
+        except:
+
+            continue
+
+
+    return group_field_list_dictionary, status_string
+
+
+# In[21]:
+
+
+#*******************************************************************************************
+ #
+ #  Function Name:  return_city_weather_field_list_dictionary_by_id
+ #
+ #  Function Description:
+ #      This function requests the weather for the cities that have city ids in 
+ #      groups through the open weathermap group endpoint and returns a dictionary 
+ #      of city names and field lists, with None for ids the website did not find; 
+ #      cities without ids or in failed groups are not included.
+ #
+ #
+ #  Return Type: dictionary
+ #
+ #
+ #  Function Parameters:
+ #
+ #  Type    Name            Description
+ #  -----   -------------   ----------------------------------------------
+ #  string list
+ #          city_names_string_list
+ #                          This parameter is a list of city names.
+ #  dictionary
+ #          city_ids_dictionary
+ #                          This parameter is the dictionary of city names and ids.
+ #  integer worker_count_integer
+ #                          This parameter is the number of concurrent requests.
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def return_city_weather_field_list_dictionary_by_id \
+        (city_names_string_list,
+         city_ids_dictionary,
+         worker_count_integer):
+
+    query_url_string \
+        = f'{weather_constants.CONSTANT_OPEN_WEATHERMAP_WEBSITE}/data/2.5/group?appid=' \
+          + f'{weather_api_key}&units={weather_constants.CONSTANT_API_DATA_UNITS}&id='
+
+
+    city_id_dictionary \
+        = {city_name: city_ids_dictionary[city_name.lower()] 
+           for city_name in city_names_string_list 
+           if city_name.lower() in city_ids_dictionary}
+
+    city_id_integer_list = list(dict.fromkeys(city_id_dictionary.values()))
+
+    group_size_integer = weather_constants.CONSTANT_OPEN_WEATHERMAP_GROUP_SIZE
+
+    city_id_integer_list_list \
+        = [city_id_integer_list[index:index + group_size_integer]
+           for index in range(0, len(city_id_integer_list), group_size_integer)]
+
+
+    group_field_list_dictionary = {}
+
+    found_count_integer = 0
+
+    with ThreadPoolExecutor(max_workers = max(worker_count_integer, 1)) as executor:
+
+        for index, (field_list_dictionary, status_string) \
+                in enumerate \
+                    (executor.map \
+                        (return_group_weather_field_list_dictionary, 
+                         city_id_integer_list_list,
+                         [query_url_string] * len(city_id_integer_list_list))):
+
+            if status_string == requestsx.RESPONSE_STATUS_OK:
+
+                for city_id in city_id_integer_list_list[index]:
+
+                    group_field_list_dictionary[city_id] = field_list_dictionary.get(city_id)
+
+                found_count_integer += len(field_list_dictionary)
+
+            else:
+
+                log_city_weather_status(f'group {index + 1}', status_string)
+
+
+            logx.print_and_log_text \
+                (f'\nProcessed group {index + 1} of {len(city_id_integer_list_list)}: ' \
+                 + f'{found_count_integer} records retrieved.')
+
+
+    return \
+        {city_name: group_field_list_dictionary[city_id] 
+         for city_name, city_id in city_id_dictionary.items()
+         if city_id in group_field_list_dictionary}
+
+
+# In[22]:
+
+
+#*******************************************************************************************
+ #
+ #  Function Name:  return_weather_column_buffer_dictionary
+ #
+ #  Function Description:
+ #      This function returns a dictionary of empty typed numpy buffers, one per 
+ #      weather column, with room for the requested number of records.
+ #
+ #
+ #  Return Type: dictionary
+ #
+ #
+ #  Function Parameters:
+ #
+ #  Type    Name            Description
+ #  -----   -------------   ----------------------------------------------
+ #  integer capacity_integer
+ #                          This parameter is the initial number of records.
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def return_weather_column_buffer_dictionary(capacity_integer):
+
+    capacity_integer = max(capacity_integer, 1)
+
+
+    return \
+        {'count': 0,
+         'country_codes': {},
+         'columns': 
+             {'city': np.empty(capacity_integer, dtype = object),
+              'latitude': np.empty(capacity_integer, dtype = np.float64),
+              'longitude': np.empty(capacity_integer, dtype = np.float64),
+              'temperature': np.empty(capacity_integer, dtype = np.float64),
+              'humidity': np.empty(capacity_integer, dtype = np.uint8),
+              'cloudiness': np.empty(capacity_integer, dtype = np.uint8),
+              'wind_speed': np.empty(capacity_integer, dtype = np.float64),
+              'country': np.empty(capacity_integer, dtype = np.int16),
+              'date_time': np.empty(capacity_integer, dtype = np.int64)}}
+
+
+# In[23]:
+
+
+#*******************************************************************************************
+ #
+ #  Function Name:  append_weather_column_buffers
+ #
+ #  Function Description:
+ #      This subroutine writes one city's field list into the next row of the 
+ #      weather column buffers, doubling the buffers when they are full; countries 
+ #      are stored as category codes and timestamps as seconds.
+ #
+ #
+ #  Return Type: n/a
+ #
+ #
+ #  Function Parameters:
+ #
+ #  Type    Name            Description
+ #  -----   -------------   ----------------------------------------------
+ #  dictionary
+ #          buffer_dictionary
+ #                          This parameter is the dictionary of column buffers.
+ #  string  city_name_string
+ #                          This parameter is the city name.
+ #  list    city_weather_field_list
+ #                          This parameter is the city's weather field list.
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def append_weather_column_buffers \
+        (buffer_dictionary,
+         city_name_string,
+         city_weather_field_list):
+
+    column_dictionary = buffer_dictionary['columns']
+
+    index = buffer_dictionary['count']
+
+
+    if index == len(column_dictionary['city']):
+
+        for column_name_string, column_array in column_dictionary.items():
+
+            grown_array = np.empty(2 * len(column_array), dtype = column_array.dtype)
+
+            grown_array[:index] = column_array
+
+            column_dictionary[column_name_string] = grown_array
+
+
+    country_code_integer \
+        = buffer_dictionary['country_codes'].setdefault \
+            (city_weather_field_list[6], len(buffer_dictionary['country_codes']))
+
+
+    column_dictionary['city'][index] = city_name_string
+
+    column_dictionary['latitude'][index] = city_weather_field_list[0]
+
+    column_dictionary['longitude'][index] = city_weather_field_list[1]
+
+    column_dictionary['temperature'][index] = city_weather_field_list[2]
+
+    column_dictionary['humidity'][index] = city_weather_field_list[3]
+
+    column_dictionary['cloudiness'][index] = city_weather_field_list[4]
+
+    column_dictionary['wind_speed'][index] = city_weather_field_list[5]
+
+    column_dictionary['country'][index] = country_code_integer
+
+    column_dictionary['date_time'][index] = city_weather_field_list[7]
+
+
+    buffer_dictionary['count'] = index + 1
+
+
+# In[24]:
+
+
+#*******************************************************************************************
+ #
+ #  Function Name:  return_weather_column_dataframe
+ #
+ #  Function Description:
+ #      This function builds the weather dataframe from the filled part of the 
+ #      column buffers in one construction step; the country codes become a 
+ #      categorical column, and the timestamps become local date 
+ #      times like datetime.fromtimestamp; the function looks up the local time 
+ #      zone offset once per distinct quarter hour, the granularity of time zone 
+ #      changes.
+ #
+ #
+ #  Return Type: dataframe
+ #
+ #
+ #  Function Parameters:
+ #
+ #  Type    Name            Description
+ #  -----   -------------   ----------------------------------------------
+ #  dictionary
+ #          buffer_dictionary
+ #                          This parameter is the dictionary of column buffers.
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  10/18/2026          Initial Development                         Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def return_weather_column_dataframe(buffer_dictionary):
+
+    record_count_integer = buffer_dictionary['count']
+
+    column_array_dictionary \
+        = {column_name_string: column_array[:record_count_integer] 
+           for column_name_string, column_array in buffer_dictionary['columns'].items()}
+
+
+    column_array_dictionary['country'] \
+        = pd.Categorical.from_codes \
+            (column_array_dictionary['country'], 
+             list(buffer_dictionary['country_codes']))
+
+    bucket_integer_array, inverse_integer_array \
+        = np.unique \
+            (column_array_dictionary['date_time'] // 900, return_inverse = True)
+
+    offset_integer_array \
+        = np.array \
+            ([time.localtime(int(bucket_integer) * 900).tm_gmtoff 
+              for bucket_integer in bucket_integer_array],
+             dtype = np.int64)
+
+    column_array_dictionary['date_time'] \
+        = (column_array_dictionary['date_time'] + offset_integer_array[inverse_integer_array]) \
+            .view('datetime64[s]')
+
+
+    return pd.DataFrame(column_array_dictionary)
+
+
+# In[25]:
+
+
+#*******************************************************************************************
+ #
+ #  Function Name:  return_weather_dataframe
+ #
+ #  Function Description:
+ #      This function returns weather information from the open weathermap website 
+ #      using the shared requestsx session and a list of cities.  Cities fetched 
+ #      within the cache time-to-live come from the local cache; only stale or 
+ #      missing cities go to the website.  If the caller passes city ids, the 
+ #      function requests those cities in groups and the rest, including cities 
+ #      in groups that failed, by name.  If the 
+ #      caller passes a checkpoint file path, finished cities go to that 
+ #      append-only file, so a restarted run for the same cities and units skips 
+ #      those finished within the checkpoint time-to-live.  Once every city is 
+ #      finished, the function writes the weather data to the output file, the 
+ #      weather data file by default, and deletes the checkpoint.
+ #
+ #
+ #  Return Type: dataframe
+ #
+ #
+ #  Function Parameters:
+ #
+ #  Type    Name            Description
+ #  -----   -------------   ----------------------------------------------
+ #  string list
+ #          city_names_string_list
+ #                          This parameter is a list of city names.
+ #  integer worker_count_integer
+ #                          This parameter is the number of concurrent requests.
+ #  integer cache_ttl_seconds_integer
+ #                          This parameter is the cache time-to-live in seconds 
+ #                          (0 disables the cache).
+ #  dictionary
+ #          city_ids_dictionary
+ #                          This parameter is the dictionary of lowercase city names 
+ #                          and open weathermap city ids (None requests each city 
+ #                          by name).
+ #  string  checkpoint_file_path_string
+ #                          This parameter is the checkpoint file path (None 
+ #                          disables checkpoints).
+ #  string  output_file_path_string
+ #                          This parameter is the weather data file path for the 
+ #                          finished run (None writes no file).
+ #  integer checkpoint_ttl_seconds_integer
+ #                          This parameter is the time-to-live in seconds of the 
+ #                          cities in the checkpoint file.
+ #
+ #
+ #  Date                Description                                 Programmer
+ #  ---------------     ------------------------------------        ------------------
+ #  08/26/2023          Initial Development                         Nicholas J. George
+ #  10/18/2026          Added concurrent fetch mode                 Nicholas J. George
+ #  10/18/2026          Added on-disk weather cache                 Nicholas J. George
+ #  10/18/2026          Added grouped fetch by city id              Nicholas J. George
+ #  10/18/2026          Skipped cities that failed to download      Nicholas J. George
+ #  10/18/2026          Added resumable checkpoints                 Nicholas J. George
+ #  10/18/2026          Built the dataframe from column buffers     Nicholas J. George
+ #  10/18/2026          Made checkpoints opt-in and run-specific    Nicholas J. George
+ #  10/18/2026          Added checkpoint time-to-live parameter     Nicholas J. George
+ #  10/18/2026          Retried cities in failed groups by name     Nicholas J. George
+ #
+ #******************************************************************************************/
+
+def return_weather_dataframe \
+        (city_names_string_list,
+         worker_count_integer = weather_constants.CONSTANT_WEATHER_WORKER_COUNT,
+         cache_ttl_seconds_integer = weather_constants.CONSTANT_WEATHER_CACHE_TTL_SECONDS,
+         city_ids_dictionary = None,
+         checkpoint_file_path_string = None,
+         output_file_path_string = weather_constants.CONSTANT_WEATHER_DATA_FILE_PATH,
+         checkpoint_ttl_seconds_integer = weather_constants.CONSTANT_WEATHER_CHECKPOINT_TTL_SECONDS):
+
+    query_url_string \
+        = f'{weather_constants.CONSTANT_OPEN_WEATHERMAP_WEBSITE}/data/2.5/weather?appid=' \
+          + f'{weather_api_key}&units={weather_constants.CONSTANT_API_DATA_UNITS}&q='
+
+
+    logx.print_and_log_text('\nCITY WEATHER DATA RETRIEVAL BEGINS...\n')
+
+
+    city_weather_field_list_dictionary = {}
+
+    if cache_ttl_seconds_integer > 0:
+
+        cache_key_string_list \
+            = [f'{weather_constants.CONSTANT_API_DATA_UNITS}|{city_name}' 
+               for city_name in city_names_string_list]
+
+        cached_values_dictionary \
+            = cachex.return_cached_values_dictionary \
+                (weather_constants.CONSTANT_WEATHER_CACHE_NAMESPACE,
+                 cache_key_string_list,
+                 cache_ttl_seconds_integer)
+
+        for city_name, cache_key_string \
+                in zip(city_names_string_list, cache_key_string_list):
+
+            if cache_key_string in cached_values_dictionary:
+
+                city_weather_field_list_dictionary[city_name] \
+                    = cached_values_dictionary[cache_key_string]
+
+        logx.print_and_log_text \
+            (f'\nFound {len(city_weather_field_list_dictionary)} ' \
+             + f'of {len(city_names_string_list)} cities in the local cache.')
+
+
+    checkpoint_run_string = return_checkpoint_run_string(city_names_string_list)
+
+    if checkpoint_file_path_string is not None:
+
+        checkpoint_field_list_dictionary \
+            = return_checkpoint_field_list_dictionary \
+                (checkpoint_file_path_string, 
+                 checkpoint_run_string, 
+                 checkpoint_ttl_seconds_integer)
+
+        resumed_count_integer = 0
+
+        for city_name in city_names_string_list:
+
+            if city_name not in city_weather_field_list_dictionary \
+               and city_name in checkpoint_field_list_dictionary:
+
+                city_weather_field_list_dictionary[city_name] \
+                    = checkpoint_field_list_dictionary[city_name]
+
+                resumed_count_integer += 1
+
+        logx.print_and_log_text \
+            (f'\nResumed {resumed_count_integer} ' \
+             + f'of {len(city_names_string_list)} cities from the checkpoint.')
+
+
+    missing_city_names_string_list \
+        = [city_name for city_name in city_names_string_list
+           if city_name not in city_weather_field_list_dictionary]
+
+    fetched_field_list_dictionary = {}
+
+    if city_ids_dictionary is not None:
+
+        fetched_field_list_dictionary \
+            = return_city_weather_field_list_dictionary_by_id \
+                (missing_city_names_string_list, city_ids_dictionary, worker_count_integer)
+
+        append_checkpoint_field_lists \
+            (checkpoint_file_path_string, checkpoint_run_string, fetched_field_list_dictionary)
+
+        missing_city_names_string_list \
+            = [city_name for city_name in missing_city_names_string_list
+               if city_name not in fetched_field_list_dictionary]
+
+        logx.print_and_log_text \
+            (f'\nRequesting {len(missing_city_names_string_list)} cities ' \
+             + 'without ids or in failed groups by name.')
+
+
+    fetched_field_list_dictionary.update \
+        (return_city_weather_field_list_dictionary \
+            (missing_city_names_string_list, 
+             query_url_string, 
+             worker_count_integer,
+             checkpoint_file_path_string,
+             checkpoint_run_string))
+
+    city_weather_field_list_dictionary.update(fetched_field_list_dictionary)
+
+
+    if cache_ttl_seconds_integer > 0:
+
+        cachex.store_cached_values \
+            (weather_constants.CONSTANT_WEATHER_CACHE_NAMESPACE,
+             {f'{weather_constants.CONSTANT_API_DATA_UNITS}|{city_name}': field_list
+              for city_name, field_list in fetched_field_list_dictionary.items()
+              if field_list is not None},
+             weather_constants.CONSTANT_WEATHER_CACHE_MAXIMUM_ENTRIES)
+
+
+    buffer_dictionary = return_weather_column_buffer_dictionary(len(city_names_string_list))
+
+    for city_name in city_names_string_list:
+
+        city_weather_field_list = city_weather_field_list_dictionary.get(city_name)
+
+        if city_weather_field_list is None:
+
+            continue
+
+
+        append_weather_column_buffers(buffer_dictionary, city_name, city_weather_field_list)
+
+
+    logx.print_and_log_text('\nCITY WEATHER DATA RETRIEVAL IS COMPLETE.') 
+
+    city_weather_dataframe = return_weather_column_dataframe(buffer_dictionary)
+
+    city_weather_dataframe.index.name \
+        = weather_constants.CONSTANT_WEATHER_DATA_FILE_INDEX_NAME
+
+
+    if checkpoint_file_path_string is not None or output_file_path_string is not None:
+
+        unfinished_count_integer \
+            = sum(city_name not in city_weather_field_list_dictionary 
+                  for city_name in city_names_string_list)
+
+        if unfinished_count_integer == 0:
+
+            compact_checkpoint_file \
+                (checkpoint_file_path_string, city_weather_dataframe, output_file_path_string)
+
+        else:
+
+            logx.print_and_log_text \
+                (f'\n{unfinished_count_integer} cities are unfinished; ' \
+                 + 'run the retrieval again to finish them.')
 
 
     return city_weather_dataframe